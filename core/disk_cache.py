@@ -0,0 +1,256 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Persistent cache of output data of heavy nodes. It's used when a tree has the
+`sv_disk_cache` option and only for nodes with the `is_disk_cacheable`
+attribute. Results are stored in a directory per node evaluation, the name of
+the directory is a hash of the node type, its properties and its input data.
+So after reopening a file the nodes read their results instead of computing
+them. Numpy arrays are stored in .npy files and are read as memory mapped
+arrays, other data is pickled. The least recently used results are removed
+when the size of the cache exceeds the limit set in the preferences.
+"""
+
+import os
+import pickle
+import shutil
+import threading
+from hashlib import blake2b
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+import sverchok
+from sverchok.core.socket_data import socket_data_cache, sv_set_socket
+from sverchok.utils.logging import debug
+from sverchok.utils.sv_itertools import run_steps
+
+# arrays smaller than this are pickled together with other data
+MIN_ARRAY_FILE_SIZE = 4096
+
+OUTPUTS_FILE = 'outputs.pkl'
+
+# keys of node ID properties which don't affect results of the node
+_SERVICE_KEYS = {'n_id', 'US_is_updated', 'US_error', 'US_time'}
+
+
+class _NotPersistent(Exception):
+    """Data can't be hashed or stored"""
+
+
+def is_cache_used(node) -> bool:
+    return getattr(node, 'is_disk_cacheable', False) \
+        and getattr(node.id_data, 'sv_disk_cache', False) \
+        and not node.is_scene_dependent and not node.is_animation_dependent \
+        and not any(s.has_output_options() for s in node.outputs)
+
+
+def process_node(node):
+    """Calls the process method of the node or reads the node output data
+    from the disk cache. The results of the process method are saved into
+    the cache"""
+    run_steps(process_node_steps(node))
+
+
+def process_node_steps(node):
+    """Generator version of the process_node function, it yields progress of
+    the node evaluation (see UpdateNodes.process_steps)"""
+    if not is_cache_used(node):
+        yield from node.process_steps()
+        return
+
+    directory = cache_directory()
+    if directory is None:
+        yield from node.process_steps()
+        return
+    try:
+        key = node_key(node)
+    except _NotPersistent:
+        yield from node.process_steps()
+        return
+
+    cache = DiskCache(directory)
+    if cache.load(node, key):
+        return
+    yield from node.process_steps()
+    cache.save(node, key)
+    cache.prune(cache_size_limit())
+
+
+def cache_directory() -> Optional[Path]:
+    """Directory of the cache from the preferences, None if it's not set"""
+    from sverchok.settings import get_param
+    directory = get_param('disk_cache_directory', '')
+    return Path(directory) if directory else None
+
+
+def cache_size_limit() -> int:
+    """Size limit of the cache in bytes"""
+    from sverchok.settings import get_param
+    return get_param('disk_cache_size', 2048) * 1024 ** 2
+
+
+def node_key(node) -> str:
+    """Hash of everything what defines the node output data, namely the node
+    type, its properties, draft mode of the tree, which outputs are linked and
+    input data. It raises _NotPersistent if some input data can't be hashed."""
+    hash_ = blake2b(digest_size=20)
+    hash_.update(f"{sverchok.VERSION}|{node.bl_idname}|{node.id_data.sv_draft}".encode())
+    for name in sorted(node.keys()):
+        if name in _SERVICE_KEYS:
+            continue
+        value = node[name]
+        if hasattr(value, 'to_dict'):
+            value = value.to_dict()
+        elif hasattr(value, 'to_list'):
+            value = value.to_list()
+        hash_.update(f"|{name}={value!r}".encode())
+    hash_.update(repr([s.is_linked for s in node.outputs]).encode())
+    for socket in node.inputs:
+        hash_.update(b"|input")
+        _update_hash(hash_, socket.sv_get(default=None, deepcopy=False))
+    return hash_.hexdigest()
+
+
+def _update_hash(hash_, data):
+    if isinstance(data, np.ndarray):
+        hash_.update(f"a{data.shape}{data.dtype.str}".encode())
+        if data.dtype.hasobject:
+            for item in data.flat:
+                _update_hash(hash_, item)
+        else:
+            hash_.update(np.ascontiguousarray(data).data)
+    elif isinstance(data, (list, tuple)):
+        hash_.update(f"l{len(data)}".encode())
+        # lists of numbers and vectors are hashed as arrays
+        if data and isinstance(data[0], (int, float, tuple)):
+            try:
+                array = np.array(data)
+            except ValueError:
+                array = None
+            if array is not None and array.dtype.kind in 'biuf':
+                _update_hash(hash_, array)
+                return
+        for item in data:
+            _update_hash(hash_, item)
+    elif isinstance(data, (int, float, str, bool, np.number)) or data is None:
+        hash_.update(f"v{data!r}".encode())
+    else:
+        try:
+            hash_.update(pickle.dumps(data))
+        except Exception as e:
+            raise _NotPersistent(e)
+
+
+class _Pickler(pickle.Pickler):
+    """Saves big numpy arrays in separate .npy files"""
+    def __init__(self, file, directory: Path):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._directory = directory
+        self._arrays_number = 0
+
+    def persistent_id(self, obj):
+        if isinstance(obj, np.ndarray) and not obj.dtype.hasobject and obj.nbytes >= MIN_ARRAY_FILE_SIZE:
+            name = f"{self._arrays_number}.npy"
+            self._arrays_number += 1
+            np.save(self._directory / name, obj, allow_pickle=False)
+            return name
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    """Reads arrays saved by _Pickler as memory mapped arrays, changing the
+    arrays does not change the files"""
+    def __init__(self, file, directory: Path):
+        super().__init__(file)
+        self._directory = directory
+
+    def persistent_load(self, pid):
+        return np.load(self._directory / pid, mmap_mode='c', allow_pickle=False)
+
+
+class DiskCache:
+    """Directory of the cache, each subdirectory keeps outputs of a node
+    evaluation, the subdirectory name is the key of the evaluation"""
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def load(self, node, key: str) -> bool:
+        """Sets output data of the node from the cache, returns False if the
+        cache does not have data for the key"""
+        path = self.directory / key
+        if not path.is_dir():
+            return False
+        try:
+            with open(path / OUTPUTS_FILE, 'rb') as file:
+                outputs: dict = _Unpickler(file, path).load()
+            os.utime(path)  # for pruning the least recently used results
+        except Exception as e:
+            debug("Can't read cached data of node %s: %s", node.name, e)
+            return False
+
+        for socket in node.outputs:
+            if socket.identifier in outputs:
+                data = outputs[socket.identifier]
+                sv_set_socket(socket, data)
+                if threading.current_thread() is threading.main_thread():
+                    socket.objects_number = len(data)
+        return True
+
+    def save(self, node, key: str):
+        """Saves output data of the node into the cache"""
+        outputs = dict()
+        for socket in node.outputs:
+            data = socket_data_cache.get(socket.socket_id)
+            if data is not None:
+                outputs[socket.identifier] = data
+
+        path = self.directory / key
+        temp_path = self.directory / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            temp_path.mkdir(parents=True)
+            with open(temp_path / OUTPUTS_FILE, 'wb') as file:
+                _Pickler(file, temp_path).dump(outputs)
+            temp_path.rename(path)
+        except Exception as e:
+            debug("Can't save data of node %s into the disk cache: %s", node.name, e)
+            shutil.rmtree(temp_path, ignore_errors=True)
+
+    def prune(self, max_size: int):
+        """Removes the least recently used results while the size of the cache
+        is bigger than the given one"""
+        entries = []
+        total_size = 0
+        try:
+            for entry in os.scandir(self.directory):
+                if not entry.is_dir() or entry.name.endswith('.tmp'):
+                    continue
+                size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                entries.append((entry.stat().st_mtime, size, entry.path))
+                total_size += size
+        except OSError as e:
+            debug("Can't read the disk cache: %s", e)
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= max_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)  # on Windows opened memory mapped files can't be removed
+            total_size -= size
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def size(self) -> int:
+        """Size of the cache in bytes"""
+        if not self.directory.is_dir():
+            return 0
+        return sum(f.stat().st_size for f in self.directory.rglob('*') if f.is_file())
+
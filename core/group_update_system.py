@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import TYPE_CHECKING, overload, Iterator, Callable
+from typing import TYPE_CHECKING, overload, Iterator, Callable, Optional
 
 from bpy.types import NodeTree, Node, NodeSocket
 import sverchok.core.update_system as us
@@ -24,6 +24,7 @@ def control_center(event):
 
     # property of some node of a group tree was changed
     if type(event) is ev.GroupPropertyEvent:
+        GroupUpdateTree.clear_results()
         gr_tree = GroupUpdateTree.get(event.tree)
         gr_tree.add_outdated(event.updated_nodes)
         gr_tree.update_path = event.update_path
@@ -36,6 +37,7 @@ def control_center(event):
 
     # topology of a group tree was changed
     elif type(event) is ev.GroupTreeEvent:
+        GroupUpdateTree.clear_results()
         gr_tree = GroupUpdateTree.get(event.tree)
         gr_tree.is_updated = False
         gr_tree.update_path = event.update_path
@@ -109,8 +111,50 @@ class GroupUpdateTree(us.UpdateTree):
         # if not presented all output nodes will be updated
         self._viewer_nodes: set[Node] = set()  # not presented in main trees yet
 
+        # results of the tree evaluation, the last one is the most recently used
+        self._results: list[tuple[list, list]] = []
+        self._is_scene_dependent: Optional[bool] = None
+
         self._copy_attrs.extend(['_exec_path', 'update_path', '_viewer_nodes'])
 
+    def can_use_results(self, node: 'GrNode') -> bool:
+        """Results of the tree can be reused if the tree is not opened via the
+        group node (it should update its UI) and if its nodes don't read
+        scene data, which can be changed without notifying the tree"""
+        if not self._tree.results_cache_size or self.update_path == [*self._exec_path, node]:
+            return False
+        if self._is_scene_dependent is None:
+            self._is_scene_dependent = any(_is_scene_dependent(n) for n in self._tree.nodes)
+        return not self._is_scene_dependent
+
+    def get_results(self, fingerprints: list) -> Optional[list]:
+        """Returns output data of the tree evaluated with input data which has
+        given fingerprints, or None if there is no such results"""
+        for i, (key, results) in enumerate(self._results):
+            try:
+                is_same = key == fingerprints
+            except (ValueError, TypeError):
+                is_same = False
+            if is_same:
+                self._results.append(self._results.pop(i))
+                return results
+        return None
+
+    def add_results(self, fingerprints: list, results: list):
+        """Remembers output data of the tree, the least recently used results
+        are removed if there are more of them than the cache size"""
+        self._results.append((fingerprints, results))
+        del self._results[:-self._tree.results_cache_size]
+
+    @classmethod
+    def clear_results(cls):
+        """Should be called whenever any group tree was changed because the
+        tree can be used inside other group trees"""
+        for tree in cls._tree_catch.values():
+            if isinstance(tree, GroupUpdateTree):
+                tree._results.clear()
+                tree._is_scene_dependent = None
+
     def _walk(self) -> tuple[Node, list[NodeSocket]]:
         """Yields nodes in order of their proper execution. It starts yielding
         from outdated nodes. It keeps the outdated_nodes storage in proper
@@ -140,6 +184,12 @@ class GroupUpdateTree(us.UpdateTree):
                 node[us.UPDATE_KEY] = False
 
 
+def _is_scene_dependent(node) -> bool:
+    if node.bl_idname == 'SvGroupTreeNode':
+        return node.node_tree is not None and any(_is_scene_dependent(n) for n in node.node_tree.nodes)
+    return getattr(node, 'is_scene_dependent', False) or getattr(node, 'is_animation_dependent', False)
+
+
 class TreesGraph:
     """It keeps relationships between main trees and group trees."""
     _group_main: dict['GrTree', set['SvTree']]
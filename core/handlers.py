@@ -7,7 +7,7 @@ import sverchok.core.events as ev
 import sverchok.core.tasks as ts
 import sverchok.utils.logging as log
 from sverchok.core.event_system import handle_event
-from sverchok.core.socket_data import clear_all_socket_cache
+from sverchok.core.socket_data import clear_all_socket_cache, set_input_data_mode
 from sverchok.ui import bgl_callback_nodeview, bgl_callback_3dview
 from sverchok.utils import app_handler_ops
 from sverchok.utils.handle_blender_data import BlTrees
@@ -196,6 +196,11 @@ def update_frame_change_mode():
     set_frame_change(mode)
 
 
+def update_input_data_mode():
+    from sverchok import settings
+    set_input_data_mode(settings.get_param("input_data_mode", "COPY"))
+
+
 @persistent
 def save_pre_handler(scene):
     log.clear_internal_buffer()
@@ -222,6 +227,7 @@ def register():
     data_structure.setup_init()
 
     update_frame_change_mode()
+    update_input_data_mode()
     bpy.app.handlers.load_post.append(call_user_functions_on_post_load_event)
 
 
@@ -12,12 +12,13 @@ from functools import reduce
 from typing import Tuple, List, Set, Dict, Iterator, Optional
 
 import bpy
-from bpy.props import BoolProperty, EnumProperty
+from bpy.props import BoolProperty, EnumProperty, IntProperty
 from sverchok.core.event_system import handle_event
 from sverchok.data_structure import extend_blender_class
 from mathutils import Vector
 
 from sverchok.core.sockets import socket_type_names
+from sverchok.core.socket_data import data_fingerprint
 import sverchok.core.events as ev
 import sverchok.core.group_update_system as gus
 from sverchok.core.update_system import ERROR_KEY
@@ -49,6 +50,12 @@ class SvGroupTree(SvNodeTreeCommon, bpy.types.NodeTree):
         return False  # only for inner usage
 
     sv_show: bpy.props.BoolProperty(name="Show", default=True, description='Show group tree')
+    results_cache_size: IntProperty(
+        name="Results cache",
+        default=8,
+        min=0,
+        description="Number of results of the group tree to remember. Group nodes with the same input data "
+                    "as one of the remembered results don't evaluate the tree, 0 - don't remember results")
     description: bpy.props.StringProperty(
         name="Tree description",
         default="Hover over question mark to read tooltip\n"
@@ -287,6 +294,8 @@ class BaseNode:
     def copy(self, original):
         self.n_id = ''
 
+    process_steps = SverchCustomTreeNode.process_steps
+
     sv_default_color = SverchCustomTreeNode.sv_default_color
 
     set_temp_color = SverchCustomTreeNode.set_temp_color
@@ -381,6 +390,11 @@ class SvGroupTreeNode(SverchCustomTreeNode, bpy.types.NodeCustomGroup):
         else:
             row_search.operator('node.add_group_tree', text='New', icon='ADD')
 
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        if self.node_tree:
+            layout.prop(self.node_tree, 'results_cache_size')
+
     def process(self):
         """
         This method is going to be called only by update system of main tree
@@ -408,12 +422,27 @@ class SvGroupTreeNode(SverchCustomTreeNode, bpy.types.NodeCustomGroup):
         if not input_node or not output_node:
             return
 
+        input_data = []
         for in_s, out_s in zip(self.inputs, input_node.outputs):
             if out_s.identifier == '__extend__':  # virtual socket
                 break
-            out_s.sv_set(in_s.sv_get(deepcopy=False))
+            input_data.append(in_s.sv_get(deepcopy=False))
 
         tree = gus.GroupUpdateTree.get(self.node_tree, refresh_tree=True)
+
+        # the same group tree with the same input data was already evaluated
+        use_cache = tree.can_use_results(self)
+        if use_cache:
+            fingerprints = [data_fingerprint(data) for data in input_data]
+            results = tree.get_results(fingerprints)
+            if results is not None:
+                for out_s, data in zip(self.outputs, results):
+                    out_s.sv_set(data)
+                return
+
+        for out_s, data in zip(input_node.outputs, input_data):
+            out_s.sv_set(data)
+
         tree.add_outdated([input_node])
         tree.update(self)
 
@@ -421,10 +450,14 @@ class SvGroupTreeNode(SverchCustomTreeNode, bpy.types.NodeCustomGroup):
             if err := node.get(ERROR_KEY):
                 raise Exception(err)
         else:
+            results = []
             for in_s, out_s in zip(output_node.inputs, self.outputs):
                 if in_s.identifier == '__extend__':  # virtual socket
                     break
-                out_s.sv_set(in_s.sv_get(deepcopy=False))
+                results.append(in_s.sv_get(deepcopy=False))
+                out_s.sv_set(results[-1])
+            if use_cache:
+                tree.add_results(fingerprints, results)
 
     def active_input(self) -> Optional[bpy.types.Node]:
         # https://developer.blender.org/T82350
@@ -25,6 +25,7 @@ from sverchok.utils.field.scalar import SvScalarField, SvConstantScalarField
 from sverchok.utils.curve import SvCurve
 from sverchok.utils.surface import SvSurface
 from sverchok.utils.solid_conversion import to_solid_recursive
+from sverchok.utils.matrices import MatrixArray
 
 from mathutils import Matrix, Quaternion
 import numpy as np
@@ -32,6 +33,8 @@ from numpy import ndarray
 
 
 def matrices_to_vfield(data):
+    if isinstance(data, MatrixArray):
+        data = data.to_list()
     if isinstance(data, Matrix):
         data = deepcopy(data)
         return SvMatrixVectorField(data)
@@ -80,6 +83,8 @@ def vectors_to_matrices(source_data):
 
 
 def matrices_to_vectors(source_data):
+    if isinstance(source_data, MatrixArray):
+        return [source_data.array[:, :3, 3].tolist()]
     locations = []
     collect_vector = locations.append
 
@@ -108,6 +113,9 @@ def quaternions_to_matrices(source_data):
 
 
 def matrices_to_quaternions(source_data):
+    if isinstance(source_data, MatrixArray):
+        _, quaternions, _ = source_data.decompose()
+        return [quaternions.tolist()]
     quaternions = []
     collect_quaternion = quaternions.append
 
@@ -18,13 +18,21 @@
 
 """For internal usage of the sockets module"""
 
+import sys
+import threading
 from collections import UserDict
+from contextlib import contextmanager
+from hashlib import blake2b
 from itertools import chain
 from traceback import format_list, extract_stack
-from typing import NewType, Optional, Literal
+from typing import NewType, Optional, Literal, Iterable
+
+import numpy as np
 
 from bpy.types import NodeSocket
 from sverchok.core.sv_custom_exceptions import SvNoDataError
+import sverchok.utils.meshes as me
+from sverchok.utils.matrices import MatrixArray
 from sverchok.utils.logging import debug
 from sverchok.utils.handle_blender_data import BlTrees
 
@@ -156,6 +164,142 @@ class DebugMemory(UserDict):
 socket_data_cache: dict[SockId, list] = dict()
 # socket_data_cache = DebugMemory(socket_data_cache)
 
+# fingerprints of data in the socket_data_cache, they are calculated lazily
+socket_fingerprints: dict[SockId, object] = dict()
+
+# nested lists deeper than this are compared by identity
+FINGERPRINT_DEPTH = 4
+
+# socket data of a thread which is isolated from other threads, see isolated_socket_data
+_thread_data = threading.local()
+
+# How data of linked input sockets is given to nodes which did not declare
+# whether they change their input data (see `mutates_inputs` node attribute)
+# COPY - nodes get deep copies of the data
+# SHARE - nodes get the data without copying
+# CHECK - like SHARE, but nodes which change their input data are reported
+input_data_mode: Literal['COPY', 'SHARE', 'CHECK'] = 'COPY'
+
+
+def set_input_data_mode(mode: Literal['COPY', 'SHARE', 'CHECK']):
+    global input_data_mode
+    input_data_mode = mode
+
+
+class _SameObject:
+    """Fingerprint of data which can be compared only by identity"""
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __eq__(self, other):
+        return isinstance(other, _SameObject) and self.data is other.data
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {type(self.data).__name__} {id(self.data)}>"
+
+
+def data_fingerprint(data, depth=FINGERPRINT_DEPTH):
+    """Returns cheap to compare representation of socket data. If two
+    fingerprints are equal the data is considered to be the same. Comparison of
+    fingerprints can raise an error, in this case data should be considered
+    changed.
+    - numpy arrays are represented by their shape, type and hash of content
+    - lists and tuples are traversed up to the given depth, deeper they are
+      compared by identity. Lists of not nested elements (numbers, vectors as
+      tuples, curves) are converted into tuples as is
+    - any other objects are compared by their own equality, which is
+      identity for most of Sverchok classes"""
+    if isinstance(data, np.ndarray):
+        if data.dtype.hasobject:
+            return _SameObject(data)
+        digest = blake2b(np.ascontiguousarray(data).data, digest_size=16).digest()
+        return data.shape, data.dtype.str, digest
+    elif isinstance(data, (list, tuple)):
+        if depth <= 0:
+            return _SameObject(data)
+        if data and isinstance(data[0], (list, np.ndarray)):
+            return tuple(data_fingerprint(d, depth - 1) for d in data)
+        return tuple(data)
+    else:
+        return data
+
+
+def data_size(data) -> int:
+    """Approximate size of socket data in bytes. Sizes of lists of numbers,
+    vectors and of lists of flat lists (like vertices or faces) are estimated
+    by their first element."""
+    if isinstance(data, np.ndarray):
+        return sys.getsizeof(data) + (0 if data.flags.owndata else data.nbytes)
+    elif isinstance(data, me.MeshListElements):
+        return sys.getsizeof(data) + data.nbytes
+    elif isinstance(data, (list, tuple)):
+        size = sys.getsizeof(data)
+        if not data:
+            return size
+        if isinstance(data[0], (list, tuple, np.ndarray)) and not _is_flat(data[0]):
+            return size + sum(data_size(d) for d in data)
+        return size + len(data) * data_size(data[0])
+    else:
+        return sys.getsizeof(data) + _arrays_size(data)
+
+
+def _is_flat(data) -> bool:
+    """True for lists which elements are not lists"""
+    if isinstance(data, np.ndarray):
+        return False
+    return not data or not isinstance(data[0], (list, tuple, np.ndarray))
+
+
+def _arrays_size(obj) -> int:
+    """Size of numpy arrays kept in attributes of an object, like control
+    points of NURBS curves and surfaces"""
+    attrs = getattr(obj, '__dict__', None)
+    if not attrs:
+        return 0
+    return sum(value.nbytes for value in attrs.values() if isinstance(value, np.ndarray))
+
+
+def sockets_data_size(sockets: Iterable[NodeSocket], sizes: dict = None) -> int:
+    """Approximate size of data of given sockets in bytes. Data shared between
+    sockets is counted once.
+    :sizes: computed sizes of data by their ids, it can be shared between
+    calls so the same data is not measured twice"""
+    if sizes is None:
+        sizes = dict()
+    size = 0
+    counted = set()
+    for socket in sockets:
+        # sockets without ID don't have data, and the ID can't be generated during drawing
+        sock_id = getattr(socket, 's_id', None)
+        data = socket_data_cache.get(sock_id) if sock_id else None
+        if data is None or id(data) in counted:
+            continue
+        counted.add(id(data))
+        if id(data) not in sizes:
+            sizes[id(data)] = data_size(data)
+        size += sizes[id(data)]
+    return size
+
+
+def node_data_size(node, sizes: dict = None) -> int:
+    """Approximate size of data of input and output sockets of the node in bytes"""
+    return sockets_data_size(chain(node.inputs, node.outputs), sizes)
+
+
+def tree_data_size(tree, sizes: dict = None) -> int:
+    """Approximate size of data of sockets of the tree in bytes"""
+    return sockets_data_size((s for n in tree.nodes for s in chain(n.inputs, n.outputs)), sizes)
+
+
+def format_data_size(size: int) -> str:
+    for unit in ['B', 'KB', 'MB']:
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
 
 def sv_deep_copy(lst):
     """return deep copied data of list/tuple structure"""
@@ -170,32 +314,163 @@ def sv_deep_copy(lst):
     return lst
 
 
+@contextmanager
+def isolated_socket_data():
+    """Inside the context socket data set by current thread is visible only for
+    this thread, other data is read from the common cache. It's used for
+    evaluating the same nodes in several threads. Yields the data of the thread"""
+    layer = dict()
+    _thread_data.layer = layer
+    try:
+        yield layer
+    finally:
+        _thread_data.layer = None
+
+
+def merge_socket_data(layer: dict):
+    """Puts socket data of a thread (see isolated_socket_data) into the common cache"""
+    for sock_id, data in layer.items():
+        if data is None:
+            socket_data_cache.pop(sock_id, None)
+        else:
+            socket_data_cache[sock_id] = data
+        socket_fingerprints.pop(sock_id, None)
+
+
+def _thread_layer() -> Optional[dict]:
+    return getattr(_thread_data, 'layer', None)
+
+
 def sv_forget_socket(socket):
     """deletes socket data from cache"""
+    layer = _thread_layer()
+    if layer is not None:
+        layer[socket.socket_id] = None
+        return
     try:
         del socket_data_cache[socket.socket_id]
     except KeyError:
         pass
+    socket_fingerprints.pop(socket.socket_id, None)
 
 
 def sv_set_socket(socket, data):
     """sets socket data for socket"""
+    layer = _thread_layer()
+    if layer is not None:
+        layer[socket.socket_id] = data
+        return
     socket_data_cache[socket.socket_id] = data
+    socket_fingerprints.pop(socket.socket_id, None)
+
+
+def sv_get_socket_data(sock_id: str):
+    """Data of the socket with given ID without copying and conversions or
+    None. Unlike sv_get_socket it does not read properties of the socket, so
+    it can be used in other threads with IDs read in the main thread"""
+    layer = _thread_layer()
+    if layer is not None and sock_id in layer:
+        return layer[sock_id]
+    return socket_data_cache.get(sock_id)
+
+
+def sv_set_socket_data(sock_id: str, data):
+    """Sets data of the socket with given ID, None data is forgotten. Unlike
+    sv_set_socket it does not read properties of the socket"""
+    layer = _thread_layer()
+    if layer is not None:
+        layer[sock_id] = data
+        return
+    if data is None:
+        socket_data_cache.pop(sock_id, None)
+    else:
+        socket_data_cache[sock_id] = data
+    socket_fingerprints.pop(sock_id, None)
+
+
+def sv_has_socket_data(socket) -> bool:
+    """Whether the socket has data in cache"""
+    layer = _thread_layer()
+    if layer is not None and socket.socket_id in layer:
+        return layer[socket.socket_id] is not None
+    return socket.socket_id in socket_data_cache
+
+
+def is_copy_needed(socket) -> bool:
+    """Whether the node of the socket should get a copy of its input data,
+    it depends on the `mutates_inputs` node attribute and the input data mode"""
+    mutates_inputs = getattr(socket.node, 'mutates_inputs', None)
+    if mutates_inputs is None:
+        return input_data_mode == 'COPY'
+    return mutates_inputs
 
 
 def sv_get_socket(socket, deepcopy=True):
     """gets socket data from socket,
-    if deep copy is True a deep copy is make_dep_dict,
+    if deep copy is True a deep copy is made if the node of the socket
+    needs it (see is_copy_needed),
     to increase performance if the node doesn't mutate input
-    set to False and increase performance substanstilly
+    set to False and increase performance substanstilly,
+    data of input sockets is converted for nodes which do not accept
+    it, mesh lists into nested lists for nodes without `accepts_mesh_lists`
+    attribute, matrix arrays into lists of matrices for nodes without
+    `accepts_matrix_arrays` attribute
     """
-    data = socket_data_cache.get(socket.socket_id)
+    layer = _thread_layer()
+    if layer is not None and socket.socket_id in layer:
+        data = layer[socket.socket_id]
+    else:
+        data = socket_data_cache.get(socket.socket_id)
     if data is not None:
-        return sv_deep_copy(data) if deepcopy else data
+        if not getattr(socket, 'is_output', False):
+            data = _adapt_to_node(data, socket.node)
+        return sv_deep_copy(data) if deepcopy and is_copy_needed(socket) else data
     else:
         raise SvNoDataError(socket)
 
 
+def _adapt_to_node(data, node):
+    """Converts array-backed data into the format which the node accepts"""
+    if isinstance(data, me.MeshListElements) and not getattr(node, 'accepts_mesh_lists', False):
+        return data.to_list()
+    if isinstance(data, MatrixArray) and not getattr(node, 'accepts_matrix_arrays', False):
+        return data.to_list()
+    return data
+
+
+def sv_socket_fingerprint(socket):
+    """returns fingerprint of socket data, see data_fingerprint,
+    it's calculated only once after the data was set,
+    None if the socket does not have data or its data is isolated"""
+    if _thread_layer() is not None:
+        return None
+    sock_id = socket.socket_id
+    if sock_id in socket_fingerprints:
+        return socket_fingerprints[sock_id]
+    data = socket_data_cache.get(sock_id)
+    if data is None:
+        return None
+    fingerprint = data_fingerprint(data)
+    socket_fingerprints[sock_id] = fingerprint
+    return fingerprint
+
+
+def sv_is_data_changed(socket) -> bool:
+    """Compares socket data with its fingerprint calculated before. It returns
+    False if the fingerprint was not calculated or if it's impossible to
+    compare"""
+    if _thread_layer() is not None:
+        return False
+    sock_id = socket.socket_id
+    if sock_id not in socket_fingerprints:
+        return False
+    data = socket_data_cache.get(sock_id)
+    try:
+        return not (data_fingerprint(data) == socket_fingerprints[sock_id])
+    except (ValueError, TypeError):
+        return False
+
+
 def get_output_socket_data(node, output_socket_name):
     """
     This method is intended to usage in internal tests mainly.
@@ -215,3 +490,4 @@ def clear_all_socket_cache():
     Reset socket cache for all node-trees.
     """
     socket_data_cache.clear()
+    socket_fingerprints.clear()
@@ -18,6 +18,7 @@
 # ##### END GPL LICENSE BLOCK #####
 import inspect
 import sys
+import threading
 from typing import Set
 
 from mathutils import Matrix, Quaternion
@@ -28,6 +29,8 @@ from bpy.types import NodeTree, NodeSocket
 from sverchok.core.socket_conversions import ConversionPolicies
 from sverchok.core.socket_data import sv_get_socket, sv_set_socket, sv_forget_socket
 from sverchok.core.sv_custom_exceptions import SvNoDataError
+import sverchok.utils.meshes as me
+from sverchok.utils.matrices import MatrixArray
 
 from sverchok.data_structure import (
     enum_item_4,
@@ -286,6 +289,12 @@ class SvSocketProcessing():
             result = wrap_data(result)
         return result
 
+    def has_output_options(self):
+        """Whether the output socket changes data of its node"""
+        options = ['use_flatten_topology', 'use_flatten', 'use_simplify', 'use_graft', 'use_graft_2',
+                   'use_unwrap', 'use_wrap', 'reparametrize']
+        return any(getattr(self, option, False) for option in options)
+
     def has_simplify_modes(self, context):
         return self.can_flatten() or self.can_simplify()
 
@@ -374,7 +383,9 @@ class SvSocketCommon(SvSocketProcessing):
 
     @property
     def socket_id(self):
-        """Id of socket used by data_cache"""
+        """Id of socket used by data_cache. It's saved into the socket when
+        it's read first time, so it should be read in the main thread first
+        (see update_system.init_socket_ids)"""
         _id = self.s_id
         if not _id:
             self.s_id = str(hash(self.node.node_id + self.identifier + ('o' if self.is_output else 'i')))
@@ -442,13 +453,26 @@ class SvSocketCommon(SvSocketProcessing):
     def sv_set(self, data):
         """Set data, provide context in case the node can be evaluated several times in different context"""
         if self.is_output:
+            if isinstance(data, (me.MeshListElements, MatrixArray)) and self.has_output_options():
+                data = data.to_list()
             data = self.postprocess_output(data)
 
         # it's expensive to call sv_get method to update the number in other places
-        self.objects_number = len(data)
+        # Blender data should not be changed from other threads, the update
+        # system calls update_objects_number for nodes executed in threads
+        if threading.current_thread() is threading.main_thread():
+            self.objects_number = len(data)
 
         sv_set_socket(self, data)
 
+    def update_objects_number(self):
+        """Update the number of objects shown in the socket label from the
+        socket data"""
+        try:
+            self.objects_number = len(sv_get_socket(self, False))
+        except SvNoDataError:
+            pass
+
     def sv_forget(self):
         """Delete socket memory"""
         sv_forget_socket(self)
@@ -62,6 +62,8 @@ class Tasks:
             duration += self.current.run(max_duration-duration)
             if self.current.last_node:
                 msg = f'Pres "ESC" to abort, updating node "{self.current.last_node.name}"'
+                if self.current.progress is not None:
+                    msg += f' {self.current.progress:.0%}'
                 self._report_progress(msg)
             if self.current.is_exhausted:
                 self._next()
@@ -178,11 +180,14 @@ class Task:
         :_updater: generator which should update given tree
         :is_exhausted: the status of the generator - read only
         :last_node: last node which going to be processed by the generator
-        - read only"""
+        - read only
+        :progress: progress of the last node execution if the node reports it
+        (see UpdateNodes.process_steps) - read only"""
         self.tree: SvTree = tree
         self.is_scene_update: bool = is_scene_update
         self.is_exhausted = False
         self.last_node = None
+        self.progress: Optional[float] = None
 
         self._updater: Generator = updater
         self.__hash__ = cache(self.__hash__)
@@ -195,7 +200,11 @@ class Task:
         try:
             start_time = time()
             while duration < max_duration:
-                self.last_node = next(self._updater)
+                step = next(self._updater)
+                if isinstance(step, tuple):
+                    self.last_node, self.progress = step
+                else:
+                    self.last_node, self.progress = step, None
                 duration = time() - start_time
             return duration
 
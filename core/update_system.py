@@ -1,4 +1,5 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from copy import copy
 from functools import lru_cache
 from graphlib import TopologicalSorter
@@ -11,17 +12,24 @@ import sverchok.core.events as ev
 import sverchok.core.tasks as ts
 from sverchok.core.sv_custom_exceptions import CancelError, SvNoDataError
 from sverchok.core.socket_conversions import conversions
+import sverchok.core.socket_data as sd
+import sverchok.utils.meshes as me
+from sverchok.core.disk_cache import process_node, process_node_steps
+from sverchok.core.socket_data import sv_socket_fingerprint, sv_is_data_changed, sv_has_socket_data
 from sverchok.utils.profile import profile
-from sverchok.utils.logging import log_error
+from sverchok.utils.logging import log_error, warning
 from sverchok.utils.tree_walk import bfs_walk
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from sverchok.node_tree import (SverchCustomTreeNode as SvNode,
                                     SverchCustomTree as SvTree)
 
 UPDATE_KEY = "US_is_updated"
 ERROR_KEY = "US_error"
 TIME_KEY = "US_time"
+# how long to wait for nodes executed in threads before returning control
+THREAD_POLL_TIME = 0.01
 
 
 def control_center(event):
@@ -448,21 +456,46 @@ class UpdateTree(SearchTree):
         """This generator is for the triggers. It can update outdated nodes and
         update UI. Should be used only with main trees, the group trees should
         use different method to separate profiling statistics. When it's called
-        the tree should have information of what is outdated"""
+        the tree should have information of what is outdated. It yields nodes
+        before their execution and (node, progress) tuples during execution of
+        nodes which report their progress (see UpdateNodes.process_steps)"""
 
         # print(f"UPDATE NODES {event.type=}, {event.tree.name=}")
         up_tree = cls.get(tree, refresh_tree=True)
-        if update_nodes:
+        free_memory = update_nodes and up_tree._tree.sv_free_memory
+        fuse_math = update_nodes and up_tree._tree.sv_fuse_math
+        if fuse_math and not up_tree._tree.sv_parallel:
+            up_tree._fused_chains = up_tree._find_fused_chains()
+        # nodes of fused chains don't keep their output data
+        if free_memory or fuse_math:
+            up_tree._add_forgotten_sources()
+        if update_nodes and up_tree._tree.sv_parallel:
+            try:
+                yield from up_tree._parallel_walk()
+            except CancelError:
+                pass
+        elif update_nodes:
             walker = up_tree._walk()
             # walker = up_tree._debug_color(walker)
             try:
                 for node, prev_socks in walker:
                     with AddStatistic(node):
                         yield node
-                        prepare_input_data(prev_socks, node.inputs)
-                        node.process()
+                        chain = up_tree._fused_chains.get(node)
+                        if chain is None:
+                            prepare_input_data(prev_socks, node.inputs)
+                            for progress in process_node_steps(node):
+                                yield node, progress
+                        elif node == chain[-1]:
+                            up_tree._process_fused_chain(chain)
+                        # other nodes of the chain are evaluated by its last node
             except CancelError:
                 pass
+            finally:
+                up_tree._fused_chains = dict()
+
+        if free_memory:
+            up_tree._forget_linked_data()
 
         if update_interface:
             if up_tree._tree.show_time_mode == "Cumulative":
@@ -479,6 +512,14 @@ class UpdateTree(SearchTree):
         else:
             cls._tree_catch.clear()
 
+    def restore_data(self, nodes: Iterable['SvNode']):
+        """Evaluates previous nodes of the given ones if their data was
+        forgotten (see sv_free_memory tree property). It should be called
+        before evaluating given nodes separately from the tree update."""
+        sources = self._forgotten_sources(set(nodes))
+        for node in self.sort_nodes(sources):
+            self.update_node(node)
+
     def copy(self, new_tree: NodeTree) -> 'UpdateTree':
         """They copy will be with new topology if original tree was changed
         since instancing of the first tree. Other attributes copied as is.
@@ -513,6 +554,10 @@ class UpdateTree(SearchTree):
         self.is_animation_updated = True
         self.is_scene_updated = True
         self._outdated_nodes: Optional[set[SvNode]] = None  # None means outdated all
+        # fingerprints of input data of nodes during their last execution
+        self._input_fingerprints: dict[SvNode, list] = dict()
+        # nodes of fused chains mapped to their chains, only during the update
+        self._fused_chains: dict[SvNode, list[SvNode]] = dict()
 
         # https://stackoverflow.com/a/68550238
         self._sort_nodes = lru_cache(maxsize=1)(self.__sort_nodes)
@@ -522,8 +567,108 @@ class UpdateTree(SearchTree):
             'is_animation_updated',
             'is_scene_updated',
             '_outdated_nodes',
+            '_input_fingerprints',
         ]
 
+    def _forgotten_sources(self, nodes: set['SvNode']) -> set['SvNode']:
+        """Returns nodes which data was forgotten but is needed by the given
+        nodes. Previous nodes of the returned ones are searched as well."""
+        sources = set()
+        next_nodes = nodes
+        while next_nodes:
+            next_nodes = {self._sock_node[s] for n in next_nodes for s in self._data_sources(n)
+                          if s is not None and not sv_has_socket_data(s)}
+            next_nodes -= nodes | sources
+            sources |= next_nodes
+        return sources
+
+    def _add_forgotten_sources(self):
+        """Marks as outdated nodes which data was forgotten but is needed to
+        update outdated nodes and their next nodes"""
+        if self._outdated_nodes is None:
+            return
+        while sources := self._forgotten_sources(self.nodes_from(self._outdated_nodes)):
+            self._outdated_nodes.update(sources)
+
+    def _forget_linked_data(self):
+        """Removes data passed between nodes. Data of nodes without outputs
+        (viewers) is kept because they can read it later, e.g. for baking.
+        Data of not linked output sockets is kept because it can be read by
+        other parts of Sverchok."""
+        for from_sock, to_socks in self._to_socks.items():
+            is_needed = False
+            for to_sock in to_socks:
+                if self._sock_node[to_sock].outputs:
+                    to_sock.sv_forget()
+                else:
+                    is_needed = True
+            if not is_needed:
+                from_sock.sv_forget()
+
+    def _find_fused_chains(self) -> dict['SvNode', list['SvNode']]:
+        """Finds linear chains of math nodes which can be evaluated at once
+        (see the can_be_fused method of Scalar Math and Vector Math nodes).
+        Output of each node of a chain except the last one should be connected
+        only to the next node of the chain. Returns the nodes of the chains
+        mapped to their chains."""
+        def can_be_fused(node_):
+            return hasattr(node_, 'can_be_fused') and node_.can_be_fused()
+
+        next_nodes = dict()
+        prev_number = defaultdict(int)
+        for node in self._from_nodes:
+            if not can_be_fused(node):
+                continue
+            to_socks = self._to_socks.get(node.outputs[0], set())
+            if len(to_socks) != 1 or any(self._to_socks.get(s) for s in node.outputs[1:]):
+                continue
+            to_sock, = to_socks
+            next_node = self._sock_node[to_sock]
+            if to_sock.bl_idname == node.outputs[0].bl_idname and can_be_fused(next_node):
+                next_nodes[node] = next_node
+                prev_number[next_node] += 1
+
+        # a node with several fused previous nodes would make a tree of nodes
+        next_nodes = {n: next_n for n, next_n in next_nodes.items() if prev_number[next_n] == 1}
+        chains = dict()
+        for node in next_nodes.keys() - set(next_nodes.values()):
+            chain = [node]
+            while node in next_nodes:
+                node = next_nodes[node]
+                chain.append(node)
+            for chain_node in chain:
+                chains[chain_node] = chain
+        return chains
+
+    def _process_fused_chain(self, chain: list['SvNode']):
+        """Evaluates the fused chain of nodes. If it fails the nodes are
+        evaluated one by one to show the error on the node which has raised it"""
+        try:
+            process_fused_chain(chain, [self.previous_sockets(n) for n in chain])
+        except CancelError:
+            raise
+        except Exception:
+            for node in chain[:-1]:
+                with AddStatistic(node):
+                    prepare_input_data(self.previous_sockets(node), node.inputs)
+                    process_node(node)
+                if node.get(ERROR_KEY, False):
+                    raise SvNoDataError(node.outputs[0])
+            prepare_input_data(self.previous_sockets(chain[-1]), chain[-1].inputs)
+            process_node(chain[-1])
+
+    def _data_sources(self, node: 'SvNode') -> list[Optional[NodeSocket]]:
+        """Returns output sockets which data is read during evaluation of the
+        node. The last node of a fused chain reads data of previous sockets of
+        all nodes of the chain, other nodes of the chain read nothing."""
+        chain = self._fused_chains.get(node)
+        if chain is None:
+            return self.previous_sockets(node)
+        if node != chain[-1]:
+            return []
+        chain_socks = {n.outputs[0] for n in chain[:-1]}
+        return [s for n in chain for s in self.previous_sockets(n) if s not in chain_socks]
+
     def _animation_nodes(self) -> set['SvNode']:
         """Returns nodes which are animation dependent"""
         an_nodes = set()
@@ -550,7 +695,9 @@ class UpdateTree(SearchTree):
         state. It checks after yielding the error status of the node. If the
         node has error it goes into outdated_nodes. It uses cached walker, so
         it works more efficient when outdated nodes are the same between the
-        method calls."""
+        method calls. If the tree has the skip unchanged option it does not
+        yield next nodes of outdated ones if their input data is the same as
+        during their previous execution."""
 
         # walk all nodes in the tree
         if self._outdated_nodes is None:
@@ -561,15 +708,133 @@ class UpdateTree(SearchTree):
             outdated = frozenset(self._outdated_nodes)
             self._outdated_nodes.clear()
 
+        skip_unchanged = self._tree.sv_skip_unchanged
+        if not skip_unchanged:
+            # they can't be trusted if the option will be switched on later
+            self._input_fingerprints.clear()
+
         for node, other_socks in self._sort_nodes(outdated):
             # execute node only if all previous nodes are updated
             if all(n.get(UPDATE_KEY, True) for sock in other_socks if (n := self._sock_node.get(sock))):
+                if skip_unchanged and self._is_input_unchanged(node, other_socks, outdated):
+                    continue
                 yield node, other_socks
                 if node.get(ERROR_KEY, False):
                     self._outdated_nodes.add(node)
             else:
                 node[UPDATE_KEY] = False
 
+    def _parallel_walk(self) -> Generator['SvNode', None, None]:
+        """Updates nodes in the same order and with the same rules as the
+        _walk method does but nodes which are marked as thread safe are
+        executed in a thread pool. So independent branches of the tree with such
+        nodes are executed simultaneously. Other nodes are executed in the main
+        thread. Reading and writing node statuses, input data preparation and
+        initialization of socket ids is always done in the main thread. It
+        yields nodes before their execution in the main thread when no other
+        threads are running. While threads are running it checks periodically
+        whether they are finished and yields one of the nodes being executed
+        between the checks, so the UI is not frozen. Progress is reported only
+        by nodes executed in the main thread."""
+        if self._outdated_nodes is None:
+            outdated = None
+            self._outdated_nodes = set()
+        else:
+            outdated = frozenset(self._outdated_nodes)
+            self._outdated_nodes.clear()
+
+        skip_unchanged = self._tree.sv_skip_unchanged
+        if not skip_unchanged:
+            self._input_fingerprints.clear()
+
+        prev_socks = dict(self._sort_nodes(outdated))
+        sorter = TopologicalSorter({n: self._from_nodes[n] & prev_socks.keys() for n in prev_socks})
+        sorter.prepare()
+
+        def done(node_):
+            if node_.get(ERROR_KEY, False):
+                self._outdated_nodes.add(node_)
+            sorter.done(node_)
+
+        main_thread_nodes = []
+        running: dict['Future', 'SvNode'] = dict()
+        pool = ThreadPoolExecutor(thread_name_prefix='sverchok')
+        try:
+            while sorter.is_active():
+                for node in sorter.get_ready():
+                    other_socks = prev_socks[node]
+                    if not all(n.get(UPDATE_KEY, True) for sock in other_socks if (n := self._sock_node.get(sock))):
+                        node[UPDATE_KEY] = False
+                        sorter.done(node)
+                    elif skip_unchanged and self._is_input_unchanged(node, other_socks, outdated):
+                        sorter.done(node)
+                    elif getattr(node, 'is_thread_safe', False):
+                        with AddStatistic(node):
+                            prepare_input_data(other_socks, node.inputs)
+                            init_socket_ids(node)
+                        if node.get(ERROR_KEY, False):
+                            done(node)
+                        else:
+                            running[pool.submit(timed_process, node)] = node
+                    else:
+                        main_thread_nodes.append(node)
+
+                if main_thread_nodes:
+                    node = main_thread_nodes.pop(0)
+                    with AddStatistic(node):
+                        if not running:
+                            yield node
+                        prepare_input_data(prev_socks[node], node.inputs)
+                        for progress in process_node_steps(node):
+                            if not running:
+                                yield node, progress
+                    done(node)
+
+                elif running:
+                    finished, _ = wait(running, timeout=THREAD_POLL_TIME, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        node = running.pop(future)
+                        duration = None
+                        with AddStatistic(node):
+                            duration = future.result()
+                        if duration is not None:
+                            node[TIME_KEY] = duration
+                        for sock in node.outputs:
+                            sock.update_objects_number()
+                        done(node)
+                    if running:  # let Blender to redraw UI while nodes are executed
+                        yield next(iter(running.values()))
+                    else:
+                        yield node  # let the task to control its execution time
+        finally:
+            # canceled nodes should be executed next time
+            self._outdated_nodes.update(running.values())
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _is_input_unchanged(self, node: 'SvNode',
+                            prev_socks: list[Optional[NodeSocket]],
+                            outdated: Optional[frozenset['SvNode']]) -> bool:
+        """Records fingerprints of data of the output sockets connected to the
+        node and compares them with the fingerprints recorded before its
+        previous execution. Nodes which were outdated explicitly are always
+        considered changed as well as nodes which previous execution failed.
+        Previous nodes should be already updated."""
+        chain = self._fused_chains.get(node, [node])
+        if node in self._fused_chains:
+            prev_socks = self._data_sources(node)
+        fingerprints = [None if s is None else sv_socket_fingerprint(s) for s in prev_socks]
+        prev_fingerprints = self._input_fingerprints.get(node)
+        self._input_fingerprints[node] = fingerprints
+
+        if outdated is None or any(n in outdated for n in chain) or prev_fingerprints is None:
+            return False
+        if not node.get(UPDATE_KEY, False) or node.get(ERROR_KEY, None):
+            return False
+        try:
+            return prev_fingerprints == fingerprints
+        except (ValueError, TypeError):  # e.g. arrays inside tuples
+            return False
+
     def __sort_nodes(self,
                      from_nodes: frozenset['SvNode'] = None,
                      to_nodes: frozenset['SvNode'] = None)\
@@ -690,6 +955,8 @@ class AddStatistic:
             self._node[UPDATE_KEY] = True
             self._node[ERROR_KEY] = None
             self._node[TIME_KEY] = perf_counter() - self._start
+            if sd.input_data_mode == 'CHECK':
+                report_input_mutation(self._node)
         else:
             log_error(exc_val)
             self._node[UPDATE_KEY] = False
@@ -701,6 +968,38 @@ class AddStatistic:
             return issubclass(exc_type, Exception)
 
 
+def timed_process(node: 'SvNode') -> float:
+    """Calls process method of the node and returns its execution time"""
+    start = perf_counter()
+    process_node(node)
+    return perf_counter() - start
+
+
+def process_fused_chain(chain: list['SvNode'], prev_socks: list[list[Optional[NodeSocket]]]):
+    """Evaluates the chain of math nodes found by UpdateTree._find_fused_chains.
+    Data is passed between nodes of the chain as numpy arrays without putting
+    it into their output sockets, only the last node gets its output data.
+    :prev_socks: previous sockets of each node of the chain"""
+    if not chain[-1].outputs[0].is_linked:
+        return
+    data = None
+    for i, (node, socks) in enumerate(zip(chain, prev_socks)):
+        if i == 0:
+            prepare_input_data(socks, node.inputs)
+        else:
+            from_sock = chain[i - 1].outputs[0]
+            prepare_input_data([None if s == from_sock else s for s in socks], node.inputs)
+            for sock, in_sock in zip(socks, node.inputs):
+                if sock == from_sock:
+                    in_sock.sv_set(data)
+            # the data was set before the nodes were fused
+            from_sock.sv_forget()
+            from_sock.objects_number = 0
+        is_last = i == len(chain) - 1
+        data = node.calculate(node.output_numpy if is_last else True)
+    chain[-1].outputs[0].sv_set(data)
+
+
 def prepare_input_data(prev_socks: list[Optional[NodeSocket]],
                        input_socks: list[NodeSocket]):
     """Reads data from given outputs socket make it conversion if necessary and
@@ -717,10 +1016,35 @@ def prepare_input_data(prev_socks: list[Optional[NodeSocket]],
         else:
             # cast data
             if ps.bl_idname != ns.bl_idname:
+                # implicit conversions expect data in the nested lists format
+                if isinstance(data, me.MeshListElements):
+                    data = data.to_list()
                 implicit_conversion = conversions[ns.default_conversion_name]
                 data = implicit_conversion.convert(ns, ps, data)
 
             ns.sv_set(data)
+            if sd.input_data_mode == 'CHECK':
+                sv_socket_fingerprint(ns)  # to check it after node execution
+
+
+def init_socket_ids(node: 'SvNode'):
+    """Socket ids are saved into sockets when they are read first time. It
+    should be called in the main thread before the node is executed in
+    another one because Blender data should not be changed there"""
+    for sock in chain(node.inputs, node.outputs):
+        _ = sock.socket_id
+
+
+def report_input_mutation(node: 'SvNode'):
+    """Warns about the node if it has changed data of its input sockets
+    without declaring it via the `mutates_inputs` attribute. The fingerprints
+    of input data should be recorded before execution of the node."""
+    if getattr(node, 'mutates_inputs', None):
+        return
+    for sock in node.inputs:
+        if sv_is_data_changed(sock):
+            warning(f"Node '{node.name}' has changed data of its '{sock.name}'"
+                    f" input socket. Its class should have `mutates_inputs = True`")
 
 
 def update_ui(tree: NodeTree, times: Iterable[float] = None):
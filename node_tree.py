@@ -17,6 +17,7 @@ from bpy.types import NodeTree, NodeSocket
 from sverchok.core.sv_custom_exceptions import SvNoDataError
 import sverchok.core.events as ev
 from sverchok.core.event_system import handle_event
+from sverchok.core.socket_data import node_data_size, format_data_size
 from sverchok.data_structure import classproperty, post_load_call
 from sverchok.utils import get_node_class_reference
 from sverchok.utils.sv_node_utils import recursive_framed_location_finder
@@ -154,6 +155,41 @@ class SverchCustomTree(NodeTree, SvNodeTreeCommon):
     )
     sv_scene_update: BoolProperty(name="Scene update", description="Update upon changes in the scene", options=set(),
                                   default=True)
+    sv_parallel: BoolProperty(
+        name="Parallel",
+        description="Execute thread safe nodes of independent branches of the tree simultaneously",
+        default=False,
+        options=set(),
+    )
+    sv_skip_unchanged: BoolProperty(
+        name="Skip unchanged",
+        description="Don't update nodes if data of their inputs is the same as during previous update. "
+                    "Comparing data takes some time, it's useful when most of changes affect only a few nodes",
+        default=False,
+        options=set(),
+    )
+    sv_disk_cache: BoolProperty(
+        name="Disk cache",
+        description="Save results of heavy nodes on disk and read them when the nodes get the same input data "
+                    "again, also after reopening the file. The cache directory is set in the preferences",
+        default=False,
+        options=set(),
+    )
+    sv_free_memory: BoolProperty(
+        name="Free memory",
+        description="Forget data passed between nodes after the tree update. Nodes are evaluated again when "
+                    "their data is needed, so updates of the tree are slower but less memory is consumed",
+        default=False,
+        options=set(),
+    )
+    sv_fuse_math: BoolProperty(
+        name="Fuse math",
+        description="Evaluate chains of Scalar Math and Vector Math nodes at once, passing data between them "
+                    "as NumPy arrays without saving it in their output sockets. It's not used in parallel mode",
+        default=False,
+        update=lambda s, c: s.force_update(),
+        options=set(),
+    )
 
     def update(self):
         """This method is called if collection of nodes or links of the tree was changed"""
@@ -216,6 +252,42 @@ class UpdateNodes:
                                 update=lambda s, c: s.process_node(c))  # it would be better to have special event
     is_animation_dependent = False  # if True and is_animatable the the node will be updated on frame change
 
+    # True - the node changes data of its input sockets in place, it always gets copies of the data
+    # False - the node only reads its input data, the data is never copied
+    # None - unknown, copying depends on the input data mode in Sverchok preferences
+    mutates_inputs = None
+
+    # if True the node gets mesh lists (utils.meshes.MeshListElements) from its input sockets
+    # as they are, otherwise they are converted into nested lists
+    accepts_mesh_lists = False
+
+    # if True the node gets matrix arrays (utils.matrices.MatrixArray) from its input sockets
+    # as they are, otherwise they are converted into lists of mathutils matrices
+    accepts_matrix_arrays = False
+
+    # if True the process method of the node can be called in a separate thread when
+    # the tree has the parallel option, the method should not change Blender data then
+    is_thread_safe = False
+
+    # if True and the tree has the disk cache option, output data of the node is saved on disk
+    # and is read from there when the node gets the same input data (see core.disk_cache),
+    # it's for heavy nodes which results depend only on their properties and input data
+    is_disk_cacheable = False
+
+    def process_steps(self):
+        """
+        Generator version of the process method, it's used by the update system.
+        Heavy nodes can override it instead of the process method and yield
+        progress of their evaluation from time to time (a number from 0 to 1).
+        When a tree is updated via the timer, on yields the control can be given
+        back to Blender, so the UI is not frozen, the progress is shown in the
+        tree editor header and the evaluation can be canceled by ESC.
+        Such nodes still should have the process method, usually it's:
+        `def process(self): run_steps(self.process_steps())` (utils.sv_itertools)
+        """
+        self.process()
+        yield from ()
+
     def sv_init(self, context):
         """
         This method will be called during node creation
@@ -460,6 +532,7 @@ class SverchCustomTreeNode(UpdateNodes, NodeUtils):
                 row.prop(self, 'is_interactive', icon='SCENE_DATA')
             if self.is_animation_dependent or self.is_scene_dependent:
                 row.prop(self, 'refresh', icon='FILE_REFRESH')
+            layout.label(text=f"Socket data: {format_data_size(node_data_size(self))}")
         self.sv_draw_buttons_ext(context, layout)
 
     def sv_draw_buttons_ext(self, context, layout):
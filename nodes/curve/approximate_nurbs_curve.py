@@ -33,6 +33,8 @@ class SvApproxNurbsCurveMk2Node(bpy.types.Node, SverchCustomTreeNode):
     bl_idname = 'SvApproxNurbsCurveMk2Node'
     bl_label = 'Approximate NURBS Curve'
     bl_icon = 'CURVE_NCURVE'
+    is_thread_safe = True
+    is_disk_cacheable = True
 
     degree : IntProperty(
             name = "Degree",
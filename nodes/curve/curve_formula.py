@@ -8,7 +8,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, StringProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, zip_long_repeat,
                                      match_long_repeat, ensure_nesting_level)
-from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled
+from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled, safe_eval_numpy
 from sverchok.utils.script_importhelper import safe_names_np
 from sverchok.utils.math import (
         from_cylindrical, from_spherical,
@@ -64,7 +64,7 @@ class SvCurveFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
     use_numpy_function : BoolProperty(
         name = "Vectorize",
-        description = "Vectorize formula computations; disable this if you have troubles with some functions",
+        description = "Use NumPy versions of functions to vectorize formula computations; disable this if you have troubles with some functions",
         default = True,
         update = updateNode)
 
@@ -112,6 +112,16 @@ class SvCurveFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         compiled1 = sv_compile(self.formula1)
         compiled2 = sv_compile(self.formula2)
         compiled3 = sv_compile(self.formula3)
+        formula1, formula2, formula3 = self.formula1, self.formula2, self.formula3
+
+        if self.use_numpy_function:
+            def evaluate(compiled, formula):
+                return safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+        else:
+            # formulas are evaluated with functions of math module,
+            # but for all values at once where it gives the same results
+            def evaluate(compiled, formula):
+                return safe_eval_numpy(formula, variables)
 
         if self.output_mode == 'XYZ':
             def out_coordinates(x, y, z):
@@ -125,9 +135,9 @@ class SvCurveFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
         def function(t):
             variables.update(dict(t=t))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
+            v1 = evaluate(compiled1, formula1)
+            v2 = evaluate(compiled2, formula2)
+            v3 = evaluate(compiled3, formula3)
 
             if not isinstance(v1, np.ndarray):
                 v1 = np.full_like(t, v1)
@@ -203,10 +213,7 @@ class SvCurveFormulaNode(bpy.types.Node, SverchCustomTreeNode):
             for t_min, t_max, *var_values in var_values_s:
                 variables = dict(zip(var_names, var_values))
                 function = self.make_function(variables)
-                if self.use_numpy_function:
-                    function_vector = self.make_function_vector(variables)
-                else:
-                    function_vector = None
+                function_vector = self.make_function_vector(variables)
                 new_curve = SvLambdaCurve(function, function_vector)
                 new_curve.u_bounds = (t_min, t_max)
                 curves_out.append(new_curve)
@@ -19,6 +19,7 @@ class SvExInterpolateNurbsCurveNode(bpy.types.Node, SverchCustomTreeNode):
     bl_idname = 'SvExInterpolateNurbsCurveNode'
     bl_label = 'Interpolate NURBS Curve'
     bl_icon = 'CURVE_NCURVE'
+    is_thread_safe = True
 
     degree : IntProperty(
             name = "Degree",
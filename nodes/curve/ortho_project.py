@@ -11,7 +11,7 @@ from sverchok.utils.logging import info, exception
 from sverchok.utils.curve import SvCurve
 from sverchok.utils.dummy_nodes import add_dummy
 from sverchok.dependencies import scipy
-from sverchok.utils.manifolds import ortho_project_curve
+from sverchok.utils.manifolds import ortho_project_curve_array
 
 if scipy is None:
     add_dummy('SvExOrthoProjectCurveNode', "Ortho Project on Curve", 'scipy')
@@ -26,6 +26,7 @@ else:
         bl_label = 'Ortho Project on Curve'
         bl_icon = 'OUTLINER_OB_EMPTY'
         sv_icon = 'SV_ORTHO_CURVE'
+        mutates_inputs = False
 
         samples : IntProperty(
             name = "Init Resolution",
@@ -69,9 +70,8 @@ else:
                 for curve, src_points in zip_long_repeat(curves, src_points_i):
                     new_points = []
                     new_t = []
-                    for src_point in src_points:
-                        src_point = np.array(src_point)
-                        result = ortho_project_curve(src_point, curve, init_samples = self.samples)
+                    results = ortho_project_curve_array(np.array(src_points), curve, init_samples = self.samples)
+                    for result in results:
                         if self.nearest:
                             t = result.nearest_u
                             point = result.nearest.tolist()
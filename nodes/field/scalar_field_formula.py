@@ -6,7 +6,7 @@ from bpy.props import EnumProperty, BoolProperty, StringProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, match_long_repeat
-from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled
+from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled, safe_eval_numpy
 from sverchok.utils.script_importhelper import safe_names_np
 from sverchok.utils.math import (
         to_cylindrical, to_spherical,
@@ -42,7 +42,7 @@ class SvScalarFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
     use_numpy_function : BoolProperty(
         name = "Vectorize",
-        description = "Vectorize formula computations; disable this if you have troubles with some functions",
+        description = "Use NumPy versions of functions to vectorize formula computations; disable this if you have troubles with some functions",
         default = True,
         update = updateNode)
 
@@ -96,10 +96,20 @@ class SvScalarFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
     def make_function_vector(self, variables):
         compiled = sv_compile(self.formula)
+        formula = self.formula
+
+        if self.use_numpy_function:
+            def evaluate(compiled, formula):
+                return safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+        else:
+            # formulas are evaluated with functions of math module,
+            # but for all values at once where it gives the same results
+            def evaluate(compiled, formula):
+                return safe_eval_numpy(formula, variables)
 
         def carthesian(x, y, z, V):
             variables.update(dict(x=x, y=y, z=z, V=V))
-            r = safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+            r = evaluate(compiled, formula)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
@@ -107,7 +117,7 @@ class SvScalarFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         def cylindrical(x, y, z, V):
             rho, phi, z = to_cylindrical_np((x, y, z), mode='radians')
             variables.update(dict(rho=rho, phi=phi, z=z, V=V))
-            r = safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+            r = evaluate(compiled, formula)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
@@ -115,7 +125,7 @@ class SvScalarFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         def spherical(x, y, z, V):
             rho, phi, theta = to_spherical_np((x, y, z), mode='radians')
             variables.update(dict(rho=rho, phi=phi, theta=theta, V=V))
-            r = safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+            r = evaluate(compiled, formula)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
@@ -190,10 +200,7 @@ class SvScalarFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
             for var_values in var_values_s:
                 variables = dict(zip(var_names, var_values))
                 function = self.make_function(variables)
-                if self.use_numpy_function:
-                    function_vector = self.make_function_vector(variables)
-                else:
-                    function_vector = None
+                function_vector = self.make_function_vector(variables)
                 new_field = SvScalarFieldLambda(function, variables, field_in, function_vector)
                 fields_out.append(new_field)
 
@@ -6,7 +6,7 @@ from bpy.props import EnumProperty, BoolProperty, StringProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, match_long_repeat
-from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled
+from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled, safe_eval_numpy
 from sverchok.utils.script_importhelper import safe_names_np
 from sverchok.utils.math import (
         from_cylindrical, from_spherical,
@@ -60,7 +60,7 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
     use_numpy_function : BoolProperty(
         name = "Vectorize",
-        description = "Vectorize formula computations; disable this if you have troubles with some functions",
+        description = "Use NumPy versions of functions to vectorize formula computations; disable this if you have troubles with some functions",
         default = True,
         update = updateNode)
 
@@ -132,6 +132,16 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         compiled1 = sv_compile(self.formula1)
         compiled2 = sv_compile(self.formula2)
         compiled3 = sv_compile(self.formula3)
+        formula1, formula2, formula3 = self.formula1, self.formula2, self.formula3
+
+        if self.use_numpy_function:
+            def evaluate(compiled, formula):
+                return safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+        else:
+            # formulas are evaluated with functions of math module,
+            # but for all values at once where it gives the same results
+            def evaluate(compiled, formula):
+                return safe_eval_numpy(formula, variables)
 
         if self.output_mode == 'XYZ':
             def out_coordinates(x, y, z):
@@ -145,9 +155,9 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
         def carthesian_in(x, y, z, V):
             variables.update(dict(x=x, y=y, z=z, V=V))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
+            v1 = evaluate(compiled1, formula1)
+            v2 = evaluate(compiled2, formula2)
+            v3 = evaluate(compiled3, formula3)
             if not isinstance(v1, np.ndarray):
                 v1 = np.full_like(x, v1)
             if not isinstance(v2, np.ndarray):
@@ -159,9 +169,9 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         def cylindrical_in(x, y, z, V):
             rho, phi, z = to_cylindrical_np((x, y, z), mode='radians')
             variables.update(dict(rho=rho, phi=phi, z=z, V=V))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
+            v1 = evaluate(compiled1, formula1)
+            v2 = evaluate(compiled2, formula2)
+            v3 = evaluate(compiled3, formula3)
             if not isinstance(v1, np.ndarray):
                 v1 = np.full_like(x, v1)
             if not isinstance(v2, np.ndarray):
@@ -173,9 +183,9 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         def spherical_in(x, y, z, V):
             rho, phi, theta = to_spherical_np((x, y, z), mode='radians')
             variables.update(dict(rho=rho, phi=phi, theta=theta, V=V))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
+            v1 = evaluate(compiled1, formula1)
+            v2 = evaluate(compiled2, formula2)
+            v3 = evaluate(compiled3, formula3)
             if not isinstance(v1, np.ndarray):
                 v1 = np.full_like(x, v1)
             if not isinstance(v2, np.ndarray):
@@ -257,10 +267,7 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
             for var_values in var_values_s:
                 variables = dict(zip(var_names, var_values))
                 function = self.make_function(variables)
-                if self.use_numpy_function:
-                    function_vector = self.make_function_vector(variables)
-                else:
-                    function_vector = None
+                function_vector = self.make_function_vector(variables)
                 new_field = SvVectorFieldLambda(function, variables, field_in, function_vector)
                 fields_out.append(new_field)
 
@@ -18,11 +18,28 @@
 
 from math import sin, cos, pi, degrees, radians
 
+import numpy as np
+
 import bpy
 from bpy.props import BoolProperty, IntProperty, FloatProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (fullList, match_long_repeat, updateNode)
+from sverchok.utils.vectorize import vectorize
+
+
+def circle_verts(*, angle: np.ndarray, n_verts: int, radius: np.ndarray, sector: bool) -> np.ndarray:
+    """Vertices of circles with the same number of vertices, one array per circle"""
+    is_arc = angle < 360
+    theta = np.where(is_arc, angle / (n_verts - 1), angle / n_verts)
+    phi = np.radians(theta[:, np.newaxis] * np.arange(n_verts))
+    verts = np.zeros((len(angle), n_verts, 3))
+    verts[..., 0] = radius[:, np.newaxis] * np.cos(phi)
+    verts[..., 1] = radius[:, np.newaxis] * np.sin(phi)
+    if sector and is_arc.any():
+        with_center = np.concatenate((verts, np.zeros((len(angle), 1, 3))), axis=1)
+        return [c if arc else v for v, c, arc in zip(verts, with_center, is_arc)]
+    return verts
 
 
 class SvCircleNode(bpy.types.Node, SverchCustomTreeNode):
@@ -35,12 +52,19 @@ class SvCircleNode(bpy.types.Node, SverchCustomTreeNode):
     bl_idname = 'SvCircleNode'
     bl_label = 'Circle'
     bl_icon = 'MESH_CIRCLE'
+    mutates_inputs = False
 
     rad_: FloatProperty(name='Radius', description='Radius', default=1.0, update=updateNode)
     vert_: IntProperty(name='num Verts', description='Vertices. Min 3.', default=24, min=3, update=updateNode)
     mode_: BoolProperty(name='mode_', description='Mode. False - Segment, True - Sector', default=0,  update=updateNode)
     degr_: FloatProperty(name='Degrees', description='Degrees. Range: 0.0-360.0', default=360.0, min=0, max=360.0,  update=updateNode)
 
+    output_numpy: BoolProperty(
+        name='Output NumPy',
+        description='Output NumPy arrays (improves performance)',
+        default=False,
+        update=updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvStringsSocket', "Radius").prop_name = 'rad_'
         self.inputs.new('SvStringsSocket', "num Verts").prop_name = 'vert_'
@@ -53,27 +77,12 @@ class SvCircleNode(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         layout.prop(self, "mode_", text="Mode")
 
-    def make_verts(self, Angle, Vertices, Radius):
-        if Angle < 360:
-            theta = Angle/(Vertices-1)
-        else:
-            theta = Angle/Vertices
-        listVertX = []
-        listVertY = []
-        for i in range(Vertices):
-            listVertX.append(Radius*cos(radians(theta*i)))
-            listVertY.append(Radius*sin(radians(theta*i)))
-
-        if Angle < 360 and self.mode_ == 0:
-            sigma = radians(Angle)
-            listVertX[-1] = Radius*cos(sigma)
-            listVertY[-1] = Radius*sin(sigma)
-        elif Angle < 360 and self.mode_ == 1:
-            listVertX.append(0.0)
-            listVertY.append(0.0)
-
-        points = list((x,y,0) for x,y in zip(listVertX, listVertY) )
-        return points
+    def draw_buttons_ext(self, context, layout):
+        layout.prop(self, "mode_", text="Mode")
+        layout.prop(self, 'output_numpy')
+
+    def rclick_menu(self, context, layout):
+        layout.prop(self, 'output_numpy')
 
     def make_edges(self, Angle, Vertices):
         listEdg = [(i, i+1) for i in range(Vertices-1)]
@@ -118,7 +127,10 @@ class SvCircleNode(bpy.types.Node, SverchCustomTreeNode):
         verts_output, edges_output, faces_output = [self.outputs[n] for n in output_socket_names]
 
         if verts_output.is_linked:
-            points = [self.make_verts(a, v, r) for a, v, r in zip(*parameters)]
+            points = vectorize(circle_verts)(angle=parameters[0], n_verts=parameters[1],
+                                             radius=parameters[2], sector=bool(self.mode_))
+            if not self.output_numpy:
+                points = [p.tolist() for p in points]
             verts_output.sv_set(points)
 
         if edges_output.is_linked:
@@ -7,9 +7,15 @@
 
 
 import ast
+import json
+import queue
 import random
+import subprocess
+import tempfile
+import threading
 import time
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from pathlib import Path
 from typing import NamedTuple, Union
 import numpy as np
 
@@ -18,6 +24,8 @@ from mathutils.noise import seed_set, random
 from bpy.props import (
     BoolProperty, StringProperty, EnumProperty, IntProperty, FloatProperty)
 
+import sverchok
+import sverchok.core.tasks as ts
 from sverchok.core.update_system import UpdateTree
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
@@ -29,6 +37,8 @@ from sverchok.utils.listutils import (
     listinput_setF
     )
 from sverchok.utils.handle_blender_data import keep_enum_reference
+from sverchok.utils.sv_json_export import JSONExporter
+from sverchok.utils.evolver_worker import WORKER_MARKER
 
 
 def check_memory_prop(tx):
@@ -338,6 +348,147 @@ def random_element_swap(new_gene):
     new_gene[item_a] = new_gene[item_b]
     new_gene[item_b] = temp_g
 
+# maximum number of genomes which fitness is remembered during a run
+FITNESS_CACHE_SIZE = 10000
+
+
+def genes_key(genes):
+    """Hashable representation of genes of an agent"""
+    if isinstance(genes, (list, tuple)):
+        return tuple(genes_key(g) for g in genes)
+    return genes
+
+
+class FitnessCache:
+    """Least recently used fitness values of genomes. The fitness of the
+    same genes is the same during a run, so it's computed only once"""
+    def __init__(self, max_size=FITNESS_CACHE_SIZE):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self.hits = 0
+
+    def get(self, genes):
+        key = genes_key(genes)
+        fitness = self._data.get(key)
+        if fitness is not None:
+            self._data.move_to_end(key)
+            self.hits += 1
+        return fitness
+
+    def add(self, genes, fitness):
+        if self.max_size <= 0:
+            return
+        self._data[genes_key(genes)] = fitness
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+
+def evaluate_genes(tree, s_tree: UpdateTree, genes_def, genes, exec_order, fitness_socket):
+    """Sets genes to the tree, updates given nodes which should include all
+    nodes between the genes and the fitness socket and returns the fitness"""
+    try:
+        tree.sv_process = False
+        for gen_data, agent_gene in zip(genes_def, genes):
+            gen_data.set_node_with_gene(tree, agent_gene)
+
+        tree.sv_process = True
+        for exec_node in exec_order:
+            s_tree.update_node(exec_node, suppress=False)
+
+        agent_fitness = fitness_socket.sv_get(deepcopy=False)[0]
+        if isinstance(agent_fitness, list):
+            agent_fitness = agent_fitness[0]
+        return agent_fitness
+    finally:
+        tree.sv_process = True
+
+
+class FitnessWorkers:
+    """Background Blender processes evaluating fitness of agents. A copy of
+    the current file is saved and opened by each process, so nodes can read
+    objects and other data of the file. The part of the tree which is needed
+    for fitness evaluation is exported once, each process imports it and
+    evaluates its share of agents (see evolver_worker)"""
+    # how long to wait for results of the processes before returning control
+    wait_time = 0.01
+
+    def __init__(self, population, number):
+        tree, node, s_tree = population.tree, population.node, population._tree
+        fitness_socket = s_tree.socket_from_input(node.inputs[0])
+        # gene nodes which don't affect the fitness are exported too
+        # otherwise genes of agents would be set to wrong nodes
+        export_nodes = s_tree.nodes_to([node]) - {node} | {tree.nodes[g.name] for g in population.genes}
+        config = {
+            'tree': JSONExporter.get_tree_structure(tree, nodes=[n for n in tree.nodes if n in export_nodes]),
+            'genes': genes_to_string(population.genes),
+            'fitness': [fitness_socket.node.name, fitness_socket.identifier],
+        }
+        self._temp_dir = tempfile.TemporaryDirectory(prefix='sv_evolver_')
+        config_path = Path(self._temp_dir.name) / 'config.json'
+        with open(config_path, 'w') as file:
+            json.dump(config, file)
+        blend_path = Path(self._temp_dir.name) / 'scene.blend'
+        bpy.ops.wm.save_as_mainfile(filepath=str(blend_path), copy=True, check_existing=False)
+
+        worker_path = Path(sverchok.__file__).parent / 'utils' / 'evolver_worker.py'
+        command = [bpy.app.binary_path, '-b', str(blend_path), '--addons', sverchok.__name__,
+                   '--python', str(worker_path), '--', str(config_path)]
+        self._processes = [subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+                           for _ in range(number)]
+
+        # the output is read in threads so the main thread is not blocked
+        self._results = queue.Queue()
+        for index, process in enumerate(self._processes):
+            threading.Thread(target=self._read_results, args=(index, process), daemon=True).start()
+
+    def evaluate(self, genomes):
+        """Generator which evaluates genes of agents in the processes. It yields
+        while waiting for the processes, returns fitness of all agents"""
+        shares = [list(range(i, len(genomes), len(self._processes))) for i in range(len(self._processes))]
+        for process, share in zip(self._processes, shares):
+            if share:
+                process.stdin.write(json.dumps([genomes[i] for i in share]) + '\n')
+                process.stdin.flush()
+
+        fitness = [None] * len(genomes)
+        waiting = {i for i, share in enumerate(shares) if share}
+        while waiting:
+            try:
+                index, result = self._results.get(timeout=self.wait_time)
+            except queue.Empty:
+                yield
+                continue
+            if result is None:
+                raise RuntimeError(f"Evolver worker process has stopped with {self._processes[index].wait()} code")
+            if 'error' in result:
+                raise RuntimeError(f"Fitness evaluation failed in a worker process:\n{result['error']}")
+            for i, value in zip(shares[index], result['fitness']):
+                fitness[i] = value
+            waiting.discard(index)
+            yield
+        return fitness
+
+    def _read_results(self, index, process):
+        """Puts results of the process into the queue, None when it stops"""
+        for line in process.stdout:
+            if line.startswith(WORKER_MARKER):
+                self._results.put((index, json.loads(line[len(WORKER_MARKER):])))
+        self._results.put((index, None))
+
+    def close(self):
+        for process in self._processes:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        for process in self._processes:
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self._temp_dir.cleanup()
+
+
 class DNA:
 
     def __init__(self, genes_def, random_val=True, empty=False):
@@ -358,25 +509,18 @@ class DNA:
                 agent_gene = gene.init_val
                 self.genes.append(agent_gene)
 
-    def evaluate_fitness(self, tree, node, s_tree: UpdateTree, exec_order):
-        try:
-            tree.sv_process = False
-            for gen_data, agent_gene in zip(self.genes_def, self.genes):
-                gen_data.set_node_with_gene(tree, agent_gene)
-
-            tree.sv_process = True
-            for node in exec_order:
-                try:
-                    s_tree.update_node(node, suppress=False)
-                except Exception:
-                    raise
-
-            agent_fitness = node.inputs[0].sv_get(deepcopy=False)[0]
-            if isinstance(agent_fitness, list):
-                agent_fitness = agent_fitness[0]
-            self.fitness = agent_fitness
-        finally:
-            tree.sv_process = True
+    def evaluate_fitness(self, tree, node, s_tree: UpdateTree, exec_order, cache: FitnessCache = None):
+        """Sets genes to the tree and updates given nodes which should
+        include all nodes between the genes and the fitness input of the node"""
+        if cache is not None:
+            fitness = cache.get(self.genes)
+            if fitness is not None:
+                self.fitness = fitness
+                return
+        fitness_socket = s_tree.socket_from_input(node.inputs[0])
+        self.fitness = evaluate_genes(tree, s_tree, self.genes_def, self.genes, exec_order, fitness_socket)
+        if cache is not None:
+            cache.add(self.genes, self.fitness)
 
     def cross_over(self, other_ancestor, mutation_threshold):
 
@@ -413,8 +557,15 @@ class Population:
         self.init_population(node.population_n)
 
         self._tree = UpdateTree.get(tree)
-        exec_order = self._tree.nodes_from([tree.nodes[g.name] for g in self.genes])
-        self.exec_order = self._tree.sort_nodes(exec_order)
+        self.fitness_cache = FitnessCache()
+
+        # only nodes between genes and the fitness are evaluated for each agent,
+        # other nodes which depend on genes are updated after the evolution
+        from_genes = self._tree.nodes_from([tree.nodes[g.name] for g in self.genes])
+        to_fitness = self._tree.nodes_to([node]) - {node}
+        self.exec_order = self._tree.sort_nodes(from_genes & to_fitness)
+        self.after_order = self._tree.sort_nodes(from_genes - to_fitness - {node})
+        self._tree.restore_data(self.exec_order + self.after_order)
 
     def init_population(self, population_n):
 
@@ -436,12 +587,39 @@ class Population:
             for i in range(population_n-len(previous_population)):
                 self.population_g.append(DNA(self.genes))
 
-    def evaluate_fitness_g(self):
-        try:
-            for agent in self.population_g:
-                agent.evaluate_fitness(self.tree, self.node, self._tree, self.exec_order)
-        finally:
-            self.tree.sv_process = True
+    def evaluate_fitness_g(self, workers: FitnessWorkers = None):
+        """Generator which evaluates fitness of the population in the main
+        process or in given worker processes"""
+        if workers is None:
+            try:
+                for agent in self.population_g:
+                    agent.evaluate_fitness(self.tree, self.node, self._tree, self.exec_order, self.fitness_cache)
+                    yield self.node
+            finally:
+                self.tree.sv_process = True
+            return
+
+        # agents with the same genes are evaluated once
+        not_evaluated = dict()
+        for agent in self.population_g:
+            fitness = self.fitness_cache.get(agent.genes)
+            if fitness is not None:
+                agent.fitness = fitness
+            else:
+                not_evaluated.setdefault(genes_key(agent.genes), []).append(agent)
+        genomes = [agents[0].genes for agents in not_evaluated.values()]
+        evaluation = workers.evaluate(genomes)
+        while True:
+            try:
+                next(evaluation)
+            except StopIteration as result:
+                fitness_values = result.value
+                break
+            yield self.node
+        for agents, fitness in zip(not_evaluated.values(), fitness_values):
+            self.fitness_cache.add(agents[0].genes, fitness)
+            for agent in agents:
+                agent.fitness = fitness
 
     def population_genes(self):
         return [agent.genes for agent in self.population_g]
@@ -494,6 +672,22 @@ class Population:
         evolver_mem[node_id]["fitness"] = fitness_all[-1]
 
     def evolve(self):
+        for _ in self.evolution():
+            pass
+
+    def evolve_in_workers(self, number):
+        """Generator for core/tasks which runs the evolution evaluating fitness
+        in background processes"""
+        workers = FitnessWorkers(self, number)
+        try:
+            yield from self.evolution(workers)
+        finally:
+            workers.close()
+        self.node.process_node(None)
+
+    def evolution(self, workers: FitnessWorkers = None):
+        """Generator of the whole evolution process, it yields the Evolver node
+        after evaluation of each agent or share of agents"""
         population_all = []
         fitness_all = []
         info = "Evolver Runned"
@@ -505,7 +699,7 @@ class Population:
         goal = self.node.fitness_goal
 
         for iteration in range(iterations - 1):
-            self.evaluate_fitness_g()
+            yield from self.evaluate_fitness_g(workers)
             self.population_g.sort(key=lambda x: x.fitness, reverse=(mode == "MAX"))
             population_all.append(self.population_genes())
             actual_population_fitenss = self.population_fitness()
@@ -527,7 +721,7 @@ class Population:
 
 
         if not goal_achieved:
-            self.evaluate_fitness_g()
+            yield from self.evaluate_fitness_g(workers)
             self.population_g.sort(key=lambda x: x.fitness, reverse=(mode == "MAX"))
             population_all.append(self.population_genes())
             fitness_all.append(self.population_fitness())
@@ -535,6 +729,9 @@ class Population:
         self.store_data(population_all, fitness_all)
         self.node.info_label = info
 
+        for node in self.after_order:
+            self._tree.update_node(node)
+
 
 class SvEvolverRun(bpy.types.Operator, SvGenericNodeLocator):
 
@@ -555,8 +752,12 @@ class SvEvolverRun(bpy.types.Operator, SvGenericNodeLocator):
         seed_set(node.r_seed)
         np.random.seed(node.r_seed)
         population = Population(genotype_frame, node, tree)
-        population.evolve()
-        node.process_node(None)
+        if node.workers:
+            # the progress is shown and the evolution can be canceled like tree updates
+            ts.tasks.add(ts.Task(tree, population.evolve_in_workers(node.workers), is_scene_update=False))
+        else:
+            population.evolve()
+            node.process_node(None)
 
 
 class SvEvolverSetFittest(bpy.types.Operator, SvGenericNodeLocator):
@@ -683,6 +884,14 @@ class SvEvolverNode(bpy.types.Node, SverchCustomTreeNode):
         name='Max Seconds', description='Maximum execution Time',
         update=props_changed)
 
+    workers: IntProperty(
+        default=0,
+        min=0,
+        name='Workers',
+        description='Number of background Blender processes evaluating fitness in parallel, '
+                    'if 0 fitness is evaluated in the current Blender',
+        update=props_changed)
+
     info_label: StringProperty(default="Not Executed")
 
     memory: StringProperty(default="")
@@ -709,6 +918,7 @@ class SvEvolverNode(bpy.types.Node, SverchCustomTreeNode):
         layout.prop(self, "fitness_booster")
         layout.prop(self, "mutation")
         layout.prop(self, "max_time")
+        layout.prop(self, "workers")
         if self.use_fitness_goal:
             goal_row = layout.row(align=True)
             goal_row.prop(self, "use_fitness_goal", text="")
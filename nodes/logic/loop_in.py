@@ -22,7 +22,7 @@ from sverchok.core.update_system import UpdateTree, SearchTree
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, enum_item_4, numpy_list_match_modes
 from sverchok.utils.sv_node_utils import frame_adjust
-from sverchok.utils.nodes_mixins.loop_nodes import LoopNode
+from sverchok.utils.nodes_mixins.loop_nodes import LoopNode, SERIAL_NODES_KEY
 
 
 class SvCreateLoopOut(bpy.types.Operator):
@@ -93,6 +93,17 @@ class SvLoopInNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
         name='Print progress in console', description='Maximum allowed iterations',
         default=False)
 
+    skip_unchanged: BoolProperty(
+        name='Skip unchanged nodes',
+        description='Evaluate nodes of the loop only once if their input data does not depend on '
+                    'iteration and skip nodes which input data was not changed in an iteration',
+        default=False, update=updateNode)
+
+    parallel: BoolProperty(
+        name='Parallel',
+        description='Evaluate items in several threads if all nodes of the loop are thread safe',
+        default=False, update=updateNode)
+
     def update_mode(self, context):
         self.inputs['Iterations'].hide_safe = self.mode == "For_Each"
         if self.mode == "For_Each":
@@ -129,6 +140,8 @@ class SvLoopInNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
         if not self.linked_to_loop_out:
             layout.operator("node.create_loop_out", icon='CON_FOLLOWPATH', text="Create Loop Out")
         layout.prop(self, 'mode', expand=True)
+        if self.mode == "For_Each" and self.parallel and self.get(SERIAL_NODES_KEY):
+            layout.label(text="Evaluated serially", icon='ERROR')
 
     def draw_buttons_ext(self, ctx, layout):
         layout.prop(self, 'mode', expand=True)
@@ -136,7 +149,11 @@ class SvLoopInNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
             layout.prop(self, "max_iterations")
         else:
             layout.prop(self, "list_match")
+            layout.prop(self, "parallel")
+            if self.parallel and self.get(SERIAL_NODES_KEY):
+                layout.label(text=f"Not thread safe: {self[SERIAL_NODES_KEY]}", icon='ERROR')
         layout.prop(self, 'print_to_console')
+        layout.prop(self, 'skip_unchanged')
         socket_labels = layout.box()
         socket_labels.label(text="Socket Labels")
         for socket in self.inputs[1:]:
@@ -16,18 +16,109 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+from concurrent.futures import ThreadPoolExecutor
+
 import bpy
 from bpy.props import EnumProperty
-from sverchok.core.update_system import UpdateTree
+from sverchok.core.update_system import UpdateTree, AddStatistic, init_socket_ids
+from sverchok.core.socket_data import (isolated_socket_data, merge_socket_data, sv_get_socket_data,
+                                       sv_set_socket_data)
 
 from sverchok.node_tree import SverchCustomTreeNode
 
 
 from sverchok.data_structure import list_match_func, enum_item_4
-from sverchok.utils.nodes_mixins.loop_nodes import LoopNode
+from sverchok.utils.nodes_mixins.loop_nodes import LoopNode, SERIAL_NODES_KEY
 
 socket_labels = {'Range': 'Break', 'For_Each': 'Skip'}
 
+
+class LoopNodeError(Exception):
+    """Error of a node of the loop evaluated not in the main thread, the
+    status of the node can be changed only in the main thread"""
+    def __init__(self, node, error):
+        super().__init__(str(error))
+        self.node = node
+        self.error = error
+
+
+class LoopBody:
+    """Nodes of the loop and IDs of their sockets which are needed to evaluate
+    items of the loop in other threads. Blender data is read in the main
+    thread, so the threads only execute nodes and pass socket data by IDs"""
+    def __init__(self, tree, loop_in_node, loop_out_node, nodes):
+        for node in [loop_in_node, *nodes]:
+            init_socket_ids(node)
+        self.param_ids = [s.socket_id for s in loop_in_node.outputs[3:]]
+        self.number_id = loop_in_node.outputs['Loop Number'].socket_id
+        self.skip_unchanged = loop_in_node.skip_unchanged
+        self.print_to_console = loop_in_node.print_to_console
+
+        # node, (from socket ID, to socket ID), output IDs, whether it should be always updated
+        self.nodes = []
+        for node in nodes:
+            links = [(ps.socket_id, ns.socket_id) for ps, ns in zip(tree.previous_sockets(node), node.inputs)
+                     if ps is not None]
+            is_volatile = getattr(node, 'is_scene_dependent', False) \
+                or getattr(node, 'is_animation_dependent', False)
+            self.nodes.append((node, links, [s.socket_id for s in node.outputs], is_volatile))
+
+        prev_socks = tree.previous_sockets(loop_out_node)
+        self.break_id = prev_socks[1].socket_id if prev_socks[1] is not None else None
+        self.results = [(s.socket_id, f"{s.node.name}: {s.name}") if s is not None else None
+                        for s in prev_socks[2:len(loop_out_node.outputs) + 2]]
+
+    @staticmethod
+    def serial_nodes(tree, nodes) -> list:
+        """Nodes which can't be evaluated in other threads, not thread safe
+        ones and ones which input data should be converted"""
+        return [n for n in nodes if not getattr(n, 'is_thread_safe', False)
+                or any(ps is not None and ps.bl_idname != ns.bl_idname
+                       for ps, ns in zip(tree.previous_sockets(n), n.inputs))]
+
+    def evaluate_item(self, idx, item_params, first_params):
+        """Evaluates nodes of the loop for one item in current thread with
+        isolated socket data. Returns the output data of the item or None if
+        the item should be skipped and the socket data of the item"""
+        with isolated_socket_data() as layer:
+            changed = {self.number_id} if self.skip_unchanged else None
+            for sock_id, data, first_data in zip(self.param_ids, item_params, first_params):
+                sv_set_socket_data(sock_id, [data])
+                if changed is not None and data is not first_data:
+                    changed.add(sock_id)
+            sv_set_socket_data(self.number_id, [[idx]])
+            if self.print_to_console:
+                print(f"Looping Object Number {idx + 1}")
+
+            for node, links, output_ids, is_volatile in self.nodes:
+                if changed is not None:
+                    if not is_volatile and not any(from_id in changed for from_id, _ in links):
+                        continue
+                    changed.update(output_ids)
+                try:
+                    for from_id, to_id in links:
+                        sv_set_socket_data(to_id, sv_get_socket_data(from_id))
+                    node.process()
+                except Exception as e:
+                    raise LoopNodeError(node, e) from e
+
+            if self.break_id is not None:
+                break_data = sv_get_socket_data(self.break_id)
+                if break_data and break_data[0][0]:
+                    return None, layer
+            item_data = []
+            for result in self.results:
+                if result is None:
+                    item_data.append([])
+                    continue
+                sock_id, name = result
+                data = sv_get_socket_data(sock_id)
+                if data is None:
+                    raise LookupError(f"No data in '{name}' socket")
+                item_data.append(data[0])
+            return item_data, layer
+
+
 class SvUpdateLoopOutSocketLabels(bpy.types.Operator):
     '''Update Loop Out socket Labels'''
     bl_idname = "node.update_loop_out_socket_labels"
@@ -109,6 +200,50 @@ class SvLoopOutNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
             raise RuntimeError(f'{loop_in_names} {is_are} not connected to Loop'
                                f' out node inside the main loop')
 
+    @staticmethod
+    def update_loop_nodes(tree, nodes, changed_sockets=None):
+        """Updates the nodes in given order. If changed sockets are given only
+        nodes which get data from them or depend on the scene are updated,
+        output sockets of updated nodes are added to the changed ones"""
+        for node in nodes:
+            if changed_sockets is not None:
+                is_volatile = getattr(node, 'is_scene_dependent', False) \
+                    or getattr(node, 'is_animation_dependent', False)
+                if not is_volatile and not any(s in changed_sockets for s in tree.previous_sockets(node)):
+                    continue
+                changed_sockets.update(node.outputs)
+            tree.update_node(node, suppress=False)
+
+    def for_each_parallel(self, tree, loop_in_node, loop_nodes, items, out_data):
+        """Evaluates items in a thread pool and adds their results to the
+        output data in order of the items. Socket data of the last item is
+        kept like after evaluation one by one"""
+        body = LoopBody(tree, loop_in_node, self, loop_nodes)
+        first_params = items[0]
+        with ThreadPoolExecutor(thread_name_prefix='sverchok_loop') as pool:
+            futures = [pool.submit(body.evaluate_item, idx, item_params, first_params)
+                       for idx, item_params in enumerate(items) if idx > 0]
+            layer = None
+            for idx, future in enumerate(futures, start=1):
+                try:
+                    item_data, layer = future.result()
+                except LoopNodeError as e:
+                    pool.shutdown(cancel_futures=True)
+                    with AddStatistic(e.node):  # shows the error on the node
+                        raise e.error
+                    raise Exception(f"Element: {idx}, {e.error}") from e.error
+                except Exception as e:
+                    pool.shutdown(cancel_futures=True)
+                    raise Exception(f"Element: {idx}, {e}") from e
+                if item_data is not None:
+                    for data, out in zip(item_data, out_data):
+                        out.append(data)
+        if layer is not None:
+            merge_socket_data(layer)
+            for node in [loop_in_node, *loop_nodes]:
+                for sock in node.outputs:
+                    sock.update_objects_number()
+
     def process(self):
         loop_in_node = self.loop_in_node
 
@@ -158,21 +293,35 @@ class SvLoopOutNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
                     else:
                         out.append([])
 
-            for item_params in zip(*params):
+            loop_body = sort_loop_nodes[1:-1]
+            serial_nodes = LoopBody.serial_nodes(tree, loop_body) if loop_in_node.parallel else []
+            loop_in_node[SERIAL_NODES_KEY] = ', '.join(n.name for n in serial_nodes)  # to show in UI
+            if loop_in_node.parallel and not serial_nodes:
+                self.for_each_parallel(tree, loop_in_node, loop_body, list(zip(*params)), out_data)
+                items = []
+            else:
+                items = zip(*params)
+
+            prev_params = None
+            for item_params in items:
                 if idx == 0:
                     idx += 1
+                    prev_params = item_params
                     continue
+                changed = {loop_in_node.outputs['Loop Number']} if loop_in_node.skip_unchanged else None
                 for j, data in enumerate(item_params):
                     loop_in_node.outputs[j+3].sv_set([data])
+                    if changed is not None and data is not prev_params[j]:
+                        changed.add(loop_in_node.outputs[j+3])
+                prev_params = item_params
                 loop_in_node.outputs['Loop Number'].sv_set([[idx]])
                 idx += 1
                 if do_print:
                     print(f"Looping Object Number {idx}")
-                for node in sort_loop_nodes[1:-1]:
-                    try:
-                        tree.update_node(node, suppress=False)
-                    except Exception:
-                        raise Exception(f"Element: {idx}")
+                try:
+                    self.update_loop_nodes(tree, sort_loop_nodes[1:-1], changed)
+                except Exception as e:
+                    raise Exception(f"Element: {idx}, {e}") from e
 
                 if not break_socket or not break_socket.sv_get(default=[[False]])[0][0]:
                     for inp, out in zip(tree.previous_sockets(self)[2:len(self.outputs) + 2], out_data):
@@ -215,22 +364,28 @@ class SvLoopOutNode(LoopNode, SverchCustomTreeNode, bpy.types.Node):
             for node in sort_loop_nodes[:-1]:
                 tree.update_node(node)
 
+            # nodes which depend only on data not changed by iterations
+            # keep results of the first evaluation
+            carried_data = dict()
             for i in range(iterations-1):
                 if break_socket and break_socket.sv_get(default=[[False]])[0][0]:
                     break
+                changed = {loop_in_node.outputs['Loop Number']} if loop_in_node.skip_unchanged else None
                 for j, socket in enumerate(tree.previous_sockets(self)[2:]):
                     if socket is None:
                         continue
                     data = socket.sv_get(deepcopy=False, default=[])
                     loop_in_node.outputs[j+3].sv_set(data)
+                    if changed is not None and (j not in carried_data or data is not carried_data[j]):
+                        changed.add(loop_in_node.outputs[j+3])
+                    carried_data[j] = data
                 loop_in_node.outputs['Loop Number'].sv_set([[i+1]])
                 if do_print:
                     print(f"Looping iteration Number {i+1}")
-                for node in sort_loop_nodes[1:-1]:
-                    try:
-                        tree.update_node(node, suppress=False)
-                    except Exception:
-                        raise Exception(f"Iteration number: {i+1}")
+                try:
+                    self.update_loop_nodes(tree, sort_loop_nodes[1:-1], changed)
+                except Exception as e:
+                    raise Exception(f"Iteration number: {i+1}, {e}") from e
 
             for inp, outp in zip(tree.previous_sockets(self)[2:], self.outputs):
                 if inp is None:
@@ -25,8 +25,10 @@ from bpy.props import BoolProperty, EnumProperty
 from mathutils import Matrix
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode
+from sverchok.data_structure import updateNode, repeat_last_for_length, numpy_full_list
 from sverchok.utils.mesh_functions import apply_matrix_to_vertices_py
+from sverchok.utils.meshes import MeshList, MeshListElements, shared_mesh_list, as_nested_lists
+from sverchok.utils.matrices import MatrixArray
 from sverchok.utils.vectorize import vectorize, devectorize, SvVerts, SvEdges, SvPolys
 from sverchok.utils.modules.matrix_utils import matrix_apply_np
 
@@ -82,6 +84,29 @@ def apply_matrix(
     return new_vertices, edges, polygons
 
 
+def apply_matrix_array(
+        *,
+        vertices: SvVerts,
+        edges: SvEdges,
+        polygons: SvPolys,
+        matrices: MatrixArray) -> MeshList:
+    """The same as vectorized apply_matrix function but all meshes are
+    transformed at once, last meshes and matrices are repeated. Elements of
+    a mesh list (output of the same function) are used without conversion"""
+    meshes_number = max(len(vertices), len(edges), len(polygons))
+    number = max(meshes_number, len(matrices))
+    mesh_list = shared_mesh_list(vertices, edges, polygons)
+    if mesh_list is None:
+        if isinstance(vertices, MeshListElements):
+            vertices = vertices.to_arrays()
+        vertices, edges, polygons = [repeat_last_for_length(as_nested_lists(data), meshes_number)
+                                     for data in (vertices, edges, polygons)]
+        mesh_list = MeshList.from_lists(vertices, edges, polygons)
+    if number != len(mesh_list):
+        mesh_list = mesh_list.take(np.minimum(np.arange(number), meshes_number - 1))
+    return mesh_list.transformed(numpy_full_list(matrices.array, number))
+
+
 def join_meshes(*, vertices: List[SvVerts], edges: List[SvEdges], polygons: List[SvPolys]):
     joined_vertices = []
     joined_edges = []
@@ -129,6 +154,9 @@ class SvMatrixApplyJoinNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Matrix Apply to Mesh'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_MATRIX_APPLY_JOIN'
+    accepts_matrix_arrays = True
+    accepts_mesh_lists = True
+    mutates_inputs = False
 
     do_join: BoolProperty(name='Join', default=True, update=updateNode)
 
@@ -178,6 +206,13 @@ class SvMatrixApplyJoinNode(bpy.types.Node, SverchCustomTreeNode):
         faces = self.inputs['Faces'].sv_get(default=[], deepcopy=False)
         matrices = self.inputs['Matrices'].sv_get(default=[], deepcopy=False)
 
+        if isinstance(matrices, MatrixArray):
+            if len(vertices) and len(matrices):
+                self.process_matrix_array(vertices, edges, faces, matrices)
+                return
+            matrices = matrices.to_list()
+        vertices, edges, faces = [as_nested_lists(data) for data in (vertices, edges, faces)]
+
         # fixing matrices nesting level if necessary, this is for back capability, can be removed later on
         if matrices:
             is_flat_list = not isinstance(matrices[0], (list, tuple))
@@ -206,6 +241,14 @@ class SvMatrixApplyJoinNode(bpy.types.Node, SverchCustomTreeNode):
         self.outputs['Edges'].sv_set(out_edges)
         self.outputs['Faces'].sv_set(out_polygons)
 
+    def process_matrix_array(self, vertices, edges, faces, matrices):
+        mesh_list = apply_matrix_array(vertices=vertices, edges=edges, polygons=faces, matrices=matrices)
+        if self.do_join:
+            mesh_list = mesh_list.join()
+        self.outputs['Vertices'].sv_set(mesh_list.vertices_data)
+        self.outputs['Edges'].sv_set(mesh_list.edges_data if len(edges) else [])
+        self.outputs['Faces'].sv_set(mesh_list.polygons_data if len(faces) else [])
+
 
 def register():
     bpy.utils.register_class(SvMatrixApplyJoinNode)
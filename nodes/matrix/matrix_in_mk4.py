@@ -16,12 +16,15 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import numpy as np
+
 import bpy
 from bpy.props import EnumProperty, FloatProperty, BoolProperty, StringProperty, FloatVectorProperty
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, match_long_repeat, make_repeaters
+from sverchok.data_structure import updateNode, match_long_repeat, numpy_match_long_repeat
 from sverchok.utils.sv_transform_helper import AngleUnits, SvAngleHelper
-from mathutils import Quaternion, Matrix, Euler
+from sverchok.utils.matrices import (MatrixArray, compose_matrices, quaternions_to_rotations,
+                                     eulers_to_rotations, axis_angles_to_rotations)
 
 rotation_mode_items = [
     ("QUATERNION", "Quaternion",   "Rotation given as a Quaternion", 0),
@@ -35,74 +38,22 @@ input_sockets = {
     "AXISANGLE":  ["Axis", "Angle"],
 }
 
-mat_t = Matrix().Identity(4)  # pre-allocate once for performance (translation)
-mat_s = Matrix().Identity(4)  # pre-allocate once for performance (scale)
+def matched_arrays(params):
+    """Arrays of the same length, last items of shorter lists are repeated"""
+    return numpy_match_long_repeat([np.array(p, dtype=np.float64) for p in params])
 
 def quaternion_matrices(params):
-    matrices = []
-    mat_num = max(map(len, params))
-    params2 = make_repeaters(params)
-    for i, location, quaternion, scale in zip(range(mat_num), *params2):
-        # translation
-        mat_t[0][3] = location[0]
-        mat_t[1][3] = location[1]
-        mat_t[2][3] = location[2]
-        # rotation
-        mat_r = quaternion.to_matrix().to_4x4()
-        # scale
-        mat_s[0][0] = scale[0]
-        mat_s[1][1] = scale[1]
-        mat_s[2][2] = scale[2]
-        # composite matrix
-        m = mat_t @ mat_r @ mat_s
-        matrices.append(m)
-    return matrices
+    locations, quaternions, scales = matched_arrays(params)
+    return compose_matrices(locations, quaternions_to_rotations(quaternions), scales)
+
 def euler_matrices(params, euler_order, angle_units):
-    mat_num = max(map(len, params))
-    params2 = make_repeaters(params)
-    matrices = []
-    for i, location, angleX, angleY, angleZ, scale in zip(range(mat_num), *params2):
-        # translation
-        mat_t[0][3] = location[0]
-        mat_t[1][3] = location[1]
-        mat_t[2][3] = location[2]
-        # rotation
-        angles = (angleX * angle_units, angleY * angle_units, angleZ * angle_units)
-        euler = Euler(angles, euler_order)
-        # mat_r = euler.to_quaternion().to_matrix().to_4x4()
-        mat_r = euler.to_matrix().to_4x4()
-
-        # scale
-        mat_s[0][0] = scale[0]
-        mat_s[1][1] = scale[1]
-        mat_s[2][2] = scale[2]
-        # composite matrix
-        m = mat_t @ mat_r @ mat_s
-        matrices.append(m)
-    return matrices
+    locations, angles_x, angles_y, angles_z, scales = matched_arrays(params)
+    angles = np.stack((angles_x, angles_y, angles_z), axis=-1) * angle_units
+    return compose_matrices(locations, eulers_to_rotations(angles, euler_order), scales)
 
 def axis_angle_matrices(params, angle_units):
-    max_len = max(map(len, params))
-
-    params2 = make_repeaters(params)
-    # params2 = match_long_repeat([ll, xl, al, sl])
-    matrices = []
-    for i, location, axis, angle, scale in zip(range(max_len), *params2):
-    # for location, axis, angle, scale in zip(*params2):
-        # translation
-        mat_t[0][3] = location[0]
-        mat_t[1][3] = location[1]
-        mat_t[2][3] = location[2]
-        # rotation
-        mat_r = Quaternion(axis, angle * angle_units).to_matrix().to_4x4()
-        # scale
-        mat_s[0][0] = scale[0]
-        mat_s[1][1] = scale[1]
-        mat_s[2][2] = scale[2]
-        # composite matrix
-        m = mat_t @ mat_r @ mat_s
-        matrices.append(m)
-    return matrices
+    locations, axes, angles, scales = matched_arrays(params)
+    return compose_matrices(locations, axis_angles_to_rotations(axes, angles * angle_units), scales)
 
 class SvMatrixInNodeMK4(bpy.types.Node, SverchCustomTreeNode, SvAngleHelper):
     """
@@ -112,6 +63,7 @@ class SvMatrixInNodeMK4(bpy.types.Node, SverchCustomTreeNode, SvAngleHelper):
     bl_idname = 'SvMatrixInNodeMK4'
     bl_label = 'Matrix In'
     sv_icon = 'SV_MATRIX_IN'
+    mutates_inputs = False
 
     def update_rotation_mode(self, context):
 
@@ -224,8 +176,7 @@ class SvMatrixInNodeMK4(bpy.types.Node, SverchCustomTreeNode, SvAngleHelper):
 
         inputs = self.inputs
 
-        matrix_list = []
-        add_matrix = matrix_list.extend if self.flat_output else matrix_list.append
+        matrices = []
 
         if self.rotation_mode == "QUATERNION":
             input_l = inputs["Location"].sv_get(deepcopy=False)
@@ -234,11 +185,11 @@ class SvMatrixInNodeMK4(bpy.types.Node, SverchCustomTreeNode, SvAngleHelper):
             if inputs["Quaternion"].is_linked:
                 input_q = [input_q]
             else:
-                input_q = [[Quaternion(input_q[0][0])]]
+                input_q = [[tuple(input_q[0][0])]]
             I = [input_l, input_q, input_s]
             params1 = match_long_repeat(I)
             for p in zip(*params1):
-                add_matrix(quaternion_matrices(p))
+                matrices.append(quaternion_matrices(p))
 
         elif self.rotation_mode == "EULER":
             socket_names = ["Location", "Angle X", "Angle Y", "Angle Z", "Scale"]
@@ -247,7 +198,7 @@ class SvMatrixInNodeMK4(bpy.types.Node, SverchCustomTreeNode, SvAngleHelper):
             # conversion factor from the current angle units to radians
             angle_units = self.radians_conversion_factor()
             for p in zip(*params1):
-                add_matrix(euler_matrices(p, self.euler_order, angle_units))
+                matrices.append(euler_matrices(p, self.euler_order, angle_units))
 
         elif self.rotation_mode == "AXISANGLE":
             socket_names = ["Location", "Axis", "Angle", "Scale"]
@@ -256,10 +207,14 @@ class SvMatrixInNodeMK4(bpy.types.Node, SverchCustomTreeNode, SvAngleHelper):
             # conversion factor from the current angle units to radians
             angle_units = self.radians_conversion_factor()
             for p in zip(*params1):
-                add_matrix(axis_angle_matrices(p, angle_units))
-
-        self.outputs['Matrices'].sv_set(matrix_list)
-
+                matrices.append(axis_angle_matrices(p, angle_units))
+
+        if not matrices:
+            self.outputs['Matrices'].sv_set([])
+        elif self.flat_output:
+            self.outputs['Matrices'].sv_set(MatrixArray(np.concatenate(matrices)))
+        else:
+            self.outputs['Matrices'].sv_set([MatrixArray(m).to_list() for m in matrices])
 
 def register():
     bpy.utils.register_class(SvMatrixInNodeMK4)
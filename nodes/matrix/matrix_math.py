@@ -17,14 +17,20 @@
 # ##### END GPL LICENSE BLOCK #####
 
 from functools import reduce
+
+import numpy as np
+
 import bpy
 from bpy.props import BoolProperty, EnumProperty
 
 from mathutils import Matrix
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import (updateNode, list_match_func, numpy_list_match_modes)
+from sverchok.data_structure import (updateNode, list_match_func, numpy_list_match_modes,
+                                     numpy_list_match_func)
 from sverchok.utils.sv_itertools import (recurse_f_level_control)
+from sverchok.utils.matrices import (MatrixArray, matrix_array, decompose_matrices, compose_matrices,
+                                     quaternions_to_rotations)
 
 OPERATION_ITEMS = [
     ("MULTIPLY", "Multiply", "Multiply two matrices", 0),
@@ -94,12 +100,17 @@ def general_op(mat_list, operation):
 
     return out_matrix_list
 
+def is_flat(matrices):
+    return isinstance(matrices, MatrixArray) or not matrices or isinstance(matrices[0], Matrix)
+
 class SvMatrixMathNode(bpy.types.Node, SverchCustomTreeNode):
     ''' Math operation on matrices '''
     bl_idname = 'SvMatrixMathNode'
     bl_label = 'Matrix Math'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_MATRIX_MATH'
+    accepts_matrix_arrays = True
+    mutates_inputs = False
 
     def update_operation(self, context):
         self.label = "Matrix " + self.operation.title()
@@ -244,6 +255,12 @@ class SvMatrixMathNode(bpy.types.Node, SverchCustomTreeNode):
         for s in filter(lambda s: s.is_linked, self.inputs):
             data_in.append(s.sv_get(default=id_mat))
 
+        if any(isinstance(d, MatrixArray) for d in data_in):
+            if all(is_flat(d) for d in data_in):
+                self.process_arrays([matrix_array(d) for d in data_in])
+                return
+            data_in = [d.to_list() if isinstance(d, MatrixArray) else d for d in data_in]
+
         operation = self.get_operation()
 
         if self.operation in {"MULTIPLY"}:  # multiple input operations
@@ -269,6 +286,39 @@ class SvMatrixMathNode(bpy.types.Node, SverchCustomTreeNode):
             else:  # INVERSE / FILTER
                 outputs['C'].sv_set(general_op(mat_list, operation))
 
+    def process_arrays(self, arrays):
+        """Performs the operation on flat lists of matrices given as arrays of
+        shape (n, 4, 4) at once"""
+        outputs = self.outputs
+
+        if self.operation == "MULTIPLY":
+            if self.prePost == "POST":  # B op A : reverse input order
+                arrays = arrays[::-1]
+            arrays = numpy_list_match_func[self.list_match](arrays)
+            outputs['C'].sv_set(MatrixArray(reduce(np.matmul, arrays)))
+
+        elif self.operation == "INVERT":
+            outputs['C'].sv_set(MatrixArray(np.linalg.inv(arrays[0])))
+
+        elif self.operation == "FILTER":
+            locations, quaternions, scales = decompose_matrices(arrays[0])
+            if self.filter_t:
+                locations[:] = 0.0
+            if self.filter_r:
+                quaternions[:] = (1.0, 0.0, 0.0, 0.0)
+            if self.filter_s:
+                scales[:] = 1.0
+            matrices = compose_matrices(locations, quaternions_to_rotations(quaternions), scales)
+            outputs['C'].sv_set(MatrixArray(matrices))
+
+        else:  # BASIS
+            _, quaternions, _ = decompose_matrices(arrays[0])
+            rotations = quaternions_to_rotations(quaternions)
+            outputs['X'].sv_set([rotations[:, :, 0].tolist()])
+            outputs['Y'].sv_set([rotations[:, :, 1].tolist()])
+            outputs['Z'].sv_set([rotations[:, :, 2].tolist()])
+            outputs['C'].sv_set(MatrixArray(arrays[0]))
+
 
 def register():
     bpy.utils.register_class(SvMatrixMathNode)
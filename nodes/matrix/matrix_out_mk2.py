@@ -22,7 +22,9 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 from sverchok.utils.sv_transform_helper import AngleUnits, SvAngleHelper
 from sverchok.utils.nodes_mixins.recursive_nodes import SvRecursiveNode
-from mathutils import Matrix
+from sverchok.utils.matrices import (MatrixArray, matrix_array, decompose_matrices, quaternions_to_rotations,
+                                     rotations_to_eulers, quaternions_to_axis_angles)
+from mathutils import Quaternion
 
 
 mode_items = [
@@ -47,6 +49,8 @@ class SvMatrixOutNodeMK2(bpy.types.Node, SverchCustomTreeNode, SvAngleHelper, Sv
     bl_label = 'Matrix Out'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_MATRIX_OUT'
+    accepts_matrix_arrays = True
+    mutates_inputs = False
 
     flat_output: bpy.props.BoolProperty(
         name="Flat Quaternions output",
@@ -113,38 +117,51 @@ class SvMatrixOutNodeMK2(bpy.types.Node, SverchCustomTreeNode, SvAngleHelper, Sv
         elif self.mode == 'QUATERNION':
             layout.prop(self, 'flat_output')
 
+    def process(self):
+        matrices = self.inputs['Matrix'].sv_get(default=[], deepcopy=False)
+        if not isinstance(matrices, MatrixArray):
+            super().process()
+            return
+        if not any(s.is_linked for s in self.outputs):
+            return
+        # all matrices of the array are decomposed at once
+        for socket, data in zip(self.outputs, self.process_data([[matrices]])):
+            if socket.is_linked:
+                socket.sv_set(data)
+
     def process_data(self, params):
         input_M = params[0]
         outputs = self.outputs
         # decompose matrices into: Translation, Rotation (quaternion) and Scale
         result = []
         for mat_list in input_M:
-            location_list = []
-            quaternion_list = [] # rotations (as quaternions)
-            scale_list = []
+            locations, quaternions, scales = decompose_matrices(matrix_array(mat_list))
+            location_list = locations.tolist()
+            scale_list = scales.tolist()
+            quaternion_list = []  # rotations (as quaternions)
             angles = [[], [], []]
             axis_list, angle_list = [], []
-            for m in mat_list:
-                T, R, S = m.decompose()
-                location_list.append(list(T))
-                quaternion_list.append(R)
-                scale_list.append(list(S))
 
-            if self.mode == "EULER":
+            if self.mode == "QUATERNION":
+                if outputs["Quaternion"].is_linked:
+                    quaternion_list = [Quaternion(q) for q in quaternions.tolist()]
+            elif self.mode == "EULER":
                 # conversion factor from radians to the current angle units
                 au = self.angle_conversion_factor(AngleUnits.RADIANS, self.angle_units)
+                eulers = rotations_to_eulers(quaternions_to_rotations(quaternions), self.euler_order) * au
 
                 for i, name in enumerate("XYZ"):
                     if outputs["Angle " + name].is_linked:
-                        angles[i] = [q.to_euler(self.euler_order)[i] * au for q in quaternion_list]
+                        angles[i] = eulers[:, i].tolist()
             elif self.mode == "AXISANGLE":
+                axes, radians = quaternions_to_axis_angles(quaternions)
                 if outputs['Axis'].is_linked:
-                    axis_list = [tuple(q.axis) for q in quaternion_list]
+                    axis_list = axes.tolist()
 
                 if outputs['Angle'].is_linked:
                     # conversion factor from radians to the current angle units
                     au = self.angle_conversion_factor(AngleUnits.RADIANS, self.angle_units)
-                    angle_list = [q.angle * au for q in quaternion_list]
+                    angle_list = (radians * au).tolist()
 
             result.append([location_list, scale_list, quaternion_list, *angles, axis_list, angle_list])
 
@@ -158,7 +175,6 @@ class SvMatrixOutNodeMK2(bpy.types.Node, SverchCustomTreeNode, SvAngleHelper, Sv
 
 
 
-
 def register():
     bpy.utils.register_class(SvMatrixOutNodeMK2)
 
@@ -11,6 +11,7 @@ from bpy.props import IntProperty, FloatProperty, BoolProperty, EnumProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, get_data_nesting_level, ensure_nesting_level
 from sverchok.utils.relax_mesh import *
+from sverchok.utils.sv_itertools import run_steps, scaled_steps
 from sverchok.utils.nodes_mixins.sockets_config import TransformNode
 from sverchok.utils.handle_blender_data import keep_enum_reference
 
@@ -23,6 +24,7 @@ class SvRelaxMeshNode(TransformNode, bpy.types.Node, SverchCustomTreeNode):
     bl_idname = 'SvRelaxMeshNode'
     bl_label = 'Relax Mesh'
     bl_icon = 'MOD_SMOOTH'
+    mutates_inputs = False
 
     iterations: IntProperty(
         name="Iterations",
@@ -124,6 +126,9 @@ class SvRelaxMeshNode(TransformNode, bpy.types.Node, SverchCustomTreeNode):
         row.prop(self, "use_z", toggle=True)
 
     def process(self):
+        run_steps(self.process_steps())
+
+    def process_steps(self):
         if not any(output.is_linked for output in self.outputs):
             return
 
@@ -152,17 +157,22 @@ class SvRelaxMeshNode(TransformNode, bpy.types.Node, SverchCustomTreeNode):
         if self.use_z:
             used_axes.add(2)
 
+        objects = [list(zip_long_repeat(*params)) for params in
+                   zip_long_repeat(vertices_s, edges_s, faces_s, masks_s, iterations_s, factor_s)]
+        objects_number = sum(len(params) for params in objects)
+        done = 0
+
         verts_out = []
-        for params in zip_long_repeat(vertices_s, edges_s, faces_s, masks_s, iterations_s, factor_s):
-            for vertices, edges, faces, mask, iterations, factor in zip_long_repeat(*params):
+        for params in objects:
+            for vertices, edges, faces, mask, iterations, factor in params:
                 if self.algorithm == 'LLOYD':
-                    vertices = lloyd_relax(vertices, faces, iterations,
+                    steps = lloyd_relax_steps(vertices, faces, iterations,
                                     mask = mask,
                                     method = self.preserve_shape,
                                     skip_boundary = self.skip_bounds,
                                     use_axes = used_axes)
                 elif self.algorithm == 'EDGES':
-                    vertices = edges_relax(vertices, edges, faces, iterations,
+                    steps = edges_relax_steps(vertices, edges, faces, iterations,
                                     k = factor,
                                     mask = mask,
                                     method = self.preserve_shape,
@@ -170,7 +180,7 @@ class SvRelaxMeshNode(TransformNode, bpy.types.Node, SverchCustomTreeNode):
                                     skip_boundary = self.skip_bounds,
                                     use_axes = used_axes)
                 elif self.algorithm == 'FACES':
-                    vertices = faces_relax(vertices, edges, faces, iterations,
+                    steps = faces_relax_steps(vertices, edges, faces, iterations,
                                     k = factor,
                                     mask = mask,
                                     method = self.preserve_shape,
@@ -179,6 +189,8 @@ class SvRelaxMeshNode(TransformNode, bpy.types.Node, SverchCustomTreeNode):
                                     use_axes = used_axes)
                 else:
                     raise Exception("Unsupported algorithm")
+                vertices = yield from scaled_steps(steps, done / objects_number, (done + 1) / objects_number)
+                done += 1
 
             verts_out.append(vertices)
 
@@ -142,6 +142,7 @@ class SvScalarMathNodeMK4(bpy.types.Node, SverchCustomTreeNode):
     bl_idname = 'SvScalarMathNodeMK4'
     bl_label = 'Scalar Math'
     sv_icon = 'SV_SCALAR_MATH'
+    mutates_inputs = False
 
     def mode_change(self, context):
         self.update_sockets()
@@ -252,6 +253,20 @@ class SvScalarMathNodeMK4(bpy.types.Node, SverchCustomTreeNode):
         elif len(self.outputs) == 2:
             self.outputs[0].replace_socket("SvStringsSocket", "sin( x )")
 
+    def can_be_fused(self):
+        """Whether the node can be evaluated by the update system together with
+        next and previous math nodes (see UpdateTree._find_fused_chains)"""
+        return self.current_op not in ['GCD', 'ROUND-N', 'SINCOS'] and " " not in self.current_op
+
+    def calculate(self, out_numpy):
+        """Output data of the node for current data of its input sockets"""
+        current_func = func_from_mode(self.current_op)
+        params = [si.sv_get(default=[[]], deepcopy=False) for si in self.inputs]
+        matching_f = list_match_func[self.list_match]
+        desired_levels = [2 for p in params]
+        ops = [current_func, self.list_match, out_numpy]
+        return recurse_f_level_control(params, ops, math_numpy, matching_f, desired_levels)
+
     def process(self):
 
         self.ensure_enums_have_no_space(enums=["current_op"])
@@ -271,8 +286,7 @@ class SvScalarMathNodeMK4(bpy.types.Node, SverchCustomTreeNode):
                 result2 = recurse_f_level_control(params, ops2, math_numpy, matching_f, desired_levels)
                 self.outputs[1].sv_set(result2)
             else:
-                ops = [current_func, self.list_match, self.output_numpy]
-                result = recurse_f_level_control(params, ops, math_numpy, matching_f, desired_levels)
+                result = self.calculate(self.output_numpy)
 
             self.outputs[0].sv_set(result)
 
@@ -22,7 +22,8 @@ import bpy
 from bpy.props import IntProperty, StringProperty, BoolProperty, FloatProperty, FloatVectorProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, node_id, match_long_repeat
-from sverchok.utils.pulga_physics_core import pulga_system_init
+from sverchok.utils.pulga_physics_core import pulga_system_steps
+from sverchok.utils.sv_itertools import run_steps, scaled_steps
 
 FILE_NAME = 'pulga_Memory '
 
@@ -384,6 +385,15 @@ class SvPulgaPhysicsNode(bpy.types.Node, SverchCustomTreeNode):
         default=False,
         update=updateNode)
 
+    use_neighbour_list : BoolProperty(name="Neighbour List",
+        description="Compute self reactions only between near particles (faster and lighter for big systems)",
+        default=False,
+        update=updateNode)
+    attract_cutoff : FloatProperty(name="Attraction Cutoff",
+        description="Particles further than this distance will not attract each other when using Neighbour List",
+        default=10.0, min=0.0,
+        update=updateNode)
+
     def sv_init(self, context):
 
         '''create sockets'''
@@ -442,6 +452,9 @@ class SvPulgaPhysicsNode(bpy.types.Node, SverchCustomTreeNode):
         '''draw buttons on the N-panel'''
         self.draw_buttons(context, layout)
         layout.prop(self, "output_numpy", toggle=False)
+        layout.prop(self, "use_neighbour_list", toggle=False)
+        if self.use_neighbour_list and self.self_attract_M:
+            layout.prop(self, "attract_cutoff")
 
 
     def get_data(self):
@@ -464,6 +477,7 @@ class SvPulgaPhysicsNode(bpy.types.Node, SverchCustomTreeNode):
         gates_dict = {}
         gates_dict["accumulate"] = self.accumulative
         gates_dict["self_react"] = [self.self_react_M, self.self_attract_M, self.fit_M]
+        gates_dict["neighbours"] = [self.use_neighbour_list, self.attract_cutoff]
         gates_dict["Springs"] = [si["Springs"].is_linked, si["fixed_len"].is_linked]
         gates_dict["Pins"] = [si["Pins"].is_linked, si["Pins Goal Position"].is_linked]
         gates_dict["drag"] = [self.drag_M, self.fit_M]
@@ -506,6 +520,10 @@ class SvPulgaPhysicsNode(bpy.types.Node, SverchCustomTreeNode):
 
     def process(self):
         '''main node function called every update'''
+        run_steps(self.process_steps())
+
+    def process_steps(self):
+        '''generator version of the process method, yields progress of the simulation'''
 
         si = self.inputs
         so = self.outputs
@@ -526,13 +544,15 @@ class SvPulgaPhysicsNode(bpy.types.Node, SverchCustomTreeNode):
             params = self.get_data()
             gates_dict = self.fill_gates_dict()
             data, past, from_file = self.get_global_cache()
+            objects_number = len(params[0])
             temp_id = 0
             for par in zip(*params):
                 cache = self.get_local_cache(past, data, from_file, temp_id)
                 par_dict = {}
                 for idx, p in enumerate(self.sorted_props):
                     par_dict[p[0]] = par[idx]
-                cache_new = pulga_system_init(par_dict, par, gates_dict, out_lists, cache)
+                steps = pulga_system_steps(par_dict, par, gates_dict, out_lists, cache)
+                cache_new = yield from scaled_steps(steps, temp_id / objects_number, (temp_id + 1) / objects_number)
 
                 if self.accumulative:
                     self.accumulativity_set_data(cache_new, temp_id)
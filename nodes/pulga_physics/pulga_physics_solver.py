@@ -22,7 +22,8 @@ import bpy
 from bpy.props import IntProperty, StringProperty, BoolProperty, FloatProperty, FloatVectorProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, match_long_repeat
-from sverchok.utils.pulga_physics_modular_core import pulga_system_init
+from sverchok.utils.pulga_physics_modular_core import pulga_system_steps
+from sverchok.utils.sv_itertools import run_steps, scaled_steps
 
 
 class SvPulgaPhysicsSolverNode(bpy.types.Node, SverchCustomTreeNode):
@@ -285,6 +286,10 @@ class SvPulgaPhysicsSolverNode(bpy.types.Node, SverchCustomTreeNode):
 
     def process(self):
         '''main node function called every update'''
+        run_steps(self.process_steps())
+
+    def process_steps(self):
+        '''generator version of the process method, yields progress of the simulation'''
 
         si = self.inputs
         so = self.outputs
@@ -306,10 +311,12 @@ class SvPulgaPhysicsSolverNode(bpy.types.Node, SverchCustomTreeNode):
             params = self.get_data()
             gates_dict = self.fill_gates_dict()
             data, past, from_file = self.get_global_cache()
+            objects_number = len(params[0])
             temp_id = 0
             for par in zip(*params):
                 cache = self.get_local_cache(past, data, from_file, temp_id)
-                cache_new = pulga_system_init(par, gates_dict, out_lists, cache)
+                steps = pulga_system_steps(par, gates_dict, out_lists, cache)
+                cache_new = yield from scaled_steps(steps, temp_id / objects_number, (temp_id + 1) / objects_number)
 
                 if self.accumulative:
                     self.accumulativity_set_data(cache_new, temp_id)
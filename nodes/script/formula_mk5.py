@@ -18,7 +18,7 @@ from sverchok.data_structure import (updateNode,
                                      list_match_func, numpy_list_match_modes,
                                      enum_item_4)
 
-from sverchok.utils.modules.eval_formula import get_variables, safe_eval
+from sverchok.utils.modules.eval_formula import get_variables, safe_eval, compile_numpy, may_give_integers
 from sverchok.utils.sv_itertools import recurse_f_level_control
 
 def transform_data(data, transform):
@@ -41,12 +41,57 @@ def ensure_list(value):
         return value.tolist()
     return list(value)
 
+def numpy_formula_func(values, formulas, separate, var_names):
+    """
+    Evaluate formulas for all values at once by kernels of compile_numpy.
+    Returns None if some formula can't be vectorized, input values are not
+    numbers of the same type or if results of the kernels can differ from
+    per element evaluation, for example if integers of some elements became
+    floats; then the formulas should be evaluated per element.
+    """
+    formulas = [formula for formula in formulas if formula]
+    functions = [compile_numpy(formula) for formula in formulas]
+    if not functions or any(function is None for function in functions):
+        return None
+    arrays = []
+    for data in values:
+        if not isinstance(data, np.ndarray) and len(set(map(type, data))) > 1:
+            return None  # mixed ints and floats would all become floats
+        try:
+            array = np.asarray(data)
+        except ValueError:
+            return None
+        if array.ndim != 1 or array.dtype.kind not in 'biuf':
+            return None
+        arrays.append(array)
+    variables = dict(zip(var_names, arrays))
+    int_names = {name for name, array in variables.items() if array.dtype.kind in 'biu'}
+    results = []
+    for formula, function in zip(formulas, functions):
+        try:
+            result = function(variables)
+        except Exception:
+            return None
+        if result.dtype.kind == 'f' and may_give_integers(formula, int_names):
+            return None  # numpy has turned integers of some elements into floats
+        results.append(np.broadcast_to(result, arrays[0].shape).tolist())
+
+    if separate:
+        return [list(vector) for vector in zip(*results)]
+    return [value for vector in zip(*results) for value in vector]
+
 def formula_func(parameters, constant, matching_f):
 
     formulas, separate, var_names, transformations, as_list = constant
 
+    values_s = matching_f(parameters)
+    if all(transform == 'As_is' for transform in transformations):
+        object_results = numpy_formula_func(values_s, formulas, separate, var_names)
+        if object_results is not None:
+            return object_results
+
     object_results = []
-    for values in zip(*matching_f(parameters)):
+    for values in zip(*values_s):
         vals = [transform_data(d, tr) for d, tr in zip(values, transformations)]
         variables = dict(zip(var_names, vals))
         vector = []
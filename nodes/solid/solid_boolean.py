@@ -31,6 +31,7 @@ class SvSolidBooleanNode(bpy.types.Node, SverchCustomTreeNode):
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_SOLID_BOOLEAN'
     solid_catergory = "Operators"
+    is_disk_cacheable = True
 
     mode_options = [
         ("ITX", "Intersect", "", 0),
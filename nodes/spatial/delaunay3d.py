@@ -36,6 +36,8 @@ class SvDelaunay3dMk2Node(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Delaunay 3D'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_DELAUNAY'
+    is_thread_safe = True
+    mutates_inputs = False
 
     join : BoolProperty(
         name = "Join",
@@ -11,7 +11,8 @@ from bpy.props import FloatProperty, EnumProperty, IntProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, ensure_nesting_level, zip_long_repeat, get_data_nesting_level
 from sverchok.utils.field.scalar import SvScalarField
-from sverchok.utils.voronoi3d import Bounds, lloyd3d_bounded
+from sverchok.utils.voronoi3d import Bounds, lloyd3d_bounded_steps
+from sverchok.utils.sv_itertools import run_steps, scaled_steps
 from sverchok.utils.dummy_nodes import add_dummy
 from sverchok.dependencies import scipy
 
@@ -65,6 +66,9 @@ class SvLloyd3dNode(bpy.types.Node, SverchCustomTreeNode):
         layout.prop(self, "bounds_mode", text='')
 
     def process(self):
+        run_steps(self.process_steps())
+
+    def process_steps(self):
 
         if not any(socket.is_linked for socket in self.outputs):
             return
@@ -83,12 +87,19 @@ class SvLloyd3dNode(bpy.types.Node, SverchCustomTreeNode):
 
         nested_output = input_level > 3
 
+        objects = [list(zip_long_repeat(*params)) for params in
+                   zip_long_repeat(sites_in, iterations_in, clipping_in, weights_in)]
+        objects_number = sum(len(params) for params in objects)
+        done = 0
+
         verts_out = []
-        for params in zip_long_repeat(sites_in, iterations_in, clipping_in, weights_in):
+        for params in objects:
             new_verts = []
-            for sites, iterations, clipping, weights in zip_long_repeat(*params):
+            for sites, iterations, clipping, weights in params:
                 bounds = Bounds.new(self.bounds_mode, sites, clipping)
-                sites = lloyd3d_bounded(bounds, sites, iterations, weight_field = weights)
+                steps = lloyd3d_bounded_steps(bounds, sites, iterations, weight_field = weights)
+                sites = yield from scaled_steps(steps, done / objects_number, (done + 1) / objects_number)
+                done += 1
                 new_verts.append(sites)
             if nested_output:
                 verts_out.append(new_verts)
@@ -11,7 +11,8 @@ from bpy.props import FloatProperty, IntProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, ensure_nesting_level, zip_long_repeat, get_data_nesting_level
 from sverchok.utils.field.scalar import SvScalarField
-from sverchok.utils.voronoi3d import lloyd_on_mesh, lloyd_in_mesh
+from sverchok.utils.voronoi3d import lloyd_on_mesh_steps, lloyd_in_mesh_steps
+from sverchok.utils.sv_itertools import run_steps, scaled_steps
 from sverchok.utils.dummy_nodes import add_dummy
 from sverchok.dependencies import scipy
 
@@ -65,6 +66,9 @@ class SvLloydOnMeshNode(bpy.types.Node, SverchCustomTreeNode):
         self.outputs.new('SvVerticesSocket', "Sites")
 
     def process(self):
+        run_steps(self.process_steps())
+
+    def process_steps(self):
 
         if not any(socket.is_linked for socket in self.outputs):
             return
@@ -87,14 +91,21 @@ class SvLloydOnMeshNode(bpy.types.Node, SverchCustomTreeNode):
 
         nested_output = input_level > 3
 
+        objects = [list(zip_long_repeat(*params)) for params in
+                   zip_long_repeat(verts_in, faces_in, sites_in, thickness_in, iterations_in, weights_in)]
+        objects_number = sum(len(params) for params in objects)
+        done = 0
+
         verts_out = []
-        for params in zip_long_repeat(verts_in, faces_in, sites_in, thickness_in, iterations_in, weights_in):
+        for params in objects:
             new_verts = []
-            for verts, faces, sites, thickness, iterations, weights in zip_long_repeat(*params):
+            for verts, faces, sites, thickness, iterations, weights in params:
                 if self.mode == 'SURFACE':
-                    sites = lloyd_on_mesh(verts, faces, sites, thickness, iterations, weight_field = weights)
+                    steps = lloyd_on_mesh_steps(verts, faces, sites, thickness, iterations, weight_field = weights)
                 else:
-                    sites = lloyd_in_mesh(verts, faces, sites, iterations, thickness=thickness, weight_field = weights)
+                    steps = lloyd_in_mesh_steps(verts, faces, sites, iterations, thickness=thickness, weight_field = weights)
+                sites = yield from scaled_steps(steps, done / objects_number, (done + 1) / objects_number)
+                done += 1
                 new_verts.append(sites)
             if nested_output:
                 verts_out.append(new_verts)
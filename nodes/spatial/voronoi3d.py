@@ -17,6 +17,7 @@ from sverchok.utils.sv_mesh_utils import polygons_to_edges, mesh_join
 from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh, bmesh_from_pydata, bmesh_clip
 from sverchok.utils.geom import calc_bounds
 from sverchok.utils.dummy_nodes import add_dummy
+from sverchok.utils.sv_itertools import run_steps, scaled_steps
 from sverchok.dependencies import scipy
 
 if scipy is None:
@@ -33,6 +34,7 @@ else:
         bl_label = 'Voronoi 3D'
         bl_icon = 'OUTLINER_OB_EMPTY'
         sv_icon = 'SV_VORONOI'
+        mutates_inputs = False
 
         out_modes = [
             ('RIDGES', "Ridges", "Ridges", 0),
@@ -91,7 +93,8 @@ else:
             layout.prop(self, "do_clip")
             layout.prop(self, "join")
 
-        def make_regions(self, diagram):
+        def make_regions_steps(self, diagram):
+            """Yields progress after each region, returns the regions"""
             faces_per_site = defaultdict(list)
             nsites = len(diagram.point_region)
             nridges = len(diagram.ridge_points)
@@ -110,7 +113,9 @@ else:
             new_edges = []
             new_faces = []
 
-            for site_idx in sorted(faces_per_site.keys()):
+            sites = sorted(faces_per_site.keys())
+            for i, site_idx in enumerate(sites):
+                yield i / len(sites)
                 if self.closed_only and site_idx in open_sites:
                     continue
                 done_verts = dict()
@@ -194,6 +199,9 @@ else:
                 return vertices, edges, faces
 
         def process(self):
+            run_steps(self.process_steps())
+
+        def process_steps(self):
             if not any(socket.is_linked for socket in self.outputs):
                 return
 
@@ -203,7 +211,9 @@ else:
             verts_out = []
             edges_out = []
             faces_out = []
-            for sites, clipping in zip_long_repeat(vertices_s, clipping_s):
+            objects = list(zip_long_repeat(vertices_s, clipping_s))
+            for i, (sites, clipping) in enumerate(objects):
+                yield i / len(objects)
                 if isinstance(clipping, (list, tuple)):
                     clipping = clipping[0]
 
@@ -229,7 +239,9 @@ else:
                         edges_out.extend(new_edges)
                         faces_out.extend(new_faces)
                 else: # REGIONS
-                    new_verts, new_edges, new_faces = self.make_regions(diagram)
+                    steps = self.make_regions_steps(diagram)
+                    new_verts, new_edges, new_faces = yield from scaled_steps(
+                        steps, i / len(objects), (i + 1) / len(objects))
                     if self.join:
                         new_verts, new_edges, new_faces = mesh_join(new_verts, new_edges, new_faces)
                         new_verts = [new_verts]
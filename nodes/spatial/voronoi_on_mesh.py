@@ -40,6 +40,7 @@ class SvVoronoiOnMeshNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Voronoi on Mesh'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_VORONOI'
+    is_disk_cacheable = True
 
     modes = [
             ('VOLUME', "Split Volume", "Split volume of the mesh into regions of Voronoi diagram", 0),
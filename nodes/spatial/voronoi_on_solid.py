@@ -44,6 +44,7 @@ class SvVoronoiOnSolidNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Voronoi on Solid'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_VORONOI'
+    is_disk_cacheable = True
 
     modes = [
             ('SURFACE', "Surface", "Generate regions of Voronoi diagram on the surface of the solid", 0),
@@ -20,6 +20,7 @@ class SvEvalSurfaceNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Evaluate Surface'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_EVAL_SURFACE'
+    mutates_inputs = False
 
     def update_sockets(self, context):
         self.inputs[U_SOCKET].hide_safe = self.eval_mode == 'GRID' or self.input_mode == 'VERTICES'
@@ -183,16 +184,13 @@ class SvEvalSurfaceNode(bpy.types.Node, SverchCustomTreeNode):
             verts = np.apply_along_axis(lambda v : np_matrix @ v, 1, verts)
         return verts
 
-    def make_grid_input(self, surface, samples_u, samples_v):
+    def make_grid_ranges(self, surface, samples_u, samples_v):
         u_min = surface.get_u_min()
         u_max = surface.get_u_max()
         v_min = surface.get_v_min()
         v_max = surface.get_v_max()
         us = np.linspace(u_min, u_max, num=samples_u)
         vs = np.linspace(v_min, v_max, num=samples_v)
-        us, vs = np.meshgrid(us, vs)
-        us = us.flatten()
-        vs = vs.flatten()
         return us, vs
 
     def make_edges_xy(self, samples_u, samples_v):
@@ -244,7 +242,9 @@ class SvEvalSurfaceNode(bpy.types.Node, SverchCustomTreeNode):
             for surface, target_us, target_vs, target_verts, samples_u, samples_v in objects:
 
                 if self.eval_mode == 'GRID':
-                    target_us, target_vs = self.make_grid_input(surface, samples_u, samples_v)
+                    us, vs = self.make_grid_ranges(surface, samples_u, samples_v)
+                    new_verts = surface.evaluate_grid(us, vs)
+                    new_verts = np.transpose(new_verts, axes=(1,0,2)).reshape((-1, 3))
                     new_edges = self.make_edges_xy(samples_u, samples_v)
                     new_faces = self.make_faces_xy(samples_u, samples_v)
                 else:
@@ -258,7 +258,7 @@ class SvEvalSurfaceNode(bpy.types.Node, SverchCustomTreeNode):
                         target_us, target_vs = self._wrap(surface, target_us, target_vs)
                     new_edges = []
                     new_faces = []
-                new_verts = surface.evaluate_array(target_us, target_vs)
+                    new_verts = surface.evaluate_array(target_us, target_vs)
 
                 new_verts = self.build_output(surface, new_verts)
                 if not self.output_numpy:
@@ -9,128 +9,154 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, match_long_repeat, ensure_nesting_level
 from sverchok.utils.logging import info, exception
 from sverchok.utils.field.scalar import SvScalarField
-from sverchok.utils.dummy_nodes import add_dummy
-from sverchok.dependencies import scipy
-
-if scipy is None:
-    add_dummy('SvExImplSurfaceRaycastNode', "Implicit Surface Raycast", 'scipy')
-else:
-    from scipy.optimize import root_scalar
-
-    def goal(field, init, direction, iso_value):
-        def function(t):
-            p = init + t * direction
-            v = field.evaluate(p[0], p[1], p[2])
-            return v - iso_value
-        return function
-
-    def find_distance(field, init, direction, max_distance, iso_value):
-        init_value = field.evaluate(init[0], init[1], init[2])
-        sign = (init_value - iso_value)
-        distance = max_distance
-        max_sections = 10
-        i = 0
-        while True:
-            i += 1
-            if i > max_sections:
-                raise Exception(f"Can not find range where the field jumps over iso_value: init value at {init} = {init_value}, last value at {distance} = {value}")
-            p = init + direction * distance
-            value = field.evaluate(p[0], p[1], p[2])
-            #print(value)
-            if (value - iso_value) * sign < 0:
-                break
-            distance /= 2.0
-
-        return distance
-
-    def solve(field, init, direction, max_distance, iso_value):
-        distance = find_distance(field, init, direction, max_distance, iso_value)
-        sol = root_scalar(goal(field, init, direction, iso_value), method = 'ridder',
-                x0 = 0,
-                bracket = (0, distance)
-            )
-        t = sol.root
-        p = init + t*direction
-        return t, p
-
-    class SvExImplSurfaceRaycastNode(bpy.types.Node, SverchCustomTreeNode):
-        """
-        Triggers: Implicit Surface Raycast
-        Tooltip: Raycast onto implicit surface (defined by scalar field)
-        """
-        bl_idname = 'SvExImplSurfaceRaycastNode'
-        bl_label = 'Implicit Surface Raycast'
-        bl_icon = 'OUTLINER_OB_EMPTY'
-        sv_icon = 'SV_IMPL_SURF_RAYCAST'
-
-        max_distance : FloatProperty(
-                name = "Max Distance",
-                default = 10.0,
-                min = 0.0,
-                update = updateNode)
-
-        iso_value : FloatProperty(
-                name = "Iso Value",
-                default = 0.0,
-                update = updateNode)
-
-        def sv_init(self, context):
-            self.inputs.new('SvScalarFieldSocket', "Field")
-            p = self.inputs.new('SvVerticesSocket', "Vertices")
-            p.use_prop = True
-            p.default_property = (0.0, 0.0, 0.0)
-            p = self.inputs.new('SvVerticesSocket', "Direction")
-            p.use_prop = True
-            p.default_property = (0.0, 0.0, 1.0)
-            self.inputs.new('SvStringsSocket', 'IsoValue').prop_name = 'iso_value'
-            self.inputs.new('SvStringsSocket', 'MaxDistance').prop_name = 'max_distance'
-            self.outputs.new('SvVerticesSocket', 'Vertices')
-            self.outputs.new('SvStringsSocket', 'Distance')
-
-        def process(self):
-            if not any(socket.is_linked for socket in self.outputs):
-                return
-
-            field_s = self.inputs['Field'].sv_get()
-            verts_s = self.inputs['Vertices'].sv_get()
-            direction_s = self.inputs['Direction'].sv_get()
-            iso_value_s = self.inputs['IsoValue'].sv_get()
-            max_distance_s = self.inputs['MaxDistance'].sv_get()
-
-            field_s = ensure_nesting_level(field_s, 2, data_types=(SvScalarField,))
-            verts_s = ensure_nesting_level(verts_s, 3)
-            direction_s = ensure_nesting_level(direction_s, 3)
-            iso_value_s = ensure_nesting_level(iso_value_s, 2)
-            max_distance_s = ensure_nesting_level(max_distance_s, 2)
-
-            verts_out = []
-            distance_out = []
-
-            for fields, verts_i, directions, iso_value_i, max_distance_i in zip_long_repeat(field_s, verts_s, direction_s, iso_value_s, max_distance_s):
-                new_verts = []
-                new_t = []
-                for field, vert, direction, iso_value, max_distance in zip_long_repeat(fields, verts_i, directions, iso_value_i, max_distance_i):
-                    direction = np.array(direction)
-                    norm = np.linalg.norm(direction)
-                    if norm == 0:
-                        raise ValueError("Direction vector length is zero!")
-                    direction = direction / norm
-                    t, p = solve(field, np.array(vert), direction, max_distance, iso_value)
-                    #t = t * norm
-                    p = tuple(p)
-                    new_verts.append(p)
-                    new_t.append(t)
-                verts_out.append(new_verts)
-                distance_out.append(new_t)
-
-            self.outputs['Vertices'].sv_set(verts_out)
-            self.outputs['Distance'].sv_set(distance_out)
+
+def find_distances(field, inits, directions, max_distances, iso_values):
+    """
+    Distances along the rays, at which the field jumps over iso values.
+    The distance is halved for all rays, for which the field does not
+    change its sign yet.
+    """
+    init_values = field.evaluate_grid(inits[:,0], inits[:,1], inits[:,2]) - iso_values
+    distances = np.array(max_distances, dtype=np.float64)
+    values = np.empty_like(distances)
+    active = np.arange(len(distances))
+    max_sections = 10
+    i = 0
+    while len(active):
+        i += 1
+        if i > max_sections:
+            idx = active[0]
+            raise Exception(f"Can not find range where the field jumps over iso_value: init value at {inits[idx]} = {init_values[idx] + iso_values[idx]}, last value at {distances[idx]} = {values[idx] + iso_values[idx]}")
+        ps = inits[active] + directions[active] * distances[active][:, np.newaxis]
+        values[active] = field.evaluate_grid(ps[:,0], ps[:,1], ps[:,2]) - iso_values[active]
+        found = values[active] * init_values[active] < 0
+        active = active[~found]
+        distances[active] /= 2.0
+
+    return distances, init_values, values
+
+def solve(field, inits, directions, max_distances, iso_values, xtol=2e-12, maxiter=100):
+    """
+    Ridder's method, applied to all rays at once.
+    """
+    def evaluate(ts):
+        ps = inits[active] + directions[active] * ts[:, np.newaxis]
+        return field.evaluate_grid(ps[:,0], ps[:,1], ps[:,2]) - iso_values[active]
+
+    bs, fas, fbs = find_distances(field, inits, directions, max_distances, iso_values)
+    as_ = np.zeros_like(bs)
+    ts = bs.copy()
+    active = np.arange(len(bs))
+    for i in range(maxiter):
+        if not len(active):
+            break
+        a, b, fa, fb = as_[active], bs[active], fas[active], fbs[active]
+        m = (a + b) / 2.0
+        fm = evaluate(m)
+        x = m + (m - a) * np.sign(fa - fb) * fm / np.sqrt(fm * fm - fa * fb)
+        fx = evaluate(x)
+
+        # new bracket
+        middle = fm * fx < 0
+        left = ~middle & (fa * fx < 0)
+        new_a = np.where(middle, m, np.where(left, a, x))
+        new_b = np.where(middle | left, x, b)
+        new_fa = np.where(middle, fm, np.where(left, fa, fx))
+        new_fb = np.where(middle | left, fx, fb)
+        as_[active], bs[active], fas[active], fbs[active] = new_a, new_b, new_fa, new_fb
+        ts[active] = x
+
+        done = (fx == 0) | (abs(new_b - new_a) < xtol + 8.9e-16 * abs(x))
+        active = active[~done]
+
+    return ts, inits + directions * ts[:, np.newaxis]
+
+class SvExImplSurfaceRaycastNode(bpy.types.Node, SverchCustomTreeNode):
+    """
+    Triggers: Implicit Surface Raycast
+    Tooltip: Raycast onto implicit surface (defined by scalar field)
+    """
+    bl_idname = 'SvExImplSurfaceRaycastNode'
+    bl_label = 'Implicit Surface Raycast'
+    bl_icon = 'OUTLINER_OB_EMPTY'
+    sv_icon = 'SV_IMPL_SURF_RAYCAST'
+
+    max_distance : FloatProperty(
+            name = "Max Distance",
+            default = 10.0,
+            min = 0.0,
+            update = updateNode)
+
+    iso_value : FloatProperty(
+            name = "Iso Value",
+            default = 0.0,
+            update = updateNode)
+
+    def sv_init(self, context):
+        self.inputs.new('SvScalarFieldSocket', "Field")
+        p = self.inputs.new('SvVerticesSocket', "Vertices")
+        p.use_prop = True
+        p.default_property = (0.0, 0.0, 0.0)
+        p = self.inputs.new('SvVerticesSocket', "Direction")
+        p.use_prop = True
+        p.default_property = (0.0, 0.0, 1.0)
+        self.inputs.new('SvStringsSocket', 'IsoValue').prop_name = 'iso_value'
+        self.inputs.new('SvStringsSocket', 'MaxDistance').prop_name = 'max_distance'
+        self.outputs.new('SvVerticesSocket', 'Vertices')
+        self.outputs.new('SvStringsSocket', 'Distance')
+
+    def process(self):
+        if not any(socket.is_linked for socket in self.outputs):
+            return
+
+        field_s = self.inputs['Field'].sv_get()
+        verts_s = self.inputs['Vertices'].sv_get()
+        direction_s = self.inputs['Direction'].sv_get()
+        iso_value_s = self.inputs['IsoValue'].sv_get()
+        max_distance_s = self.inputs['MaxDistance'].sv_get()
+
+        field_s = ensure_nesting_level(field_s, 2, data_types=(SvScalarField,))
+        verts_s = ensure_nesting_level(verts_s, 3)
+        direction_s = ensure_nesting_level(direction_s, 3)
+        iso_value_s = ensure_nesting_level(iso_value_s, 2)
+        max_distance_s = ensure_nesting_level(max_distance_s, 2)
+
+        verts_out = []
+        distance_out = []
+
+        for fields, verts_i, directions, iso_value_i, max_distance_i in zip_long_repeat(field_s, verts_s, direction_s, iso_value_s, max_distance_s):
+            if not verts_i:
+                verts_out.append([])
+                distance_out.append([])
+                continue
+            fields, verts_i, directions, iso_value_i, max_distance_i = zip(*zip_long_repeat(fields, verts_i, directions, iso_value_i, max_distance_i))
+            verts_i = np.array(verts_i, dtype=np.float64)
+            directions = np.array(directions, dtype=np.float64)
+            norms = np.linalg.norm(directions, axis=1, keepdims=True)
+            if (norms == 0).any():
+                raise ValueError("Direction vector length is zero!")
+            directions = directions / norms
+            iso_value_i = np.array(iso_value_i, dtype=np.float64)
+            max_distance_i = np.array(max_distance_i, dtype=np.float64)
+
+            new_verts = np.empty_like(verts_i)
+            new_t = np.empty(len(verts_i))
+            # rays are solved together per field
+            field_idxs = dict()
+            for i, field in enumerate(fields):
+                field_idxs.setdefault(id(field), (field, []))[1].append(i)
+            for field, idxs in field_idxs.values():
+                ts, ps = solve(field, verts_i[idxs], directions[idxs], max_distance_i[idxs], iso_value_i[idxs])
+                new_t[idxs] = ts
+                new_verts[idxs] = ps
+            verts_out.append(new_verts.tolist())
+            distance_out.append(new_t.tolist())
+
+        self.outputs['Vertices'].sv_set(verts_out)
+        self.outputs['Distance'].sv_set(distance_out)
 
 def register():
-    if scipy is not None:
-        bpy.utils.register_class(SvExImplSurfaceRaycastNode)
+    bpy.utils.register_class(SvExImplSurfaceRaycastNode)
 
 def unregister():
-    if scipy is not None:
-        bpy.utils.unregister_class(SvExImplSurfaceRaycastNode)
-
+    bpy.utils.unregister_class(SvExImplSurfaceRaycastNode)
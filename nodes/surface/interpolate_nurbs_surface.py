@@ -25,6 +25,7 @@ class SvExInterpolateNurbsSurfaceNode(bpy.types.Node, SverchCustomTreeNode):
     bl_idname = 'SvExInterpolateNurbsSurfaceNode'
     bl_label = 'Interpolate NURBS Surface'
     bl_icon = 'SURFACE_NSURFACE'
+    is_thread_safe = True
 
     input_modes = [
             ('1D', "Single list", "List of all control points (concatenated)", 1),
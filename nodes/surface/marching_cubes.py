@@ -30,6 +30,7 @@ class SvExMarchingCubesNode(DraftMode, bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Marching Cubes'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_EX_MCUBES'
+    is_disk_cacheable = True
 
     iso_value : FloatProperty(
             name = "Value",
@@ -251,7 +252,7 @@ class SvExMarchingCubesNode(DraftMode, bpy.types.Node, SverchCustomTreeNode):
             else: # python
                 new_verts, new_faces = isosurface_np(func_values, value)
                 new_verts = self.scale_back(b1n, b2n, samples_x, samples_y, samples_z, new_verts)
-                new_verts = new_verts.tolist()
+                new_verts, new_faces = new_verts.tolist(), new_faces.tolist()
                 new_normals = []
 
             prev_field = field
@@ -8,7 +8,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, StringProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, zip_long_repeat, match_long_repeat,
                                      ensure_nesting_level)
-from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled
+from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled, safe_eval_numpy
 from sverchok.utils.script_importhelper import safe_names_np
 from sverchok.utils.math import (
             from_cylindrical, from_spherical,
@@ -74,7 +74,7 @@ class SvSurfaceFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
     use_numpy_function : BoolProperty(
         name = "Vectorize",
-        description = "Vectorize formula computations; disable this if you have troubles with some functions",
+        description = "Use NumPy versions of functions to vectorize formula computations; disable this if you have troubles with some functions",
         default = True,
         update = updateNode)
 
@@ -124,6 +124,16 @@ class SvSurfaceFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         compiled1 = sv_compile(self.formula1)
         compiled2 = sv_compile(self.formula2)
         compiled3 = sv_compile(self.formula3)
+        formula1, formula2, formula3 = self.formula1, self.formula2, self.formula3
+
+        if self.use_numpy_function:
+            def evaluate(compiled, formula):
+                return safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+        else:
+            # formulas are evaluated with functions of math module,
+            # but for all values at once where it gives the same results
+            def evaluate(compiled, formula):
+                return safe_eval_numpy(formula, variables)
 
         if self.output_mode == 'XYZ':
             def out_coordinates(x, y, z):
@@ -137,9 +147,9 @@ class SvSurfaceFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
         def function(u, v):
             variables.update(dict(u=u, v=v))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
+            v1 = evaluate(compiled1, formula1)
+            v2 = evaluate(compiled2, formula2)
+            v3 = evaluate(compiled3, formula3)
 
             if not isinstance(v1, np.ndarray):
                 v1 = np.full_like(u, v1)
@@ -219,10 +229,7 @@ class SvSurfaceFormulaNode(bpy.types.Node, SverchCustomTreeNode):
             for u_min, u_max, v_min, v_max, *var_values in var_values_s:
                 variables = dict(zip(var_names, var_values))
                 function = self.make_function(variables)
-                if self.use_numpy_function:
-                    function_vector = self.make_function_vector(variables)
-                else:
-                    function_vector = None
+                function_vector = self.make_function_vector(variables)
                 new_surface = SvLambdaSurface(function, function_vector)
                 new_surface.u_bounds = (u_min, u_max)
                 new_surface.v_bounds = (v_min, v_max)
@@ -97,6 +97,7 @@ class SvVectorMathNodeMK3(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Vector Math'
     bl_icon = 'THREE_DOTS'
     sv_icon = 'SV_VECTOR_MATH'
+    mutates_inputs = False
 
     def mode_change(self, context):
         self.update_sockets()
@@ -179,15 +180,14 @@ class SvVectorMathNodeMK3(bpy.types.Node, SverchCustomTreeNode):
                 s = self.inputs[idx].replace_socket(socket_type.get(t_in), renames[idx])
                 s.prop_name = f'v3_input_{idx}' if t_in == 'v' else 'amount'
 
-    def process(self):
-
-        self.ensure_enums_have_no_space(enums=["current_op"])
-
-        inputs, outputs = self.inputs, self.outputs
-
-        if not outputs[0].is_linked:
-            return
+    def can_be_fused(self):
+        """Whether the node can be evaluated by the update system together with
+        next and previous math nodes (see UpdateTree._find_fused_chains)"""
+        return self.implementation == 'NumPy' and " " not in self.current_op
 
+    def calculate(self, out_numpy):
+        """Output data of the node for current data of its input sockets"""
+        inputs = self.inputs
         func = self.implementation_func_dict[self.implementation][0].get(self.current_op)[1]
         num_inputs = len(inputs)
 
@@ -208,9 +208,17 @@ class SvVectorMathNodeMK3(bpy.types.Node, SverchCustomTreeNode):
             recurse_func = self.implementation_func_dict[self.implementation][2]
 
         if self.implementation == 'NumPy':
-            params.append(self.output_numpy)
-        result = recurse_func(*params)
-        outputs[0].sv_set(result)
+            params.append(out_numpy)
+        return recurse_func(*params)
+
+    def process(self):
+
+        self.ensure_enums_have_no_space(enums=["current_op"])
+
+        if not self.outputs[0].is_linked:
+            return
+
+        self.outputs[0].sv_set(self.calculate(self.output_numpy))
 
     def ensure_enums_have_no_space(self, enums=None):
         """
@@ -10,13 +10,14 @@ import math
 import numpy as np
 import bpy
 from bpy.props import StringProperty, BoolProperty, EnumProperty
-from mathutils import Vector, Matrix
+from mathutils import Vector
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, replace_socket
 from sverchok.utils.nodes_mixins.generating_objects import SvMeshData, SvViewerNode
 from sverchok.ui.sv_icons import custom_icon
 from sverchok.utils.handle_blender_data import correct_collection_length
+from sverchok.utils.matrices import matrix_array
 
 def auto_release(parent, childs_name):
     for obj in bpy.data.objects[parent].children:
@@ -25,36 +26,26 @@ def auto_release(parent, childs_name):
 
 def generate_mesh_data(transforms, child, mode, ignore_location):
 
-    A = Vector((-1, -1/3, 0))
-    B = Vector((1, -1/3, 0))
-    C = Vector((0, 2/3, 0))
-    if ignore_location:
-        if mode == "FACES":
-            mtrx = Matrix.Translation(child.matrix_world.to_translation()).inverted()
-            verts = []
-            add_verts = verts.extend
-            for _M in transforms:
-                M = mtrx @ _M
-                add_verts([(M @ A)[:], (M @ B)[:], (M @ C)[:]])
-            faces = np.arange(3*len(transforms)).reshape(-1, 3).tolist()
-        elif mode == "VERTS":
+    if mode == "FACES":
+        # one triangle per matrix, all of them are transformed at once
+        triangle = np.array([(-1, -1/3, 0), (1, -1/3, 0), (0, 2/3, 0)])
+        matrices = matrix_array(transforms)
+        locations = matrices[:, :3, 3]
+        if ignore_location:
+            locations = locations - np.array(child.matrix_world.to_translation())
+        verts = np.einsum('nij,kj->nki', matrices[:, :3, :3], triangle) + locations[:, np.newaxis]
+        verts = verts.reshape((-1, 3)).astype(np.float32)
+        faces = np.arange(len(verts)).reshape(-1, 3).tolist()
+    elif mode == "VERTS":
+        if ignore_location:
             loc = child.location
             if isinstance(transforms[0], np.ndarray):
                 verts = transforms[0] -loc
             else:
                 verts = [(Vector(V) -loc)[:] for V in transforms[0]]
-            faces = []
-    else:
-        if mode == "FACES":
-            verts = []
-            add_verts = verts.extend
-            for M in transforms:
-                add_verts([(M @ A)[:], (M @ B)[:], (M @ C)[:]])
-            faces = np.arange(3*len(transforms)).reshape(-1, 3).tolist()
-
-        elif mode == "VERTS":
+        else:
             verts = transforms[0]
-            faces = []
+        faces = []
 
     return verts, faces
 
@@ -64,6 +55,8 @@ class SvDupliInstancesMK5(bpy.types.Node, SverchCustomTreeNode, SvViewerNode):
     bl_label = 'Dupli Instancer'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_DUPLI_INSTANCER'
+    accepts_matrix_arrays = True
+    mutates_inputs = False
 
     def update_visibility(self, context):
         try:
@@ -13,6 +13,7 @@ from bpy.props import BoolProperty, StringProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 from sverchok.utils.nodes_mixins.generating_objects import SvViewerNode
+from sverchok.utils.matrices import MatrixArray
 
 
 class SvInstancerNodeMK3(SvViewerNode, bpy.types.Node, SverchCustomTreeNode):
@@ -25,6 +26,8 @@ class SvInstancerNodeMK3(SvViewerNode, bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Obj instancer'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_INSTANCER'
+    accepts_matrix_arrays = True
+    mutates_inputs = False
 
     def update_full_copy(self, context):
         if self.full_copy:
@@ -54,6 +57,9 @@ class SvInstancerNodeMK3(SvViewerNode, bpy.types.Node, SverchCustomTreeNode):
 
         matrices = self.inputs['matrix'].sv_get(deepcopy=False, default=[])
         objects = self.inputs['objects'].sv_get(deepcopy=False, default=[])
+        if isinstance(matrices, MatrixArray):
+            # Blender reads nested sequences of matrix properties column by column
+            matrices = matrices.array.transpose((0, 2, 1))
 
         objects = [obj for obj, m in zip(cycle(objects), matrices)]
         meshes = [obj.data for obj, m in zip(cycle(objects), matrices)]
@@ -31,6 +31,8 @@ class SvMeshViewer(Show3DProperties, SvViewerNode, SverchCustomTreeNode, bpy.typ
     bl_label = 'Mesh Viewer'
     bl_icon = 'OUTLINER_OB_MESH'
     sv_icon = 'SV_BMESH_VIEWER'
+    mutates_inputs = False
+    accepts_mesh_lists = True
 
     replacement_nodes = [('SvViewerDrawMk4', 
                             dict(vertices = 'Vertices',
@@ -121,8 +123,10 @@ class SvMeshViewer(Show3DProperties, SvViewerNode, SverchCustomTreeNode, bpy.typ
             return
 
         verts = self.inputs['vertices'].sv_get(deepcopy=False, default=[])
-        edges = self.inputs['edges'].sv_get(deepcopy=False, default=[[]])
-        faces = self.inputs['faces'].sv_get(deepcopy=False, default=[[]])
+        edges = me.as_nested_lists(self.inputs['edges'].sv_get(deepcopy=False, default=[[]]))
+        faces = me.as_nested_lists(self.inputs['faces'].sv_get(deepcopy=False, default=[[]]))
+        if isinstance(verts, me.MeshListElements):
+            verts = verts.to_arrays()  # fast update of vertices positions
         mat_indexes = self.inputs['material_idx'].sv_get(deepcopy=False, default=[[]])
         matrices = self.inputs['matrix'].sv_get(deepcopy=False, default=[])
 
@@ -25,6 +25,7 @@ class SvPolylineViewerNode(SvViewerNode, bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Polyline Viewer'
     bl_icon = 'MOD_CURVE'
     sv_icon = 'SV_POLYLINE_VIEWER'
+    mutates_inputs = False
 
     curve_data: bpy.props.CollectionProperty(type=SvCurveData, options={'SKIP_SAVE'})
     material: bpy.props.PointerProperty(type=bpy.types.Material, update=updateNode)
@@ -518,6 +518,7 @@ class SvViewerDrawMk4(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Viewer Draw'
     bl_icon = 'GREASEPENCIL'
     sv_icon = 'SV_DRAW_VIEWER'
+    mutates_inputs = False
 
     replacement_nodes = [('SvMeshViewer',
                             dict(Vertices = 'vertices',
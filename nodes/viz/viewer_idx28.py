@@ -34,6 +34,7 @@ class SvIDXViewer28(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Viewer Index+'
     bl_icon = 'INFO'
     sv_icon = 'SV_INDEX_VIEWER'
+    mutates_inputs = False
 
     def get_scale(self):
         try:
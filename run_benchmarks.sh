@@ -0,0 +1,17 @@
+#!/bin/bash
+
+# Headless benchmarks of node trees, see utils/benchmark.py for options, e.g.
+#
+# $ ./run_benchmarks.sh --output results.json --baseline baseline.json
+#
+# If your blender is not available as just "blender" command, then you need
+# to specify path to blender when running this script, e.g.
+#
+# $ BLENDER=~/soft/blender-3.0/blender ./run_benchmarks.sh
+#
+
+set -e
+
+BLENDER=${BLENDER:-blender}
+
+$BLENDER -b --addons sverchok --python utils/benchmark.py --python-exit-code 1 -- $@
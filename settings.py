@@ -9,6 +9,7 @@ from sverchok.dependencies import sv_dependencies, pip, ensurepip, draw_message,
 from sverchok import data_structure
 from sverchok.core import tasks # don't remove this should fix #4229 (temp solution)
 from sverchok.core import handlers
+from sverchok.core import socket_data
 from sverchok.utils import logging
 from sverchok.utils.sv_gist_tools import TOKEN_HELP_URL
 from sverchok.utils.sv_extra_addons import draw_extra_addons
@@ -150,6 +151,19 @@ class SvSelectFreeCadPath(bpy.types.Operator):
         context.window_manager.fileselect_add(self)
         return {'RUNNING_MODAL'}
 
+class SvClearDiskCache(bpy.types.Operator):
+    """Remove all results of nodes saved in the disk cache"""
+    bl_idname = "node.sv_clear_disk_cache"
+    bl_label = "Clear disk cache"
+    bl_options = {'REGISTER', 'INTERNAL'}
+
+    def execute(self, context):
+        from sverchok.core.disk_cache import DiskCache, cache_directory
+        directory = cache_directory()
+        if directory is not None:
+            DiskCache(directory).clear()
+        return {'FINISHED'}
+
 class SvSetFreeCadPath(bpy.types.Operator):
     """Save FreeCAD path in system"""
     bl_idname = "node.sv_set_freecad_path"
@@ -182,6 +196,9 @@ class SverchokPreferences(AddonPreferences):
     def set_frame_change(self, context):
         handlers.set_frame_change(self.frame_change_mode)
 
+    def update_input_data_mode(self, context):
+        socket_data.set_input_data_mode(self.input_data_mode)
+
     def update_theme(self, context):
         color_def.rebuild_color_cache()
         if self.auto_apply_theme:
@@ -291,6 +308,22 @@ class SverchokPreferences(AddonPreferences):
         default="POST",
         update=set_frame_change)
 
+    input_data_modes = [
+        ("COPY", "Copy", "Nodes get copies of their input data, unless they declare that they don't change it", 0),
+        ("SHARE", "Share", "Nodes get their input data without copying, unless they declare that they change it. "
+                           "It's faster but nodes which change input data without declaring it "
+                           "can spoil data of other nodes", 1),
+        ("CHECK", "Check", "Like Share but nodes which change input data without declaring it "
+                           "are reported in the log. It's slower", 2),
+    ]
+
+    input_data_mode: EnumProperty(
+        items=input_data_modes,
+        name="Input data",
+        description="How nodes get data of their linked input sockets",
+        default="COPY",
+        update=update_input_data_mode)
+
     #  Menu settings
 
     show_icons: BoolProperty(
@@ -367,6 +400,17 @@ class SverchokPreferences(AddonPreferences):
     ##
     datafiles = os.path.join(bpy.utils.user_resource('DATAFILES', path='sverchok', create=True))
 
+    disk_cache_directory: StringProperty(
+        name="Disk cache directory",
+        description="Directory where results of heavy nodes are saved in trees with the disk cache option",
+        default=os.path.join(datafiles, "node_cache"),
+        subtype='DIR_PATH')
+    disk_cache_size: IntProperty(
+        name="Disk cache size (MB)",
+        description="When the cache is bigger the least recently used results are removed",
+        default=2048,
+        min=1)
+
     external_editor: StringProperty(description='which external app to invoke to view sources')
     real_sverchok_path: StringProperty(description='use with symlinked to get correct src->dst')
 
@@ -452,8 +496,15 @@ class SverchokPreferences(AddonPreferences):
         col2box = col2.box()
         col2box.label(text="Debug:")
         col2box.prop(self, "show_debug")
+        col2box.prop(self, "input_data_mode")
         col2box.prop(self, "developer_mode")
 
+        cache_box = col2.box()
+        cache_box.label(text="Disk cache:")
+        cache_box.prop(self, "disk_cache_directory", text="Directory")
+        cache_box.prop(self, "disk_cache_size", text="Size (MB)")
+        cache_box.operator("node.sv_clear_disk_cache")
+
         log_box = col2.box()
         log_box.label(text="Logging:")
         log_box.prop(self, "log_level")
@@ -620,6 +671,7 @@ def register():
     bpy.utils.register_class(SvExPipInstall)
     bpy.utils.register_class(SvExEnsurePip)
     bpy.utils.register_class(SvSetFreeCadPath)
+    bpy.utils.register_class(SvClearDiskCache)
     bpy.utils.register_class(SvSelectFreeCadPath)
     bpy.utils.register_class(SverchokPreferences)
 
@@ -627,6 +679,7 @@ def register():
 def unregister():
     bpy.utils.unregister_class(SverchokPreferences)
     bpy.utils.unregister_class(SvSelectFreeCadPath)
+    bpy.utils.unregister_class(SvClearDiskCache)
     bpy.utils.unregister_class(SvSetFreeCadPath)
     bpy.utils.unregister_class(SvExEnsurePip)
     bpy.utils.unregister_class(SvExPipInstall)
@@ -0,0 +1,45 @@
+from sverchok.dependencies import scipy
+from sverchok.utils.testing import SverchokTestCase, EmptyTreeTestCase
+from sverchok.utils.benchmark import compare_results, benchmark_tree, SYNTHETIC_TREES
+
+
+def make_results(tree_time, node_times):
+    nodes = {name: {'bl_idname': 'Node', 'category': category, 'time': time}
+             for name, (category, time) in node_times.items()}
+    return {'trees': {'Tree': {'time': tree_time, 'nodes': nodes}}}
+
+
+class BenchmarkCompareTests(SverchokTestCase):
+    def test_no_regressions(self):
+        baseline = make_results(1.0, {'A': ('curve', 0.5), 'B': ('surface', 0.5)})
+        results = make_results(1.1, {'A': ('curve', 0.55), 'B': ('surface', 0.001)})
+        self.assertEqual(compare_results(results, baseline), [])
+
+    def test_regressions(self):
+        baseline = make_results(1.0, {'A': ('curve', 0.5), 'B': ('surface', 0.5)})
+        results = make_results(1.5, {'A': ('curve', 0.5), 'B': ('surface', 1.0)})
+        regressions = compare_results(results, baseline)
+        self.assertEqual(len(regressions), 2)
+        self.assertIn('[surface]', regressions[1])
+
+    def test_small_times_ignored(self):
+        baseline = make_results(0.001, {'A': ('field', 0.001)})
+        results = make_results(0.002, {'A': ('field', 0.002)})
+        self.assertEqual(compare_results(results, baseline), [])
+
+
+class SyntheticTreesTests(EmptyTreeTestCase):
+    def test_terminal_nodes_evaluated(self):
+        # nodes skip evaluation if their outputs are not linked
+        for name, builder in SYNTHETIC_TREES.items():
+            if name == 'synthetic_spatial' and scipy is None:
+                continue
+            with self.subTest(tree=name):
+                self.tree.nodes.clear()
+                builder(self.tree)
+                results = benchmark_tree(self.tree, repeat=1)
+                terminal_nodes = {link.from_node.name for link in self.tree.links
+                                  if link.to_node.bl_idname == 'ListLengthNode'}
+                self.assertTrue(terminal_nodes)
+                for node_name in terminal_nodes:
+                    self.assertGreater(results['nodes'][node_name]['time'], 1e-4, node_name)
@@ -0,0 +1,77 @@
+import os
+import tempfile
+from hashlib import blake2b
+from pathlib import Path
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.core.socket_data import sv_get_socket, sv_set_socket, sv_forget_socket
+from sverchok.core.disk_cache import DiskCache, _update_hash
+
+
+class FakeSocket:
+    def __init__(self, socket_id, identifier, node):
+        self.socket_id = socket_id
+        self.identifier = identifier
+        self.node = node
+        self.objects_number = 0
+
+
+class FakeNode:
+    name = "Fake node"
+
+    def __init__(self):
+        self.outputs = [FakeSocket(f"disk_cache_test_{i}", f"out{i}", self) for i in range(2)]
+
+
+def data_hash(data):
+    hash_ = blake2b()
+    _update_hash(hash_, data)
+    return hash_.hexdigest()
+
+
+class DiskCacheTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(Path(self.temp_dir.name))
+        self.node = FakeNode()
+
+    def tearDown(self):
+        for socket in self.node.outputs:
+            sv_forget_socket(socket)
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_hash(self):
+        self.assertEqual(data_hash([[(0, 0, 0), (1, 0, 0)]]), data_hash([[(0, 0, 0), (1, 0, 0)]]))
+        self.assertEqual(data_hash([np.arange(6.0)]), data_hash([np.arange(6.0)]))
+        self.assertNotEqual(data_hash([[(0, 0, 0)]]), data_hash([[(0, 0, 1)]]))
+        self.assertNotEqual(data_hash([[[0, 1, 2], [2, 3]]]), data_hash([[[0, 1], [2, 3]]]))
+        self.assertNotEqual(data_hash([np.arange(6.0)]), data_hash([np.arange(6.0).reshape((2, 3))]))
+
+    def test_save_load(self):
+        verts = [np.random.default_rng(1).random((1000, 3))]
+        faces = [[(0, 1, 2)]]
+        sv_set_socket(self.node.outputs[0], verts)
+        sv_set_socket(self.node.outputs[1], faces)
+        self.cache.save(self.node, "key")
+        for socket in self.node.outputs:
+            sv_forget_socket(socket)
+
+        self.assertFalse(self.cache.load(self.node, "other_key"))
+        self.assertTrue(self.cache.load(self.node, "key"))
+        loaded_verts = sv_get_socket(self.node.outputs[0], deepcopy=False)
+        self.assertIsInstance(loaded_verts[0], np.memmap)
+        self.assertTrue(np.array_equal(loaded_verts[0], verts[0]))
+        self.assertEqual(sv_get_socket(self.node.outputs[1], deepcopy=False), faces)
+
+    def test_prune(self):
+        sv_set_socket(self.node.outputs[0], [np.zeros((1000, 3))])
+        for key in ["old", "new"]:
+            self.cache.save(self.node, key)
+        os.utime(self.cache.directory / "old", (0, 0))
+        self.cache.prune(self.cache.size() - 1)
+        self.assertFalse(self.cache.load(self.node, "old"))
+        self.assertTrue(self.cache.load(self.node, "new"))
@@ -0,0 +1,48 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.modules.eval_formula import safe_eval, compile_numpy, safe_eval_numpy, may_give_integers
+
+
+class CompileNumpyTests(SverchokTestCase):
+    def assert_same_as_safe_eval(self, formula, xs, ys):
+        function = compile_numpy(formula)
+        self.assertIsNotNone(function)
+        results = np.broadcast_to(function(dict(x=xs, y=ys)), xs.shape).tolist()
+        expected = [safe_eval(formula, dict(x=x, y=y)) for x, y in zip(xs.tolist(), ys.tolist())]
+        for result, value in zip(results, expected):
+            self.assertAlmostEqual(result, value, places=10)
+
+    def test_vectorized(self):
+        rng = np.random.default_rng(0)
+        xs = rng.uniform(-3, 3, 50)
+        ys = rng.integers(-5, 6, 50)
+        formulas = ["x*y - 2", "sin(x)*cos(y) + pi", "x if x > 0 else 0.0", "-1 < x < 1 and y != 0",
+                    "not x > 1 or y", "max(x, y, 0.5)", "floor(x) + ceil(x) * trunc(x)", "int(x) // 2 + y % 3",
+                    "abs(y) ** 2", "sign(x)", "log(abs(x) + 1, 2)", "(y > 0) + (y > 1)", "float(y) / 3"]
+        for formula in formulas:
+            with self.subTest(formula=formula):
+                self.assert_same_as_safe_eval(formula, xs, ys)
+
+    def test_not_vectorizable(self):
+        formulas = ["[v for v in x]", "len(x)", "np.sin(x)", "modf(x)", "(x, y)", "Vector((x, y, 0))", "sin"]
+        for formula in formulas:
+            with self.subTest(formula=formula):
+                self.assertIsNone(compile_numpy(formula))
+
+    def test_fallback(self):
+        # math functions raise errors and integers do not overflow
+        xs = np.array([-4.0, 4.0])
+        with self.assertRaises(ValueError):
+            safe_eval_numpy("sqrt(x)", dict(x=xs))
+        with self.assertRaises(ZeroDivisionError):
+            safe_eval_numpy("1 // x", dict(x=np.array([1, 0])))
+        result = safe_eval_numpy("x ** 70", dict(x=np.array([3, 2])))
+        self.assertEqual(result.tolist(), [3 ** 70, 2 ** 70])
+
+    def test_may_give_integers(self):
+        self.assertTrue(may_give_integers("max(x, y)", {'x'}))
+        self.assertTrue(may_give_integers("x if x > 0 else 0", set()))
+        self.assertTrue(may_give_integers("floor(x) * 2", set()))
+        self.assertFalse(may_give_integers("x * 2 + sin(y)", {'y'}))
+        self.assertFalse(may_give_integers("x / 2", {'x'}))
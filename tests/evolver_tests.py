@@ -0,0 +1,23 @@
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.nodes.logic.evolver import FitnessCache
+
+
+class FitnessCacheTests(SverchokTestCase):
+    def test_genes(self):
+        cache = FitnessCache()
+        cache.add([1.5, [1, 2], [[0.0, 1.0, 2.0]]], 10)
+        self.assertEqual(cache.get([1.5, [1, 2], [[0.0, 1.0, 2.0]]]), 10)
+        self.assertIsNone(cache.get([1.5, [2, 1], [[0.0, 1.0, 2.0]]]))
+        cache.add([0], 0)
+        self.assertEqual(cache.get([0]), 0)
+        self.assertEqual(cache.hits, 2)
+
+    def test_size(self):
+        cache = FitnessCache(max_size=2)
+        cache.add([1], 1)
+        cache.add([2], 2)
+        cache.get([1])
+        cache.add([3], 3)
+        self.assertEqual(cache.get([1]), 1)
+        self.assertIsNone(cache.get([2]))
+        self.assertEqual(cache.get([3]), 3)
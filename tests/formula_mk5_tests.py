@@ -0,0 +1,23 @@
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.nodes.script.formula_mk5 import numpy_formula_func
+
+
+class NumpyFormulaTests(SverchokTestCase):
+    def test_same_types(self):
+        results = numpy_formula_func([[1, 2, 3]], ["x * 2"], False, ['x'])
+        self.assertEqual(results, [2, 4, 6])
+        self.assertIsInstance(results[0], int)
+
+    def test_mixed_types(self):
+        # numpy would turn all values into floats
+        self.assertIsNone(numpy_formula_func([[1, 2.5]], ["x * 2"], False, ['x']))
+
+    def test_mixed_variables(self):
+        # integers of some elements would become floats
+        self.assertIsNone(numpy_formula_func([[2, 3], [2.5, 1.5]], ["max(x, y)"], False, ['x', 'y']))
+        self.assertIsNone(numpy_formula_func([[3, -1]], ["x if x > 0 else 0.5"], False, ['x']))
+        self.assertIsNone(numpy_formula_func([[1.5, -1.5]], ["x if x > 0 else 0"], False, ['x']))
+
+    def test_float_results(self):
+        results = numpy_formula_func([[1.5, 2.5], [2, 3]], ["x * 2 + y", "y / 2"], True, ['x', 'y'])
+        self.assertEqual(results, [[5.0, 1.0], [8.0, 1.5]])
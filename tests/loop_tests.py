@@ -0,0 +1,96 @@
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.core.socket_data import sv_get_socket_data, sv_set_socket_data
+from sverchok.nodes.logic.loop_out import SvLoopOutNode, LoopBody, LoopNodeError
+
+
+class FakeNode:
+    def __init__(self, name, is_scene_dependent=False):
+        self.name = name
+        self.outputs = [f'{name}_output']
+        self.is_scene_dependent = is_scene_dependent
+
+
+class FakeTree:
+    def __init__(self, previous_sockets):
+        self._previous_sockets = previous_sockets
+        self.updated = []
+
+    def previous_sockets(self, node):
+        return self._previous_sockets[node.name]
+
+    def update_node(self, node, suppress=True):
+        self.updated.append(node.name)
+
+
+class UpdateLoopNodesTests(SverchokTestCase):
+    def test_skip_unchanged(self):
+        # number -> a -> b, constant -> c, scene -> d
+        nodes = [FakeNode('a'), FakeNode('b'), FakeNode('c'), FakeNode('d', is_scene_dependent=True)]
+        tree = FakeTree({'a': ['number'], 'b': ['a_output'], 'c': ['constant'], 'd': [None]})
+
+        changed = {'number'}
+        SvLoopOutNode.update_loop_nodes(tree, nodes, changed)
+        self.assertEqual(tree.updated, ['a', 'b', 'd'])
+        self.assertEqual(changed, {'number', 'a_output', 'b_output', 'd_output'})
+
+        tree.updated.clear()
+        SvLoopOutNode.update_loop_nodes(tree, nodes)
+        self.assertEqual(tree.updated, ['a', 'b', 'c', 'd'])
+
+
+class ThreadSocket:
+    def __init__(self, node, name):
+        self.node = node
+        self.name = name
+        self.socket_id = f'{node.name}.{name}'
+        self.bl_idname = 'SvStringsSocket'
+
+
+class ThreadSockets(list):
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return next(s for s in self if s.name == key)
+        return super().__getitem__(key)
+
+
+class ThreadNode:
+    """Doubles values of its input or raises an error if it's broken"""
+    is_thread_safe = True
+
+    def __init__(self, name, inputs=(), outputs=(), broken=False):
+        self.name = name
+        self.inputs = ThreadSockets(ThreadSocket(self, n) for n in inputs)
+        self.outputs = ThreadSockets(ThreadSocket(self, n) for n in outputs)
+        self.broken = broken
+
+    def process(self):
+        if self.broken:
+            raise ValueError(f'{self.name} failed')
+        data = sv_get_socket_data(self.inputs[0].socket_id)
+        sv_set_socket_data(self.outputs[0].socket_id, [[v * 2 for v in data]])
+
+
+class LoopBodyTests(SverchokTestCase):
+    def make_body(self, broken=False):
+        loop_in = ThreadNode('in', outputs=['Loop Out', 'Loop Number', 'Total Loops', 'Data 0'])
+        loop_in.skip_unchanged = False
+        loop_in.print_to_console = False
+        node = ThreadNode('a', inputs=['Data'], outputs=['Data'], broken=broken)
+        loop_out = ThreadNode('out', inputs=['Loop In', 'Break', 'Data 0'], outputs=['Data 0'])
+        tree = FakeTree({'a': [loop_in.outputs['Data 0']],
+                         'out': [loop_in.outputs['Loop Out'], None, node.outputs['Data']]})
+        return LoopBody(tree, loop_in, loop_out, [node]), node
+
+    def test_evaluate_item(self):
+        body, _ = self.make_body()
+        item_data, layer = body.evaluate_item(1, (3,), (1,))
+        self.assertEqual(item_data, [[6]])
+        self.assertEqual(layer['a.Data'], [[6]])
+        self.assertIsNone(sv_get_socket_data('a.Data'))  # the data is isolated
+
+    def test_error(self):
+        body, node = self.make_body(broken=True)
+        with self.assertRaises(LoopNodeError) as context:
+            body.evaluate_item(1, (3,), (1,))
+        self.assertIs(context.exception.node, node)
+        self.assertEqual(str(context.exception), 'a failed')
@@ -0,0 +1,93 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.utils.curve.primitives import SvCircle
+from sverchok.utils.surface.core import SvLambdaSurface
+from sverchok.utils.manifolds import (
+        nearest_point_on_surface, refine_nearest_on_surface, refine_nearest_on_curve,
+        ortho_project_curve, ortho_project_curve_array, raycast_surface)
+from sverchok.dependencies import scipy
+
+
+def sphere_patch():
+    def function(us, vs):
+        return np.stack((np.cos(vs) * np.cos(us), np.cos(vs) * np.sin(us), np.sin(vs)), axis=-1)
+    surface = SvLambdaSurface(function, function)
+    surface.u_bounds = (0.0, np.pi)
+    surface.v_bounds = (-1.0, 1.0)
+    return surface
+
+
+class NearestPointTests(SverchokTestCase):
+    def test_surface(self):
+        rng = np.random.default_rng(1)
+        us = rng.uniform(0.1, np.pi - 0.1, 200)
+        vs = rng.uniform(-0.9, 0.9, 200)
+        directions = np.stack((np.cos(vs) * np.cos(us), np.cos(vs) * np.sin(us), np.sin(vs)), axis=-1)
+        points = directions * rng.uniform(0.5, 2.0, (200, 1))
+
+        result_us, result_vs, converged = refine_nearest_on_surface(points, sphere_patch(),
+                                                np.full(200, np.pi / 2), np.zeros(200))
+        self.assertTrue(converged.all())
+        self.assertTrue(np.allclose(result_us, us, atol=1e-5))
+        self.assertTrue(np.allclose(result_vs, vs, atol=1e-5))
+
+    def test_surface_bounds(self):
+        points = np.array([[1.0, -1.0, 0.0], [0.0, 0.0, 2.0], [-1.0, -0.1, -0.2]])
+        result_us, result_vs, converged = refine_nearest_on_surface(points, sphere_patch(),
+                                                np.full(3, np.pi / 2), np.zeros(3))
+        self.assertTrue(converged.all())
+        self.assertTrue(np.allclose(result_us, np.array([0.0, np.pi / 2, np.pi]), atol=1e-5))
+        self.assertTrue(np.allclose(result_vs[:2], np.array([0.0, 1.0]), atol=1e-5))
+
+    @requires(scipy)
+    def test_nearest_point_on_surface(self):
+        points = np.array([[0.3, 0.5, 0.2], [2.0, 1.0, -1.0], [0.5, -1.0, 0.0]])
+        _, _, result = nearest_point_on_surface(points, sphere_patch(), init_samples=10)
+        expected = points / np.linalg.norm(points, axis=1, keepdims=True)
+        expected[2] = [1.0, 0.0, 0.0]
+        self.assertTrue(np.allclose(np.array(result), expected, atol=1e-5))
+
+    @requires(scipy)
+    def test_nearest_point_sequential(self):
+        points = np.array([[0.3, 0.5, 0.2], [0.3, 0.6, 0.2], [2.0, 1.0, -1.0], [0.5, -1.0, 0.0]])
+        us, vs = nearest_point_on_surface(points, sphere_patch(), init_samples=10, output_points=False)
+        seq_us, seq_vs = nearest_point_on_surface(points, sphere_patch(), init_samples=10,
+                                                  sequential=True, output_points=False)
+        self.assertTrue(np.allclose(seq_us, us, atol=1e-5))
+        self.assertTrue(np.allclose(seq_vs, vs, atol=1e-5))
+
+    def test_curve(self):
+        circle = SvCircle(center=np.zeros(3), normal=np.array([0.0, 0.0, 1.0]), vectorx=np.array([1.0, 0.0, 0.0]))
+        rng = np.random.default_rng(2)
+        ts = rng.uniform(0.1, 2 * np.pi - 0.1, 200)
+        points = np.stack((np.cos(ts), np.sin(ts), rng.uniform(-1, 1, 200)), axis=-1) * rng.uniform(0.5, 2.0, (200, 1))
+
+        result_ts, converged = refine_nearest_on_curve(points, circle, np.round(ts))
+        self.assertTrue(converged.all())
+        self.assertTrue(np.allclose(result_ts, ts, atol=1e-5))
+
+    @requires(scipy)
+    def test_ortho_project_curve_array(self):
+        circle = SvCircle(center=np.zeros(3), normal=np.array([0.0, 0.0, 1.0]), vectorx=np.array([1.0, 0.0, 0.0]))
+        points = np.array([[2.0, 0.5, 0.0], [-0.3, -0.4, 1.0], [0.1, 1.5, -1.0]])
+        results = ortho_project_curve_array(points, circle, init_samples=10)
+        for point, result in zip(points, results):
+            expected = ortho_project_curve(point, circle, init_samples=10)
+            self.assertTrue(np.allclose(np.array(result.us), np.array(expected.us), atol=1e-5))
+            self.assertTrue(np.allclose(result.nearest, expected.nearest, atol=1e-5))
+
+
+class RaycastTests(SverchokTestCase):
+    @requires(scipy)
+    def test_raycast_surface(self):
+        rng = np.random.default_rng(3)
+        us = rng.uniform(0.1, np.pi - 0.1, 200)
+        vs = rng.uniform(-0.9, 0.9, 200)
+        directions = np.stack((np.cos(vs) * np.cos(us), np.cos(vs) * np.sin(us), np.sin(vs)), axis=-1)
+        sources = np.zeros((200, 3))
+
+        result = raycast_surface(sphere_patch(), sources, directions, samples=10)
+        self.assertTrue(np.allclose(result.us, us, atol=1e-6))
+        self.assertTrue(np.allclose(result.vs, vs, atol=1e-6))
+        self.assertTrue(np.allclose(result.points, directions, atol=1e-6))
@@ -0,0 +1,38 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.marching_cubes import isosurface_np, Polygoniser
+
+
+def isosurface_loop(data, isolevel):
+    """Marching cubes by cube by cube polygonisation"""
+    sx, sy, sz = data.shape
+    polygoniser = Polygoniser(isolevel)
+    triangles = []
+    for z in range(sz-1):
+        for y in range(sy-1):
+            for x in range(sx-1):
+                cornervalues = [data[x + dx, y + dy, z + dz] for dx, dy, dz in
+                                [(0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0),
+                                 (0, 0, 1), (0, 1, 1), (1, 1, 1), (1, 0, 1)]]
+                triangles.extend(polygoniser.polygonise(cornervalues, x, y, z, x+1, y+1, z+1))
+    return np.array(polygoniser.vertices), triangles
+
+
+class MarchingCubesTests(SverchokTestCase):
+    def test_isosurface(self):
+        coords = np.linspace(-1, 1, 15)
+        xs, ys, zs = np.meshgrid(coords, coords, coords, indexing='ij')
+        data = xs**2 + 1.5 * ys**2 + zs**2
+        expected_verts, expected_faces = isosurface_loop(data, 0.5)
+        verts, faces = isosurface_np(data, 0.5)
+
+        self.assertEqual(len(verts), len(expected_verts))
+        expected = sorted(tuple(np.round(expected_verts[face], 6).flat) for face in expected_faces)
+        result = sorted(tuple(np.round(verts[face], 6).flat) for face in faces)
+        self.assertEqual(result, expected)
+
+    def test_empty(self):
+        verts, faces = isosurface_np(np.ones((5, 5, 5)), 0.5)
+        self.assertEqual(verts.shape, (0, 3))
+        self.assertEqual(faces.shape, (0, 3))
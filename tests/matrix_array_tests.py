@@ -0,0 +1,81 @@
+import pickle
+
+import numpy as np
+from mathutils import Matrix, Quaternion
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.matrices import (MatrixArray, compose_matrices, decompose_matrices,
+                                     quaternions_to_rotations, eulers_to_rotations, rotations_to_eulers)
+from sverchok.core.socket_data import sv_set_socket, sv_get_socket, sv_forget_socket
+
+
+class FakeNode:
+    def __init__(self, accepts_matrix_arrays):
+        self.accepts_matrix_arrays = accepts_matrix_arrays
+
+
+class FakeSocket:
+    is_output = False
+
+    def __init__(self, socket_id, node):
+        self.socket_id = socket_id
+        self.node = node
+
+
+def random_matrices(number, seed=0):
+    rng = np.random.default_rng(seed)
+    quaternions = rng.normal(size=(number, 4))
+    quaternions /= np.linalg.norm(quaternions, axis=1, keepdims=True)
+    quaternions *= np.sign(quaternions[:, :1])
+    locations = rng.uniform(-5, 5, (number, 3))
+    scales = rng.uniform(0.5, 2, (number, 3))
+    return locations, quaternions, scales
+
+
+class MatrixArrayTests(SverchokTestCase):
+    def test_compose(self):
+        locations, quaternions, scales = random_matrices(10)
+        matrices = MatrixArray.compose(locations, quaternions_to_rotations(quaternions), scales)
+        for i, matrix in enumerate(matrices):
+            expected = Matrix.LocRotScale(locations[i], Quaternion(quaternions[i]), scales[i])
+            self.assertTrue(np.allclose(np.array(matrix), np.array(expected), atol=1e-6))
+
+    def test_decompose(self):
+        locations, quaternions, scales = random_matrices(10, seed=1)
+        matrices = compose_matrices(locations, quaternions_to_rotations(quaternions), scales)
+        result_locations, result_quaternions, result_scales = decompose_matrices(matrices)
+        self.assertTrue(np.allclose(result_locations, locations))
+        self.assertTrue(np.allclose(result_quaternions, quaternions))
+        self.assertTrue(np.allclose(result_scales, scales))
+
+    def test_eulers(self):
+        rng = np.random.default_rng(2)
+        angles = rng.uniform(-1.5, 1.5, (10, 3))
+        for order in ['XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX']:
+            with self.subTest(order=order):
+                rotations = eulers_to_rotations(angles, order)
+                self.assertTrue(np.allclose(rotations_to_eulers(rotations, order), angles))
+
+    def test_operations(self):
+        locations, quaternions, scales = random_matrices(5, seed=3)
+        matrices = MatrixArray.compose(locations, quaternions_to_rotations(quaternions), scales)
+        identities = (matrices @ matrices.inverted()).array
+        self.assertTrue(np.allclose(identities, np.eye(4)))
+        self.assertEqual(len(matrices[1:3]), 2)
+        restored = pickle.loads(pickle.dumps(matrices))
+        self.assertTrue(np.array_equal(restored.array, matrices.array))
+
+    def test_socket_data(self):
+        matrices = MatrixArray(np.repeat(np.eye(4)[np.newaxis], 3, axis=0))
+        legacy = FakeSocket("matrix_array_test_0", FakeNode(False))
+        aware = FakeSocket("matrix_array_test_1", FakeNode(True))
+        try:
+            for socket in [legacy, aware]:
+                sv_set_socket(socket, matrices)
+            self.assertIs(sv_get_socket(aware), matrices)
+            data = sv_get_socket(legacy, deepcopy=False)
+            self.assertEqual(data, [Matrix()] * 3)
+            self.assertIs(data, sv_get_socket(legacy, deepcopy=False))
+        finally:
+            sv_forget_socket(legacy)
+            sv_forget_socket(aware)
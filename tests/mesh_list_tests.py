@@ -0,0 +1,133 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+import sverchok.utils.meshes as me
+from sverchok.core.socket_data import sv_set_socket, sv_get_socket, sv_forget_socket
+from sverchok.core.update_system import prepare_input_data
+from sverchok.utils.matrices import MatrixArray
+from sverchok.nodes.matrix.apply_and_join import apply_matrix_array
+
+
+VERTICES = [[(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], [(0, 0, 1), (1, 0, 1), (0, 1, 1)]]
+EDGES = [[(0, 1), (1, 2), (2, 3), (3, 0)], [(0, 1), (1, 2), (2, 0)]]
+POLYGONS = [[[0, 1, 2, 3]], [[0, 1, 2], [2, 1, 0]]]
+
+
+class FakeNode:
+    def __init__(self, accepts_mesh_lists):
+        self.accepts_mesh_lists = accepts_mesh_lists
+
+
+class FakeSocket:
+    is_output = False
+
+    def __init__(self, socket_id, node):
+        self.socket_id = socket_id
+        self.node = node
+
+
+class FakeLinkedSocket(FakeSocket):
+    default_conversion_name = 'DefaultImplicitConversionPolicy'
+
+    def __init__(self, socket_id, node, bl_idname, is_output):
+        super().__init__(socket_id, node)
+        self.bl_idname = bl_idname
+        self.is_output = is_output
+
+    def sv_get(self, deepcopy=False):
+        return sv_get_socket(self, deepcopy)
+
+    def sv_set(self, data):
+        sv_set_socket(self, data)
+
+
+class MeshListTests(SverchokTestCase):
+    def test_nested_lists(self):
+        mesh_list = me.MeshList.from_lists(VERTICES, EDGES, POLYGONS)
+        self.assertEqual(len(mesh_list), 2)
+        self.assertEqual(mesh_list.vertices.shape, (7, 3))
+        self.assertEqual(mesh_list.vertices_list(), [[list(v) for v in vs] for vs in VERTICES])
+        self.assertEqual(mesh_list.edges_list(), [[list(e) for e in es] for es in EDGES])
+        self.assertEqual(mesh_list.polygons_list(), POLYGONS)
+        self.assertEqual([f.tolist() for f in mesh_list.mesh_polygons(1)], POLYGONS[1])
+
+    def test_array_elements(self):
+        edges = np.array([EDGES[1], EDGES[1]])
+        mesh_list = me.MeshList.from_lists(VERTICES, edges, np.array(POLYGONS[1:]))
+        self.assertEqual(mesh_list.edges_list(), [edges[0].tolist(), edges[1].tolist()])
+        self.assertEqual(mesh_list.polygons_list(), [POLYGONS[1], POLYGONS[1]])
+        vertices = mesh_list.vertices_data.to_arrays()
+        self.assertTrue(np.shares_memory(vertices[1], mesh_list.vertices))
+        self.assertEqual(vertices[1].tolist(), [list(v) for v in VERTICES[1]])
+
+    def test_join(self):
+        joined = me.MeshList.from_lists(VERTICES, EDGES, POLYGONS).join()
+        expected = me.join([me.to_mesh(v, e, p) for v, e, p in zip(VERTICES, EDGES, POLYGONS)])
+        self.assertEqual(len(joined), 1)
+        self.assertEqual(joined.vertices_list()[0], [list(v) for v in expected.vertices])
+        self.assertEqual(joined.edges_list()[0], [list(e) for e in expected.edges])
+        self.assertEqual(joined.polygons_list()[0], [list(p) for p in expected.polygons])
+
+    def test_take_transformed(self):
+        mesh_list = me.MeshList.from_lists(VERTICES, EDGES, POLYGONS)
+        mesh_list.vertex_attrs['index'] = np.arange(7)
+        taken = mesh_list.take([1, 0, 1])
+        self.assertEqual(taken.polygons_list(), [POLYGONS[1], POLYGONS[0], POLYGONS[1]])
+        self.assertEqual(taken.edges_list()[2], [list(e) for e in EDGES[1]])
+        self.assertEqual(taken.vertex_attrs['index'].tolist(), [4, 5, 6, 0, 1, 2, 3, 4, 5, 6])
+        matrices = np.repeat(np.eye(4)[np.newaxis], 3, axis=0)
+        matrices[:, :3, 3] = [(0, 0, 0), (1, 0, 0), (0, 0, 2)]
+        moved = taken.transformed(matrices).vertices_list()
+        self.assertEqual(moved[1][0], [1, 0, 0])
+        self.assertEqual(moved[2], [[v[0], v[1], v[2] + 2] for v in VERTICES[1]])
+
+    def test_attributes(self):
+        meshes = [me.to_mesh(np.array(v), e, p) for v, e, p in zip(VERTICES, EDGES, POLYGONS)]
+        meshes[0].polygons['material'] = [1]
+        meshes[1].polygons['material'] = [2, 3]
+        mesh_list = me.MeshList.from_meshes(meshes)
+        self.assertEqual(mesh_list.polygon_attrs['material'].tolist(), [1, 2, 3])
+        self.assertEqual(mesh_list.mesh(1).polygons['material'], [2, 3])
+        self.assertEqual(mesh_list.join().polygon_attrs['material'].tolist(), [1, 2, 3])
+
+    def test_socket_data(self):
+        mesh_list = me.MeshList.from_lists(VERTICES, EDGES, POLYGONS)
+        legacy = FakeSocket("mesh_list_test_0", FakeNode(False))
+        aware = FakeSocket("mesh_list_test_1", FakeNode(True))
+        try:
+            for socket in [legacy, aware]:
+                sv_set_socket(socket, mesh_list.polygons_data)
+            self.assertIs(sv_get_socket(aware), mesh_list.polygons_data)
+            self.assertEqual(sv_get_socket(legacy, deepcopy=False), POLYGONS)
+            self.assertIs(sv_get_socket(legacy, deepcopy=False), sv_get_socket(legacy, deepcopy=False))
+        finally:
+            sv_forget_socket(legacy)
+            sv_forget_socket(aware)
+
+    def test_implicit_conversion(self):
+        mesh_list = me.MeshList.from_lists(VERTICES, EDGES, POLYGONS)
+        vertices = FakeLinkedSocket("mesh_list_test_2", FakeNode(True), 'SvVerticesSocket', True)
+        matrices = FakeLinkedSocket("mesh_list_test_3", FakeNode(False), 'SvMatrixSocket', False)
+        try:
+            vertices.sv_set(mesh_list.vertices_data)
+            self.assertEqual(vertices.sv_get()[1], [list(v) for v in VERTICES[1]])
+            prepare_input_data([vertices], [matrices])
+            data = matrices.sv_get()
+            self.assertEqual(len(data), 7)
+            self.assertEqual([m[i][3] for m in data[-1:] for i in range(3)], [0, 1, 1])
+        finally:
+            sv_forget_socket(vertices)
+            sv_forget_socket(matrices)
+
+    def test_apply_matrices(self):
+        matrices = MatrixArray(np.repeat(np.eye(4)[np.newaxis], 2, axis=0))
+        mesh_list = apply_matrix_array(vertices=VERTICES, edges=EDGES, polygons=[], matrices=matrices)
+        self.assertEqual(mesh_list.edges_list(), [[list(e) for e in es] for es in EDGES])
+        moved = apply_matrix_array(vertices=mesh_list.vertices_data, edges=mesh_list.edges_data,
+                                   polygons=[], matrices=matrices)
+        self.assertTrue(np.shares_memory(moved.edges, mesh_list.edges))  # not converted
+        self.assertIsNone(me.shared_mesh_list(mesh_list.vertices_data, EDGES))
+        moved = apply_matrix_array(vertices=mesh_list.vertices_data, edges=EDGES[:1],
+                                   polygons=POLYGONS, matrices=matrices)
+        self.assertEqual(moved.vertices_list(), mesh_list.vertices_list())
+        self.assertEqual(moved.polygons_list(), POLYGONS)
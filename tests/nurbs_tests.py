@@ -10,7 +10,7 @@ from sverchok.utils.curve import knotvector as sv_knotvector
 from sverchok.utils.curve.primitives import SvCircle
 from sverchok.utils.curve.nurbs import SvGeomdlCurve, SvNativeNurbsCurve, SvNurbsBasisFunctions, SvNurbsCurve
 from sverchok.utils.curve.nurbs_algorithms import interpolate_nurbs_curve
-from sverchok.utils.nurbs_common import elevate_bezier_degree, from_homogenous
+from sverchok.utils.nurbs_common import elevate_bezier_degree, from_homogenous, nurbs_basis_ders_array
 from sverchok.utils.surface.nurbs import SvGeomdlSurface, SvNativeNurbsSurface
 from sverchok.utils.surface.algorithms import SvCurveLerpSurface
 from sverchok.dependencies import geomdl
@@ -191,6 +191,21 @@ class NurbsCurveTests(SverchokTestCase):
         expected = np.array([1])
         self.assert_numpy_arrays_equal(ns, expected, precision=8)
 
+    def test_basis_ders_array(self):
+        "Compare span-local basis functions with the full set of basis functions"
+        for knotvector, degree in [(sv_knotvector.generate(3, 8), 3),
+                                   (sv_knotvector.generate(2, 6, clamped=False), 2),
+                                   (np.array([0, 0, 0, 0, 0.3, 0.3, 0.5, 0.5, 0.5, 1, 1, 1, 1]), 3)]:
+            ts = np.concatenate((np.linspace(knotvector[0], knotvector[-1], num=20), knotvector))
+            n_cpts = len(knotvector) - degree - 1
+            functions = SvNurbsBasisFunctions(knotvector)
+            idxs, ders = nurbs_basis_ders_array(knotvector, degree, ts, degree)
+            for k in range(degree+1):
+                expected = np.array([functions.derivative(i, degree, k)(ts) for i in range(n_cpts)]).T
+                actual = np.zeros_like(expected)
+                np.add.at(actual, (np.arange(len(ts))[np.newaxis].T, idxs), ders[k])
+                self.assert_numpy_arrays_equal(actual, expected, precision=6)
+
 class NurbsSurfaceTests(SverchokTestCase):
     def setUp(self):
         super().setUp()
@@ -246,6 +261,16 @@ class NurbsSurfaceTests(SverchokTestCase):
         vs2 = native_surface.evaluate_array(self.us, self.vs)
         self.assert_numpy_arrays_equal(vs1, vs2, precision=8, fail_fast=False)
 
+    def test_eval_grid(self):
+        weights = [[1,1,1,1], [1,2,3,1], [1,3,4,1], [1,4,5,1], [1,1,1,1]]
+        native_surface = SvNativeNurbsSurface(self.degree_u, self.degree_v, self.knotvector_u, self.knotvector_v, self.control_points, weights)
+        us = np.linspace(0.0, 1.0, num=7)
+        vs = np.linspace(0.0, 1.0, num=5)
+        us_grid, vs_grid = np.meshgrid(us, vs, indexing='ij')
+        expected = native_surface.evaluate_array(us_grid.flatten(), vs_grid.flatten())
+        actual = native_surface.evaluate_grid(us, vs).reshape((-1, 3))
+        self.assert_numpy_arrays_equal(actual, expected, precision=8)
+
     @requires(geomdl)
     #@unittest.skip
     def test_normal(self):
@@ -0,0 +1,81 @@
+import time
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, manual_only
+from sverchok.utils.logging import info
+from sverchok.utils.pulga_physics_core import (
+        pulga_system_init, grid_pairs, neighbour_pairs, cross_indices3)
+
+
+def make_parameters(n_particles, seed=2):
+    rng = np.random.default_rng(seed)
+    side = n_particles ** (1/3)
+    return {
+        "Initial_Pos": (rng.random((n_particles, 3)) * side).tolist(),
+        "rads_in": (rng.random(n_particles) * 0.3 + 0.1).tolist(),
+        "Initial Velocity": [[0, 0, 0]],
+        "max_vel": [0], "Density": [1],
+        "Springs": [], "fixed_len": [0], "spring_k": [0],
+        "Pins": [], "Pins Goal Position": [],
+        "self_collision": [0.5], "self_attract": [0.01], "attract_decay": [2],
+        "grow": [0.1], "min_rad": [0.05], "max_rad": [0.5],
+        "Pols": [], "inflate": [0], "drag_force": [0],
+        "Attractors": [], "att_force": [0], "att_clamp": [0], "att_decay_power": [0],
+        "random_seed": [0], "random_force": [0], "random_variation": [0],
+        "Gravity": [], "Wind": [], "Bounding Box": [],
+        "Obstacles": [], "Obstacles_pols": [], "obstacles_bounce": [0]}
+
+
+def make_gates(use_attract, use_grow, use_neighbours, attract_cutoff=1e9):
+    return {
+        "accumulate": False,
+        "self_react": [True, use_attract, use_grow],
+        "neighbours": [use_neighbours, attract_cutoff],
+        "Springs": [False, False], "Pins": [False, False],
+        "drag": [False, use_grow], "inflate": False, "random": False,
+        "attractors": False, "world_f": [False, use_grow],
+        "Obstacles": False, "b_box": False, "output": True, "apply_f": True}
+
+
+def simulate(n_particles, iterations, use_attract, use_grow, use_neighbours):
+    out_lists = [[], [], [], []]
+    params = make_parameters(n_particles)
+    gates = make_gates(use_attract, use_grow, use_neighbours)
+    verts, rads, _, _ = pulga_system_init(params, [None, [iterations]], gates, out_lists, [])
+    return verts, rads
+
+
+class PulgaNeighbourListTests(SverchokTestCase):
+    def test_grid_pairs(self):
+        verts = np.random.default_rng(1).random((500, 3)) * 5
+        radius = 0.6
+        pairs = cross_indices3(len(verts)).astype(np.int64)
+        dist = np.linalg.norm(verts[pairs[:, 0]] - verts[pairs[:, 1]], axis=1)
+        expected = set(map(tuple, pairs[dist < radius].tolist()))
+
+        self.assertEqual(set(map(tuple, grid_pairs(verts, radius).tolist())), expected)
+        self.assertEqual(set(map(tuple, neighbour_pairs(verts, radius).tolist())), expected)
+
+    def test_same_forces(self):
+        for use_attract, use_grow in [(False, False), (True, False), (False, True), (True, True)]:
+            with self.subTest(attract=use_attract, grow=use_grow):
+                dense_verts, dense_rads = simulate(300, 5, use_attract, use_grow, False)
+                sparse_verts, sparse_rads = simulate(300, 5, use_attract, use_grow, True)
+                self.assertTrue(np.allclose(sparse_verts, dense_verts))
+                self.assertTrue(np.allclose(sparse_rads, dense_rads))
+
+    @manual_only
+    def test_benchmark(self):
+        for n_particles in [1000, 3000, 10000, 100000]:
+            timings = []
+            for use_neighbours in [False, True]:
+                if not use_neighbours and n_particles > 3000:
+                    timings.append(None)
+                    continue
+                start = time.perf_counter()
+                simulate(n_particles, 10, False, True, use_neighbours)
+                timings.append(time.perf_counter() - start)
+            dense, sparse = timings
+            dense = "-" if dense is None else f"{dense:.3f}s"
+            info("Pulga self react, %s particles x 10 iterations: all pairs %s, neighbour list %.3fs",
+                 n_particles, dense, sparse)
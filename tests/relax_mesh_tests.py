@@ -0,0 +1,50 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.utils.relax_mesh import (
+        lloyd_relax, edges_relax, faces_relax,
+        _lloyd_relax_bmesh_steps, _edges_relax_bmesh_steps, _faces_relax_bmesh_steps,
+        NONE, NORMAL, LINEAR, MINIMUM, AVERAGE)
+from sverchok.utils.sv_itertools import run_steps
+from sverchok.dependencies import scipy
+
+
+def wavy_grid(n, seed=0):
+    rng = np.random.default_rng(seed)
+    xs, ys = np.meshgrid(np.arange(n), np.arange(n), indexing='ij')
+    verts = np.stack((xs.ravel(), ys.ravel(), np.zeros(n * n)), axis=1).astype(np.float64)
+    verts[:, :2] += rng.uniform(-0.2, 0.2, (n * n, 2))
+    verts[:, 2] = 0.3 * np.sin(verts[:, 0]) * np.cos(verts[:, 1])
+    faces = [[i*n + j, (i+1)*n + j, (i+1)*n + j+1, i*n + j+1] for i in range(n-1) for j in range(n-1)]
+    return verts.tolist(), faces
+
+
+@requires(scipy)
+class RelaxMeshTests(SverchokTestCase):
+    """Relaxation with sparse matrices should give the same results as the
+    bmesh based implementation"""
+    def setUp(self):
+        super().setUp()
+        self.verts, self.faces = wavy_grid(8)
+
+    def test_lloyd(self):
+        for method in [NONE, NORMAL, LINEAR]:
+            with self.subTest(method=method):
+                result = lloyd_relax(self.verts, self.faces, 3, method=method)
+                expected = run_steps(_lloyd_relax_bmesh_steps(self.verts, self.faces, 3, method=method))
+                self.assert_numpy_arrays_equal(np.array(result), np.array(expected), precision=4)
+
+    def test_edges(self):
+        for method, target in [(NONE, AVERAGE), (NORMAL, MINIMUM)]:
+            with self.subTest(method=method, target=target):
+                result = edges_relax(self.verts, [], self.faces, 3, 0.5, method=method, target=target)
+                expected = run_steps(_edges_relax_bmesh_steps(
+                    self.verts, [], self.faces, 3, 0.5, method=method, target=target))
+                self.assert_numpy_arrays_equal(np.array(result), np.array(expected), precision=4)
+
+    def test_faces(self):
+        mask = [True, False] * 32
+        result = faces_relax(self.verts, [], self.faces, 3, 0.5, mask=mask, use_axes={0, 1})
+        expected = run_steps(_faces_relax_bmesh_steps(
+            self.verts, [], self.faces, 3, 0.5, mask=mask, use_axes={0, 1}))
+        self.assert_numpy_arrays_equal(np.array(result), np.array(expected), precision=4)
@@ -0,0 +1,169 @@
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, manual_only
+from sverchok.utils.logging import info
+from sverchok.core import socket_data as sd
+from sverchok.core.socket_data import (
+        data_fingerprint, sv_set_socket, sv_get_socket, sv_forget_socket,
+        sv_socket_fingerprint, sv_is_data_changed, isolated_socket_data, merge_socket_data,
+        data_size, sockets_data_size)
+
+
+class DataFingerprintTests(SverchokTestCase):
+    def assert_same(self, data1, data2):
+        self.assertTrue(data_fingerprint(data1) == data_fingerprint(data2))
+
+    def assert_changed(self, data1, data2):
+        try:
+            self.assertFalse(data_fingerprint(data1) == data_fingerprint(data2))
+        except (ValueError, TypeError):
+            pass  # comparison failure means the data is considered changed
+
+    def test_lists(self):
+        self.assert_same([[1, 2, 3]], [[1, 2, 3]])
+        self.assert_same([[(0, 0, 0), (1, 0, 0)]], [[(0, 0, 0), (1, 0, 0)]])
+        self.assert_changed([[-1]], [[-2]])
+        self.assert_changed([[1, 2, 3]], [[1, 2]])
+        self.assert_changed([[(0, 0, 0)]], [[(0, 0, 1)]])
+        self.assert_changed([[[0, 0, 0]]], [[[0, 0, 1]]])
+
+    def test_arrays(self):
+        self.assert_same([np.arange(6.0)], [np.arange(6.0)])
+        self.assert_same(np.arange(6)[::2], np.array([0, 2, 4]))
+        self.assert_changed(np.arange(6.0), np.arange(6))
+        self.assert_changed(np.arange(6.0), np.arange(6.0).reshape((2, 3)))
+        self.assert_changed([np.zeros(3)], [np.ones(3)])
+        self.assert_changed([[np.zeros(3)]], [[np.ones(3)]])
+
+    def test_deep_lists(self):
+        data = [[[[[[1]]]]]]
+        self.assert_same(data, data)
+        self.assert_changed(data, [[[[[[1]]]]]])
+
+    def test_objects(self):
+        obj = object()
+        self.assert_same([[obj]], [[obj]])
+        self.assert_changed([[obj]], [[object()]])
+
+
+class FakeNode:
+    def __init__(self, mutates_inputs=None):
+        self.mutates_inputs = mutates_inputs
+
+
+class FakeSocket:
+    def __init__(self, socket_id, node=None):
+        self.socket_id = socket_id
+        self.s_id = socket_id
+        self.node = node
+
+
+class FakeCurve:
+    def __init__(self, control_points):
+        self.control_points = control_points
+
+
+class InputDataModeTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mode = sd.input_data_mode
+        self.sockets = []
+
+    def tearDown(self):
+        sd.set_input_data_mode(self.mode)
+        for socket in self.sockets:
+            sv_forget_socket(socket)
+        super().tearDown()
+
+    def make_socket(self, data, mutates_inputs=None):
+        socket = FakeSocket(f"input_data_mode_test_{len(self.sockets)}", FakeNode(mutates_inputs))
+        self.sockets.append(socket)
+        sv_set_socket(socket, data)
+        return socket
+
+    def test_copy(self):
+        data = [[(0, 0, 0), (1, 0, 0)]]
+        for mode in ['COPY', 'SHARE', 'CHECK']:
+            sd.set_input_data_mode(mode)
+            for mutates_inputs, is_copied in [(True, True), (False, False), (None, mode == 'COPY')]:
+                with self.subTest(mode=mode, mutates_inputs=mutates_inputs):
+                    socket = self.make_socket(data, mutates_inputs)
+                    result = sv_get_socket(socket)
+                    self.assertEqual(result, data)
+                    self.assertEqual(result[0] is not data[0], is_copied)
+                    self.assertIs(sv_get_socket(socket, deepcopy=False), data)
+
+    def test_data_changed(self):
+        socket = self.make_socket([[1, 2, 3]])
+        self.assertFalse(sv_is_data_changed(socket))
+        sv_socket_fingerprint(socket)
+        self.assertFalse(sv_is_data_changed(socket))
+        sv_get_socket(socket, deepcopy=False)[0].append(4)
+        self.assertTrue(sv_is_data_changed(socket))
+
+    def test_isolated_data(self):
+        common = self.make_socket([[0]])
+        forgotten = self.make_socket([[0]])
+        local = FakeSocket("input_data_mode_test_local", FakeNode())
+        self.sockets.append(local)
+
+        def evaluate(value):
+            with isolated_socket_data() as layer:
+                sv_set_socket(local, [[value]])
+                sv_forget_socket(forgotten)
+                time.sleep(0.01)
+                with self.assertRaises(Exception):
+                    sv_get_socket(forgotten)
+                return sv_get_socket(local)[0][0] + sv_get_socket(common)[0][0], layer
+
+        with ThreadPoolExecutor() as pool:
+            results = list(pool.map(evaluate, range(10)))
+        self.assertEqual([r for r, _ in results], list(range(10)))
+        self.assertEqual(sv_get_socket(forgotten), [[0]])
+        with self.assertRaises(Exception):
+            sv_get_socket(local)
+
+        merge_socket_data(results[-1][1])
+        self.assertEqual(sv_get_socket(local), [[9]])
+        with self.assertRaises(Exception):
+            sv_get_socket(forgotten)
+
+    def test_data_size(self):
+        points = np.zeros((1000, 3))
+        self.assertGreater(data_size([points]), points.nbytes)
+        self.assertGreater(data_size([FakeCurve(points)]), points.nbytes)
+        self.assertGreater(data_size([[(0, 0, 0)] * 1000]), data_size([[(0, 0, 0)] * 10]))
+
+        data = [points]
+        socket = self.make_socket(data)
+        shared = self.make_socket(data)
+        self.assertEqual(sockets_data_size([socket, shared]), data_size(data))
+        sizes = dict()
+        sockets_data_size([socket], sizes)
+        self.assertEqual(sizes, {id(data): data_size(data)})
+
+    def test_data_size_estimation(self):
+        # lists of vertices are not walked element by element
+        verts = [(float(i), 0.0, 0.0) for i in range(1000)]
+        self.assertEqual(data_size(verts), sys.getsizeof(verts) + len(verts) * data_size(verts[0]))
+        self.assertEqual(data_size([verts]), sys.getsizeof([verts]) + data_size(verts))
+
+    @manual_only
+    def test_benchmark(self):
+        # a mesh of one million vertices read by a chain of ten nodes
+        n_verts, n_nodes = 1_000_000, 10
+        verts = [[(float(i), 0.0, 0.0) for i in range(n_verts)]]
+        edges = [[(i, i + 1) for i in range(n_verts - 1)]]
+        for mode in ['COPY', 'SHARE']:
+            sd.set_input_data_mode(mode)
+            sockets = [self.make_socket(data) for data in [verts, edges] * n_nodes]
+            start = time.perf_counter()
+            copies = 0
+            for socket in sockets:
+                copies += sv_get_socket(socket) is not sv_get_socket(socket, deepcopy=False)
+            info("Input data mode %s: %s nodes read a mesh of %s vertices in %.3fs, %s copies made",
+                 mode, n_nodes, n_verts, time.perf_counter() - start, copies)
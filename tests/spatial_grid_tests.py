@@ -0,0 +1,50 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.spatial_grid import SvUniformGrid
+
+
+class UniformGridTests(SverchokTestCase):
+    def check_one_by_one(self, stored_points, stored_radiuses, points, radiuses):
+        stored_points = list(stored_points)
+        stored_radiuses = list(stored_radiuses)
+        result = []
+        for point, radius in zip(points, radiuses):
+            ok = all(np.linalg.norm(point - p) >= radius + r for p, r in zip(stored_points, stored_radiuses))
+            if ok:
+                stored_points.append(point)
+                stored_radiuses.append(radius)
+            result.append(ok)
+        return np.array(result)
+
+    def test_check_batches(self):
+        rng = np.random.default_rng(1)
+        for cell_size in [None, 0.1, 0.3]:
+            with self.subTest(cell_size=cell_size):
+                grid = SvUniformGrid(cell_size)
+                for i in range(4):
+                    points = rng.random((100, 3))
+                    radiuses = rng.random(100) * 0.1
+                    expected = self.check_one_by_one(grid.points, grid.radiuses, points, radiuses)
+                    good = grid.check(points, radiuses)
+                    self.assertEqual(good.tolist(), expected.tolist())
+                    grid.add(points[good], radiuses[good])
+
+    def test_min_distance(self):
+        min_r = 0.2
+        grid = SvUniformGrid(min_r)
+        points = np.array([[0, 0, 0], [0.1, 0, 0], [0.3, 0, 0], [0.35, 0, 0]])
+        good = grid.check(points, min_r / 2.0)
+        self.assertEqual(good.tolist(), [True, False, True, False])
+
+    def test_growing_radiuses(self):
+        rng = np.random.default_rng(2)
+        grid = SvUniformGrid(0.01)
+        for scale in [0.01, 0.1, 1.0]:
+            points = rng.random((100, 3))
+            radiuses = rng.random(100) * scale
+            expected = self.check_one_by_one(grid.points, grid.radiuses, points, radiuses)
+            good = grid.check(points, radiuses)
+            self.assertEqual(good.tolist(), expected.tolist())
+            grid.add(points[good], radiuses[good])
+        self.assertGreater(grid.cell_size, 0.01)  # the grid was rebuilt
@@ -1,6 +1,11 @@
+import time
+from math import pi, sin, cos
 from typing import Tuple, List
 
-from sverchok.utils.testing import SverchokTestCase
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, manual_only
+from sverchok.utils.logging import info
 
 from sverchok.utils.vectorize import DataWalker, walk_data, vectorize
 
@@ -87,6 +92,62 @@ class VectorizeTest(SverchokTestCase):
         vector1 = vectorize(vector, match_mode='REPEAT')
         self.assertEqual(vector1(length=lengths), [[0, 1, 2, 3], [[[0, 1, 2]], [0]], [0, 1, 2, 3, 4]])
 
+    def test_batch(self):
+
+        def power(*, a: np.ndarray, b: np.ndarray, mode: str) -> list:
+            calls.append(len(a))
+            result = a ** b if mode == 'POW' else a * b
+            return [[v] * 2 for v in result.tolist()]
+
+        def power_one(*, a, b, mode) -> list:
+            return [a ** b if mode == 'POW' else a * b] * 2
+
+        a_values = [[1, 2], [3, 4, 5]]
+        b_values = [1, [2, 3], 4]
+        calls = []
+        result = vectorize(power)(a=a_values, b=b_values, mode='POW')
+        self.assertEqual(result, vectorize(power_one)(a=a_values, b=b_values, mode='POW'))
+        self.assertEqual(calls, [8])
+
+        calls = []
+        self.assertEqual(vectorize(power)(a=2, b=3, mode='MUL'), [6, 6])
+        self.assertEqual(calls, [1])
+
+        # groups are split by other parameters
+        calls = []
+        modes = ['POW', ['MUL', 'POW'], 'POW']
+        result = vectorize(power)(a=a_values, b=b_values, mode=modes)
+        self.assertEqual(result, vectorize(power_one)(a=a_values, b=b_values, mode=modes))
+        self.assertEqual(calls, [2, 1, 5])
+
+    def test_batch_outputs(self):
+
+        def split(*, values: np.ndarray, n: int) -> Tuple[list, list]:
+            return values[:, np.newaxis] * np.ones(n), [[]] * len(values)
+
+        ones, empty = vectorize(split)(values=[[1, 2], [3]], n=2)
+        self.assertEqual([[v.tolist() for v in l] for l in ones], [[[1, 1], [2, 2]], [[3, 3]]])
+        self.assertEqual(empty, [[[], []], [[]]])
+
+    @manual_only
+    def test_batch_benchmark(self):
+
+        def circle_one(*, radius: float, n_verts: int) -> list:
+            return [(radius * cos(2 * pi * i / n_verts), radius * sin(2 * pi * i / n_verts), 0)
+                    for i in range(n_verts)]
+
+        def circle_batch(*, radius: np.ndarray, n_verts: int) -> list:
+            phi = 2 * pi * np.arange(n_verts) / n_verts
+            verts = np.zeros((len(radius), n_verts, 3))
+            verts[..., 0] = radius[:, np.newaxis] * np.cos(phi)
+            verts[..., 1] = radius[:, np.newaxis] * np.sin(phi)
+            return verts
+
+        radiuses = np.linspace(1, 2, 10_000).tolist()
+        for func in [circle_one, circle_batch]:
+            start = time.perf_counter()
+            vectorize(func)(radius=radiuses, n_verts=24)
+            info("Vectorize %s, 10k circles: %.3fs", func.__name__, time.perf_counter() - start)
 
 if __name__ == '__main__':
     import unittest
@@ -19,6 +19,7 @@
 import bpy
 
 import sverchok
+from sverchok.core.socket_data import node_data_size, tree_data_size, format_data_size
 from sverchok.utils import profile
 from sverchok.ui.development import displaying_sverchok_nodes
 from sverchok.utils.context_managers import sv_preferences
@@ -69,6 +70,11 @@ class SV_PT_ActiveTreePanel(SverchokPanels, bpy.types.Panel):
         col.prop(ng, 'sv_scene_update', text="Scene", icon='SCENE_DATA')
         col.prop(ng, 'sv_process', text="Live update", toggle=True)
         col.prop(ng, "sv_draft", text="Draft mode", toggle=True)
+        col.prop(ng, "sv_skip_unchanged", text="Skip unchanged", toggle=True)
+        col.prop(ng, "sv_parallel", text="Parallel", toggle=True)
+        col.prop(ng, "sv_free_memory", text="Free memory", toggle=True)
+        col.prop(ng, "sv_disk_cache", text="Disk cache", toggle=True)
+        col.prop(ng, "sv_fuse_math", text="Fuse math", toggle=True)
 
 
 class SV_PT_TreeTimingsPanel(SverchokPanels, bpy.types.Panel):
@@ -89,6 +95,25 @@ class SV_PT_TreeTimingsPanel(SverchokPanels, bpy.types.Panel):
         row.prop(tree, 'show_time_mode', text="Update time", expand=True)
 
 
+class SV_PT_TreeMemoryPanel(SverchokPanels, bpy.types.Panel):
+    bl_idname = "SV_PT_TreeMemoryPanel"
+    bl_label = "Socket data"
+    bl_parent_id = 'SV_PT_ActiveTreePanel'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    max_nodes = 5
+
+    def draw(self, context):
+        tree = context.space_data.node_tree
+        col = self.layout.column()
+        data_sizes = dict()  # each data is measured once
+        col.label(text=f"Tree: {format_data_size(tree_data_size(tree, data_sizes))}")
+        sizes = sorted(((node_data_size(n, data_sizes), n.name) for n in tree.nodes), reverse=True)
+        for size, name in sizes[:self.max_nodes]:
+            if size:
+                col.label(text=f"{name}: {format_data_size(size)}")
+
+
 class SV_PT_ExtrTreeUserInterfaceOptions(SverchokPanels, bpy.types.Panel):
     bl_idname = "SV_PT_ExtrTreeUserInterfaceOptions"
     bl_label = "Tree UI options"
@@ -334,6 +359,7 @@ sv_tools_classes = [
     SV_PT_ToolsMenu,
     SV_PT_ActiveTreePanel,
     SV_PT_TreeTimingsPanel,
+    SV_PT_TreeMemoryPanel,
     SV_PT_ExtrTreeUserInterfaceOptions,
     SV_PT_ProfilingPanel,
     SV_PT_SverchokUtilsPanel,
@@ -35,7 +35,9 @@ class PopulationData(object):
     @property
     def points(self):
         if self._points is None:
-            self._points = self.surface.evaluate_array(self.us, self.vs).reshape((self.samples_u, self.samples_v, 3))
+            us_range = np.linspace(self.u_min, self.u_max, num=self.samples_u)
+            vs_range = np.linspace(self.v_min, self.v_max, num=self.samples_v)
+            self._points = self.surface.evaluate_grid(us_range, vs_range)
         return self._points
 
 def populate_surface_uv(surface, samples_u, samples_v, by_curvature=True, curvature_type = MAXIMUM, curvature_clip = 100, by_area=True, min_ppf=1, max_ppf=5, seed=1):
@@ -92,8 +94,7 @@ def populate_surface_uv(surface, samples_u, samples_v, by_curvature=True, curvat
         curvatures_range = 0
 
     if by_area:
-        surface_points = surface.evaluate_array(us, vs)
-        surface_points = surface_points.reshape((samples_u, samples_v, 3))
+        surface_points = surface.evaluate_grid(us_range, vs_range)
         data._points = surface_points
 
         points_0 = surface_points[:-1, :-1,:]
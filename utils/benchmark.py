@@ -0,0 +1,337 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Headless benchmarks of node trees evaluation.
+
+Trees from json_examples and some synthetic big trees are imported and
+evaluated several times. Per tree and per node timings, peak memory of
+Python allocations during evaluation and size of socket data cache are
+saved into a JSON file. The results can be compared with results saved
+before, so performance regressions can be found per tree and per node
+category (curve, surface, field, spatial etc.).
+
+Usage:
+
+    $ ./run_benchmarks.sh --output results.json --baseline baseline.json
+
+or from Blender's Python console:
+
+    from sverchok.utils.benchmark import run_benchmarks
+    results = run_benchmarks(repeat=3)
+"""
+
+import json
+import statistics
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from time import perf_counter
+
+import bpy
+
+import sverchok
+from sverchok.core.socket_data import socket_data_cache, data_size
+from sverchok.core.update_system import UpdateTree, TIME_KEY, ERROR_KEY
+from sverchok.utils.logging import info, error
+from sverchok.utils.sv_json_import import JSONImporter
+
+BENCHMARK_VERSION = 1
+BENCHMARK_TREE_NAME = "BenchmarkTree"
+
+# examples which can't be evaluated without Blender data or additional modules
+SKIP_EXAMPLES = {
+    "Genetic_algorithm_scripted_node.json",
+    "ABCnaming.json",
+    "CNC_CUTHOLES_RESIZE.json",
+    "BIM_ArchiCAD24_import.json",
+    "BIM_FreeCAD_import.json",
+    "BIM_truss_joint.json",
+}
+
+
+def node_category(node) -> str:
+    """Category of a node is the folder of its module, e.g. `curve`"""
+    parts = type(node).__module__.split('.')
+    if len(parts) > 2 and parts[1] == 'nodes':
+        return parts[2]
+    return 'other'
+
+
+def add_consumer(tree, socket):
+    """Links the socket to a List Length node. Most nodes skip evaluation if
+    their outputs are not linked"""
+    length = tree.nodes.new('ListLengthNode')
+    tree.links.new(socket, length.inputs['Data'])
+
+
+def build_chain_tree(tree, resolution=500, length=10):
+    """Plane generator followed by a chain of Move nodes"""
+    plane = tree.nodes.new('SvPlaneNodeMk3')
+    plane.numx = plane.numy = resolution
+    prev = plane
+    for i in range(length):
+        move = tree.nodes.new('SvMoveNodeMk3')
+        move.movement_vectors = (0, 0, 0.1)
+        tree.links.new(prev.outputs['Vertices'], move.inputs['Vertices'])
+        prev = move
+    add_consumer(tree, prev.outputs['Vertices'])
+
+
+def build_wide_tree(tree, resolution=200, width=16):
+    """Many independent branches of a plane generator and two Move nodes"""
+    for i in range(width):
+        plane = tree.nodes.new('SvPlaneNodeMk3')
+        plane.numx = plane.numy = resolution
+        prev = plane
+        for j in range(2):
+            move = tree.nodes.new('SvMoveNodeMk3')
+            move.movement_vectors = (0, 0, 0.1)
+            tree.links.new(prev.outputs['Vertices'], move.inputs['Vertices'])
+            prev = move
+        add_consumer(tree, prev.outputs['Vertices'])
+
+
+def build_curve_tree(tree, samples=10000, width=8):
+    """Several circle curves evaluated in many points"""
+    for i in range(width):
+        circle = tree.nodes.new('SvCircleCurveMk2Node')
+        circle.radius = i + 1
+        evaluate = tree.nodes.new('SvExEvalCurveNode')
+        evaluate.sample_size = samples
+        tree.links.new(circle.outputs['Curve'], evaluate.inputs['Curve'])
+        add_consumer(tree, evaluate.outputs['Vertices'])
+
+
+def build_surface_tree(tree, samples=300, width=4):
+    """Several plane surfaces evaluated on a dense grid"""
+    for i in range(width):
+        plane = tree.nodes.new('SvExPlaneSurfaceNode')
+        evaluate = tree.nodes.new('SvExEvalSurfaceNode')
+        evaluate.samples_u = evaluate.samples_v = samples
+        tree.links.new(plane.outputs['Surface'], evaluate.inputs['Surface'])
+        add_consumer(tree, evaluate.outputs['Vertices'])
+
+
+def build_field_tree(tree, resolution=200, width=4):
+    """Noise vector field evaluated in vertices of plane generators"""
+    noise = tree.nodes.new('SvExNoiseVectorFieldNode')
+    for i in range(width):
+        plane = tree.nodes.new('SvPlaneNodeMk3')
+        plane.numx = plane.numy = resolution
+        evaluate = tree.nodes.new('SvExVectorFieldEvaluateNode')
+        tree.links.new(noise.outputs['Noise'], evaluate.inputs['Field'])
+        tree.links.new(plane.outputs['Vertices'], evaluate.inputs['Vertices'])
+        add_consumer(tree, evaluate.outputs['Vectors'])
+
+
+def build_spatial_tree(tree, count=2000, width=4):
+    """3D Delaunay triangulation of several sets of random points"""
+    for i in range(width):
+        points = tree.nodes.new('RandomVectorNodeMK3')
+        points.count_inner = count
+        points.seed = i
+        delaunay = tree.nodes.new('SvDelaunay3dMk2Node')
+        tree.links.new(points.outputs['Random'], delaunay.inputs['Vertices'])
+        add_consumer(tree, delaunay.outputs['Faces'])
+
+
+SYNTHETIC_TREES = {
+    'synthetic_chain': build_chain_tree,
+    'synthetic_wide': build_wide_tree,
+    'synthetic_curve': build_curve_tree,
+    'synthetic_surface': build_surface_tree,
+    'synthetic_field': build_field_tree,
+    'synthetic_spatial': build_spatial_tree,
+}
+
+
+def example_paths():
+    """Yields (name, path) of JSON examples"""
+    examples_path = Path(sverchok.__file__).parent / 'json_examples'
+    for path in sorted(examples_path.glob('*/*.json')):
+        if path.name in SKIP_EXAMPLES:
+            continue
+        yield f"{path.parent.name}/{path.stem}", path
+
+
+def evaluate_tree(tree):
+    """Evaluates all nodes of the tree from scratch. Returns execution time"""
+    UpdateTree.reset_tree(tree)
+    start = perf_counter()
+    for _ in UpdateTree.main_update(tree, update_interface=False):
+        pass
+    return perf_counter() - start
+
+
+def socket_cache_size(tree) -> int:
+    """Approximate size of data of output sockets of the tree in bytes"""
+    size = 0
+    for node in tree.nodes:
+        for socket in node.outputs:
+            data = socket_data_cache.get(socket.socket_id)
+            if data is not None:
+                size += data_size(data)
+    return size
+
+
+def benchmark_tree(tree, repeat=3) -> dict:
+    """Evaluates the tree `repeat` times and returns its statistics. Memory is
+    measured during separate evaluation because tracing slows execution."""
+    tracemalloc.start()
+    try:
+        evaluate_tree(tree)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    tree_times = []
+    node_times = defaultdict(list)
+    for _ in range(repeat):
+        tree_times.append(evaluate_tree(tree))
+        for node in tree.nodes:
+            if TIME_KEY in node:
+                node_times[node.name].append(node[TIME_KEY])
+
+    nodes = dict()
+    for node in tree.nodes:
+        if node.name not in node_times:
+            continue
+        nodes[node.name] = {
+            'bl_idname': node.bl_idname,
+            'category': node_category(node),
+            'time': statistics.median(node_times[node.name]),
+        }
+        if node.get(ERROR_KEY):
+            nodes[node.name]['error'] = node[ERROR_KEY]
+
+    return {
+        'time': statistics.median(tree_times),
+        'peak_memory': peak_memory,
+        'socket_cache': socket_cache_size(tree),
+        'nodes': nodes,
+    }
+
+
+def new_benchmark_tree():
+    if BENCHMARK_TREE_NAME in bpy.data.node_groups:
+        bpy.data.node_groups.remove(bpy.data.node_groups[BENCHMARK_TREE_NAME])
+    tree = bpy.data.node_groups.new(BENCHMARK_TREE_NAME, 'SverchCustomTreeType')
+    tree.sv_process = False  # don't evaluate during building
+    return tree
+
+
+def run_benchmarks(repeat=3, pattern=None, examples=True, synthetic=True) -> dict:
+    """Benchmarks the examples and synthetic trees. Returns results which can
+    be saved as JSON.
+    :pattern: if given only trees which names contain it are benchmarked"""
+    sources = []
+    if examples:
+        for name, path in example_paths():
+            sources.append((name, path, None))
+    if synthetic:
+        for name, builder in SYNTHETIC_TREES.items():
+            sources.append((name, None, builder))
+
+    trees = dict()
+    for name, path, builder in sources:
+        if pattern is not None and pattern not in name:
+            continue
+        tree = new_benchmark_tree()
+        try:
+            if builder is not None:
+                builder(tree)
+            else:
+                importer = JSONImporter.init_from_path(str(path))
+                importer.import_into_tree(tree, print_log=False)
+                if importer.has_fails:
+                    error("Benchmark: skipping %s, import failed: %s", name, importer.fail_massage)
+                    continue
+            trees[name] = benchmark_tree(tree, repeat)
+            info("Benchmark: %s - %.3fs", name, trees[name]['time'])
+        except Exception as e:
+            error("Benchmark: %s failed: %s", name, e)
+        finally:
+            bpy.data.node_groups.remove(tree)
+
+    return {
+        'version': BENCHMARK_VERSION,
+        'blender': bpy.app.version_string,
+        'repeat': repeat,
+        'trees': trees,
+    }
+
+
+def category_times(results) -> dict:
+    """Total time of nodes per category per tree, {(tree, category): time}"""
+    times = defaultdict(float)
+    for tree_name, tree in results['trees'].items():
+        for node in tree['nodes'].values():
+            times[(tree_name, node['category'])] += node['time']
+    return times
+
+
+def compare_results(results, baseline, tolerance=0.2, min_time=0.005) -> list[str]:
+    """Compares benchmark results with baseline ones. Returns descriptions of
+    regressions of tree times and node category times. A time is considered
+    regressed if it's more than (1 + tolerance) times slower and the
+    difference is bigger than min_time seconds."""
+    def is_regression(new, old):
+        return new > old * (1 + tolerance) and new - old > min_time
+
+    regressions = []
+    for name, tree in results['trees'].items():
+        old_tree = baseline['trees'].get(name)
+        if old_tree is None:
+            continue
+        if is_regression(tree['time'], old_tree['time']):
+            regressions.append(f"{name}: {old_tree['time']:.3f}s -> {tree['time']:.3f}s")
+
+    old_times = category_times(baseline)
+    for (name, category), new_time in category_times(results).items():
+        old_time = old_times.get((name, category))
+        if old_time is not None and is_regression(new_time, old_time):
+            regressions.append(f"{name} [{category}]: {old_time:.3f}s -> {new_time:.3f}s")
+    return regressions
+
+
+def save_results(results, path):
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2)
+
+
+def load_results(path) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+if __name__ == "__main__":
+    import sys
+    import argparse
+
+    argv = sys.argv
+    argv = argv[argv.index("--")+1:] if "--" in argv else []
+    parser = argparse.ArgumentParser(prog="run_benchmarks.sh", description="Benchmark Sverchok node trees")
+    parser.add_argument('--output', help="Path of JSON file to save results")
+    parser.add_argument('--baseline', help="Path of JSON file with results to compare with")
+    parser.add_argument('--repeat', type=int, default=3, help="Number of evaluations of each tree")
+    parser.add_argument('--pattern', help="Benchmark only trees which names contain the pattern")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed relative slowdown")
+    parser.add_argument('--no-examples', action='store_true', help="Don't benchmark JSON examples")
+    parser.add_argument('--no-synthetic', action='store_true', help="Don't benchmark synthetic trees")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.repeat, args.pattern, not args.no_examples, not args.no_synthetic)
+    if args.output:
+        save_results(results, args.output)
+    if args.baseline:
+        regressions = compare_results(results, load_results(args.baseline), args.tolerance)
+        for regression in regressions:
+            print("Regression:", regression)
+        if regressions:
+            sys.exit(1)
+    sys.exit(0)
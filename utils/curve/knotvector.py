@@ -62,6 +62,19 @@ def find_span(knot_vector, num_ctrlpts, knot):
 
     return span - 1
 
+def find_span_array(knot_vector, ts):
+    """
+    Vectorized version of find_span.
+    For each parameter value, return index i of non-empty knot span
+    [u_i, u_{i+1}) which contains it. Values at the end of knot vector
+    (and beyond it) belong to the last non-empty span; values before
+    the start of knot vector belong to the first non-empty span.
+    """
+    knot_vector = np.asarray(knot_vector)
+    non_empty = np.flatnonzero(knot_vector[1:] > knot_vector[:-1])
+    spans = np.searchsorted(knot_vector, ts, side='right') - 1
+    return np.clip(spans, non_empty[0], non_empty[-1])
+
 def from_tknots(degree, tknots):
     n = len(tknots)
     #m = degree + n + 1
@@ -18,7 +18,7 @@ from sverchok.utils.curve.algorithms import unify_curves_degree
 from sverchok.utils.curve.nurbs_algorithms import interpolate_nurbs_curve, unify_two_curves, unify_curves
 from sverchok.utils.nurbs_common import (
         SvNurbsMaths,SvNurbsBasisFunctions,
-        nurbs_divide, elevate_bezier_degree, from_homogenous,
+        nurbs_basis_ders_array, nurbs_divide, elevate_bezier_degree, from_homogenous,
         CantInsertKnotException, CantRemoveKnotException
     )
 from sverchok.utils.surface.nurbs import SvNativeNurbsSurface, SvGeomdlSurface
@@ -963,98 +963,74 @@ class SvNativeNurbsCurve(SvNurbsCurve):
         else:
             return numerator / denominator
 
+    def fraction_ders(self, n_ders, ts):
+        """
+        Numerator and denominator of NURBS curve fraction,
+        together with their derivatives up to n_ders order.
+        Only degree+1 non-zero basis functions are calculated for each t.
+
+        output: tuple:
+        * numerators: array of shape (n_ders+1, n, 3)
+        * denominators: array of shape (n_ders+1, n, 1)
+        """
+        idxs, ns = nurbs_basis_ders_array(self.knotvector, self.degree, ts, n_ders) # (n, p+1), (n_ders+1, n, p+1)
+        coeffs = ns * self.weights[idxs] # (n_ders+1, n, p+1)
+        numerators = np.einsum('dnk,nki->dni', coeffs, self.control_points[idxs]) # (n_ders+1, n, 3)
+        denominators = coeffs.sum(axis=2)[:,:,np.newaxis] # (n_ders+1, n, 1)
+        return numerators, denominators
+
     def fraction(self, deriv_order, ts):
-        n = len(ts)
-        p = self.degree
-        k = len(self.control_points)
-        ns = np.array([self.basis.derivative(i, p, deriv_order)(ts) for i in range(k)]) # (k, n)
-        coeffs = ns * self.weights[np.newaxis].T # (k, n)
-        coeffs_t = coeffs[np.newaxis].T # (n, k, 1)
-        numerator = (coeffs_t * self.control_points) # (n, k, 3)
-        numerator = numerator.sum(axis=1) # (n, 3)
-        denominator = coeffs.sum(axis=0) # (n,)
-
-        return numerator, denominator[np.newaxis].T
+        numerators, denominators = self.fraction_ders(deriv_order, ts)
+        return numerators[deriv_order], denominators[deriv_order]
 
     def fraction_single(self, deriv_order, t):
-        p = self.degree
-        k = len(self.control_points)
-        ts = np.array([t])
-        ns = np.array([self.basis.derivative(i, p, deriv_order)(ts)[0] for i in range(k)]) # (k,)
-        coeffs = ns * self.weights # (k, )
-        coeffs_t = coeffs[np.newaxis].T
-        numerator = (coeffs_t * self.control_points) # (k, 3)
-        numerator = numerator.sum(axis=0) # (3,)
-        denominator = coeffs.sum(axis=0) # ()
-
-        return numerator, denominator
+        numerator, denominator = self.fraction(deriv_order, np.array([t]))
+        return numerator[0], denominator[0,0]
 
     def evaluate_array(self, ts):
         numerator, denominator = self.fraction(0, ts)
-#         if (denominator == 0).any():
-#             print("Num:", numerator)
-#             print("Denom:", denominator)
         return nurbs_divide(numerator, denominator)
 
     def tangent(self, t, tangent_delta=None):
         return self.tangent_array(np.array([t]))[0]
 
     def tangent_array(self, ts, tangent_delta=None):
-        # curve = numerator / denominator
-        # ergo:
-        # numerator = curve * denominator
-        # ergo:
-        # numerator' = curve' * denominator + curve * denominator'
-        # ergo:
-        # curve' = (numerator' - curve*denominator') / denominator
-        numerator, denominator = self.fraction(0, ts)
-        curve = numerator / denominator
-        numerator1, denominator1 = self.fraction(1, ts)
-        curve1 = (numerator1 - curve*denominator1) / denominator
-        return curve1
+        return self.derivatives_array(1, ts)[0]
 
     def second_derivative(self, t, tangent_delta=None):
         return self.second_derivative_array(np.array([t]))[0]
 
     def second_derivative_array(self, ts, tangent_delta=None):
-        # numerator'' = (curve * denominator)'' =
-        #  = curve'' * denominator + 2 * curve' * denominator' + curve * denominator''
-        numerator, denominator = self.fraction(0, ts)
-        curve = numerator / denominator
-        numerator1, denominator1 = self.fraction(1, ts)
-        curve1 = (numerator1 - curve*denominator1) / denominator
-        numerator2, denominator2 = self.fraction(2, ts)
-        curve2 = (numerator2 - 2*curve1*denominator1 - curve*denominator2) / denominator
-        return curve2
+        return self.derivatives_array(2, ts)[1]
 
     def third_derivative_array(self, ts, tangent_delta=None):
-        # numerator''' = (curve * denominator)''' = 
-        #  = curve''' * denominator + 3 * curve'' * denominator' + 3 * curve' * denominator'' + denominator'''
-        numerator, denominator = self.fraction(0, ts)
-        curve = numerator / denominator
-        numerator1, denominator1 = self.fraction(1, ts)
-        curve1 = (numerator1 - curve*denominator1) / denominator
-        numerator2, denominator2 = self.fraction(2, ts)
-        curve2 = (numerator2 - 2*curve1*denominator1 - curve*denominator2) / denominator
-        numerator3, denominator3 = self.fraction(3, ts)
-
-        curve3 = (numerator3 - 3*curve2*denominator1 - 3*curve1*denominator2 - curve*denominator3) / denominator
-        return curve3
+        return self.derivatives_array(3, ts)[2]
 
     def derivatives_array(self, n, ts, tangent_delta=None):
+        # curve = numerator / denominator
+        # ergo:
+        # numerator = curve * denominator
+        # ergo:
+        # numerator' = curve' * denominator + curve * denominator'
+        # numerator'' = curve'' * denominator + 2 * curve' * denominator' + curve * denominator''
+        # numerator''' = curve''' * denominator + 3 * curve'' * denominator' + 3 * curve' * denominator'' + curve * denominator'''
+        # ergo:
+        # curve' = (numerator' - curve*denominator') / denominator
+        # and so on.
+        numerators, denominators = self.fraction_ders(min(n, 3), ts)
+        numerator, denominator = numerators[0], denominators[0]
+        curve = numerator / denominator
         result = []
         if n >= 1:
-            numerator, denominator = self.fraction(0, ts)
-            curve = numerator / denominator
-            numerator1, denominator1 = self.fraction(1, ts)
+            numerator1, denominator1 = numerators[1], denominators[1]
             curve1 = (numerator1 - curve*denominator1) / denominator
             result.append(curve1)
         if n >= 2:
-            numerator2, denominator2 = self.fraction(2, ts)
+            numerator2, denominator2 = numerators[2], denominators[2]
             curve2 = (numerator2 - 2*curve1*denominator1 - curve*denominator2) / denominator
             result.append(curve2)
         if n >= 3:
-            numerator3, denominator3 = self.fraction(3, ts)
+            numerator3, denominator3 = numerators[3], denominators[3]
             curve3 = (numerator3 - 3*curve2*denominator1 - 3*curve1*denominator2 - curve*denominator3) / denominator
             result.append(curve3)
         return result
@@ -0,0 +1,71 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Evaluates fitness of agents of the Evolver node in background Blender.
+It's started by the Evolver node (see FitnessWorkers class) with a copy of
+the current file like this:
+
+    $ blender -b scene.blend --addons sverchok --python evolver_worker.py -- config.json
+
+The config file has structure of the part of the tree needed for the fitness
+evaluation together with all gene nodes, names of gene nodes and address of
+the fitness output socket.
+Genes of agents are read from standard input, one JSON list of agents per
+line. Fitness values are written to standard output in one line per each
+input line with the WORKER_MARKER prefix.
+"""
+
+import json
+import sys
+import traceback
+
+import bpy
+
+WORKER_MARKER = 'SV_FITNESS '
+
+
+def evaluate_agents(config_path):
+    from sverchok.core.update_system import UpdateTree
+    from sverchok.utils.sv_json_import import JSONImporter
+    from sverchok.nodes.logic.evolver import build_genes_from_name, evaluate_genes
+
+    with open(config_path) as file:
+        config = json.load(file)
+
+    tree = bpy.data.node_groups.new('Evolver Worker', 'SverchCustomTreeType')
+    tree.sv_process = False
+    JSONImporter(config['tree']).import_into_tree(tree, print_log=False)
+    tree.sv_process = True
+    UpdateTree.reset_tree(tree)
+    for _ in UpdateTree.main_update(tree, update_interface=False):
+        pass
+
+    genes = build_genes_from_name(config['genes'], tree)
+    missing = set(config['genes'].split(',')[:-1]) - {g.name for g in genes}
+    if missing:
+        raise LookupError(f"Gene nodes are not found: {', '.join(sorted(missing))}")
+    node_name, socket_identifier = config['fitness']
+    fitness_node = tree.nodes[node_name]
+    fitness_socket = next(s for s in fitness_node.outputs if s.identifier == socket_identifier)
+    s_tree = UpdateTree.get(tree)
+    exec_nodes = s_tree.nodes_from([tree.nodes[g.name] for g in genes]) & s_tree.nodes_to([fitness_node])
+    exec_order = s_tree.sort_nodes(exec_nodes)
+
+    for line in sys.stdin:
+        try:
+            fitness = [float(evaluate_genes(tree, s_tree, genes, agent, exec_order, fitness_socket))
+                       for agent in json.loads(line)]
+            result = json.dumps({'fitness': fitness})
+        except Exception:
+            result = json.dumps({'error': traceback.format_exc()})
+        print(WORKER_MARKER + result, flush=True)
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    evaluate_agents(argv[0])
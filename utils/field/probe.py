@@ -10,32 +10,12 @@ import numpy as np
 
 from sverchok.utils.field.scalar import SvScalarField
 from sverchok.utils.logging import error
-from sverchok.utils.kdtree import SvKdTree
+from sverchok.utils.spatial_grid import SvUniformGrid
 
 BATCH_SIZE = 50
 MAX_ITERATIONS = 1000
-
-def _check_min_distance(v_new, vs_old, min_r):
-    if not vs_old:
-        return True
-    kdt = SvKdTree.new(SvKdTree.BLENDER, vs_old)
-    nearest, idx, dist = kdt.query(v_new)
-    if dist is None:
-        return True
-    ok = (dist >= min_r)
-    #if not ok:
-    #    print(f"V {v_new} => {nearest}, {dist} >= {min_r}")
-    return ok
-
-def _check_min_radius(point, old_points, old_radiuses, min_r):
-    if not old_points:
-        return True
-    old_points = np.array(old_points)
-    old_radiuses = np.array(old_radiuses)
-    point = np.array(point)
-    distances = np.linalg.norm(old_points - point, axis=1)
-    ok = (old_radiuses + min_r < distances).all()
-    return ok
+# bigger batches are used to generate a lot of points
+MAX_BATCHES = 100
 
 def field_random_probe(field, bbox, count,
         threshold=0, proportional=False, field_min=None, field_max=None,
@@ -72,6 +52,13 @@ def field_random_probe(field, bbox, count,
     if seed is not None:
         random.seed(seed)
 
+    if min_r_field is not None:
+        grid = SvUniformGrid()
+    elif min_r != 0:
+        grid = SvUniformGrid(min_r)
+    else:
+        grid = None
+
     b1, b2 = bbox
     x_min, y_min, z_min = b1
     x_max, y_max, z_max = b2
@@ -90,7 +77,7 @@ def field_random_probe(field, bbox, count,
         batch_zs = []
         batch = []
         left = count - done
-        max_size = min(BATCH_SIZE, left)
+        max_size = min(max(BATCH_SIZE, count // MAX_BATCHES), left)
         for i in range(max_size):
             x = random.uniform(x_min, x_max)
             y = random.uniform(y_min, y_max)
@@ -122,23 +109,21 @@ def field_random_probe(field, bbox, count,
         if min_r == 0 and min_r_field is None:
             good_verts = candidates
             good_radiuses = [0 for i in range(len(good_verts))]
+        elif not candidates:
+            good_verts = []
         elif min_r_field is not None:
-            xs = np.array([p[0] for p in candidates])
-            ys = np.array([p[1] for p in candidates])
-            zs = np.array([p[2] for p in candidates])
+            candidates = np.array(candidates)
+            xs, ys, zs = candidates[:,0], candidates[:,1], candidates[:,2]
             min_rs = min_r_field.evaluate_grid(xs, ys, zs).tolist()
-            good_verts = []
-            for candidate, min_r in zip(candidates, min_rs):
-                if random_radius:
-                    min_r = random.uniform(0, min_r)
-                if _check_min_radius(candidate, generated_verts + good_verts, generated_radiuses + good_radiuses, min_r):
-                    good_verts.append(candidate)
-                    good_radiuses.append(min_r)
+            if random_radius:
+                min_rs = [random.uniform(0, r) for r in min_rs]
+            min_rs = np.array(min_rs)
+            good = grid.check(candidates, min_rs)
+            good_verts = candidates[good].tolist()
+            good_radiuses = min_rs[good].tolist()
         else: # min_r != 0
-            good_verts = []
-            for candidate in candidates:
-                if _check_min_distance(candidate, generated_verts + good_verts, min_r):
-                    good_verts.append(candidate)
+            good = grid.check(candidates, min_r / 2.0)
+            good_verts = np.array(candidates)[good].tolist()
             good_radiuses = [1 for c in good_verts]
 
         if predicate is not None:
@@ -146,6 +131,12 @@ def field_random_probe(field, bbox, count,
             good_verts = [p[0] for p in pairs]
             good_radiuses = [p[1] for p in pairs]
 
+        if grid is not None:
+            if min_r_field is not None:
+                grid.add(good_verts, good_radiuses)
+            else:
+                grid.add(good_verts, min_r / 2.0)
+
         generated_verts.extend(good_verts)
         generated_radiuses.extend(good_radiuses)
         done += len(good_verts)
@@ -93,9 +93,186 @@ def ortho_project_curve(src_point, curve, subdomain = None, init_samples=10, on_
     result = CurveProjectionResult(us, points, src_point)
     return result
 
+def ortho_project_curve_array(src_points, curve, init_samples=10, on_fail=FAIL, tolerance=1e-10, maxiter=50):
+    """
+    Vectorized version of ortho_project_curve: find orthogonal projections of
+    many points onto the curve at once. Roots are searched in all segments
+    with sign change simultaneously, by Newton's method safeguarded with
+    bisection.
+    inputs:
+    * src_points: np.array of shape (n, 3)
+    * curve: SvCurve
+    * init_samples: first subdivide the curve in N segments; search for the
+      orthogonal projection on each segment.
+    * on_fail: what to do if no projection was found for a point:
+        FAIL - raise exception
+        RETURN_NONE - put None instead of the result for this point
+    * tolerance: target length of the tangent component of the vector between
+      the curve and the point.
+    * maxiter: maximum number of iterations
+    outputs:
+        list of CurveProjectionResult (or None) per source point.
+    """
+    src_points = np.asarray(src_points, dtype=np.float64)
+    u_min, u_max = curve.get_u_bounds()
+    u_samples = np.linspace(u_min, u_max, num=init_samples)
+    sample_points = curve.evaluate_array(u_samples)
+    sample_tangents = curve.tangent_array(u_samples)
+    # goal values for all points in all samples, shape (n, init_samples)
+    values = src_points @ sample_tangents.T - (sample_points * sample_tangents).sum(axis=1)
+
+    point_idxs, sample_idxs = np.nonzero(values[:, :-1] * values[:, 1:] <= 0)
+    ts1 = u_samples[sample_idxs]
+    ts2 = u_samples[sample_idxs + 1]
+    values1 = values[point_idxs, sample_idxs]
+    sources = src_points[point_idxs]
+
+    ts = (ts1 + ts2) / 2.0
+    active = np.arange(len(ts))
+    for i in range(maxiter):
+        if not len(active):
+            break
+        t = ts[active]
+        dv = sources[active] - curve.evaluate_array(t)
+        tangent = curve.tangent_array(t)
+        value = (dv * tangent).sum(axis=1)
+        derivative = (dv * curve.second_derivative_array(t)).sum(axis=1) - (tangent * tangent).sum(axis=1)
+
+        # shrink the brackets
+        same_sign = value * values1[active] > 0
+        ts1[active[same_sign]] = t[same_sign]
+        values1[active[same_sign]] = value[same_sign]
+        ts2[active[~same_sign]] = t[~same_sign]
+        t1, t2 = ts1[active], ts2[active]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_new = t - value / derivative
+        outside = ~((t_new > np.minimum(t1, t2)) & (t_new < np.maximum(t1, t2)))
+        t_new[outside] = ((t1 + t2) / 2.0)[outside]
+
+        done = (abs(value) <= tolerance * np.linalg.norm(tangent, axis=1)) | (abs(t2 - t1) <= 1e-12 * (u_max - u_min))
+        ts[active[~done]] = t_new[~done]
+        active = active[~done]
+
+    if len(ts):
+        points = curve.evaluate_array(ts)
+
+    results = []
+    for i, src_point in enumerate(src_points):
+        idxs = np.nonzero(point_idxs == i)[0]
+        if not len(idxs):
+            if on_fail == FAIL:
+                raise Exception("Can't calculate the projection of {} onto {}".format(src_point, curve))
+            elif on_fail == RETURN_NONE:
+                results.append(None)
+                continue
+            else:
+                raise Exception("Unsupported on_fail value")
+        results.append(CurveProjectionResult(ts[idxs].tolist(), list(points[idxs]), src_point))
+    return results
+
+def _tangent_residual(delta, tangent, ts, t_min, t_max):
+    """Length of the tangent component of the vectors between the manifold and
+    the points, it is zero where the point is beyond the parameter bound"""
+    gradient = (delta * tangent).sum(axis=1)
+    on_bound = ((ts <= t_min) & (gradient > 0)) | ((ts >= t_max) & (gradient < 0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        residual = abs(gradient) / np.linalg.norm(tangent, axis=1)
+    return np.where(on_bound, 0.0, residual)
+
+def _curve_derivatives(curve, ts, h):
+    """
+    Points, first and second derivatives of the curve, by central finite
+    differences. The curve is evaluated in all stencil points by one
+    evaluate_array call. Near the bounds the stencil is shifted inside the
+    curve domain, first derivatives are corrected by the Taylor expansion.
+    """
+    n = len(ts)
+    t_min, t_max = curve.get_u_bounds()
+    cs = np.clip(ts, t_min + h, t_max - h)
+    points, center, plus, minus = curve.evaluate_array(np.concatenate((ts, cs, cs + h, cs - h))).reshape((4, n, 3))
+    second = (plus - 2 * center + minus) / (h * h)
+    tangent = (plus - minus) / (2 * h) + second * (ts - cs)[:, np.newaxis]
+    return points, tangent, second
+
+def refine_nearest_on_curve(src_points, curve, ts, tolerance=1e-6, maxiter=50):
+    """
+    Vectorized search of the nearest points on the curve by Newton's method
+    with Levenberg-Marquardt damping; Gauss-Newton approximation of the
+    second derivative is used where the distance is not convex. All points are
+    moved simultaneously; the T parameter is clamped to curve bounds.
+    inputs:
+    * src_points: np.array of shape (n, 3)
+    * curve: SvCurve
+    * ts: initial guess, np.array of shape (n,)
+    * tolerance: target length of the tangent component of the vector between
+      the curve and the point, or of the last step if the tangent component
+      is shorter than square root of the tolerance.
+    * maxiter: maximum number of iterations
+    outputs:
+        tuple (ts, converged), where converged is a boolean mask of points
+        for which the iterations converged.
+    """
+    src_points = np.asarray(src_points, dtype=np.float64)
+    t_min, t_max = curve.get_u_bounds()
+    h = 1e-4 * (t_max - t_min)
+    ts = np.array(ts, dtype=np.float64)
+    n = len(ts)
+    converged = np.zeros(n, dtype=bool)
+    if not n:
+        return ts, converged
+    damping = np.full(n, 1e-3)
+    data = _curve_derivatives(curve, ts, h)
+
+    active = np.arange(n)
+    for i in range(maxiter):
+        if not len(active):
+            break
+        t = ts[active]
+        points, tangent, second = [d[active] for d in data]
+        delta = points - src_points[active]
+        gradient = (delta * tangent).sum(axis=1)
+        tangent_sq = (tangent * tangent).sum(axis=1)
+        hessian = tangent_sq + (delta * second).sum(axis=1)
+        hessian = np.where(hessian > 0, hessian, tangent_sq)
+
+        on_bound = ((t <= t_min) & (gradient > 0)) | ((t >= t_max) & (gradient < 0))
+        done = on_bound | (abs(gradient) <= tolerance * np.sqrt(tangent_sq))
+        converged[active[done]] = True
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = - gradient / (hessian + damping[active] * tangent_sq)
+        good = ~done & np.isfinite(step)
+        active, delta = active[good], delta[good]
+        new_ts = np.clip(t + step, t_min, t_max)[good]
+        if not len(active):
+            break
+
+        new_data = _curve_derivatives(curve, new_ts, h)
+        new_delta = new_data[0] - src_points[active]
+        better = (new_delta * new_delta).sum(axis=1) < (delta * delta).sum(axis=1)
+        damping[active[better]] = np.maximum(damping[active[better]] / 10.0, 1e-12)
+        damping[active[~better]] *= 10.0
+
+        accepted = active[better]
+        ts[accepted] = new_ts[better]
+        for values, new_values in zip(data, new_data):
+            values[accepted] = new_values[better]
+        # a step can be short because of the damping, so a short step means
+        # convergence only near the minimum
+        moves = np.linalg.norm(new_delta[better] - delta[better], axis=1)
+        residual = _tangent_residual(new_delta[better], new_data[1][better], new_ts[better], t_min, t_max)
+        converged[accepted[(moves < tolerance) & (residual < np.sqrt(tolerance))]] = True
+        # stalled points are left for the fallback solver
+        active = active[(~better & (damping[active] < 1e10)) | (better & ~converged[active])]
+
+    return ts, converged
+
 def nearest_point_on_curve(src_points, curve, samples=10, precise=True, method='Brent', output_points=True, logger=None):
     """
     Find nearest point on any curve.
+    The initial guess is refined for all points at once by
+    refine_nearest_on_curve; scipy's minimize_scalar is used only for points
+    for which it did not converge.
     """
     if logger is None:
         logger = getLogger()
@@ -129,7 +306,10 @@ def nearest_point_on_curve(src_points, curve, samples=10, precise=True, method='
     init_ts, init_points = init_guess(curve, src_points)
     result_ts = []
     if precise:
-        for src_point, init_t, init_point in zip(src_points, init_ts, init_points):
+        result_ts, converged = refine_nearest_on_curve(src_points, curve, init_ts)
+        result_ts = result_ts.tolist()
+        for idx in np.nonzero(~converged)[0]:
+            src_point, init_t = src_points[idx], result_ts[idx]
             delta_t = (t_max - t_min) / samples
             logger.debug("T_min %s, T_max %s, init_t %s, delta_t %s", t_min, t_max, init_t, delta_t)
             if init_t <= t_min:
@@ -162,7 +342,7 @@ def nearest_point_on_curve(src_points, curve, samples=10, precise=True, method='
                 t0 = t_min
             elif t0 > t_max:
                 t0 = t_max
-            result_ts.append(t0)
+            result_ts[idx] = t0
     else:
         result_ts = init_ts
 
@@ -451,19 +631,12 @@ class SurfaceRaycaster(object):
         samples = self.samples
         uh2 = (self.u_max - self.u_min) / (2 * samples)
         vh2 = (self.v_max - self.v_min) / (2 * samples)
-        faces = []
-        center_us = []
-        center_vs = []
-        for row in range(samples - 1):
-            for col in range(samples - 1):
-                i = row * samples + col
-                face = (i, i+samples, i+samples+1, i+1)
-                u = self.us[i] + uh2
-                v = self.vs[i] + vh2
-                center_us.append(u)
-                center_vs.append(v)
-                faces.append(face)
-        return center_us, center_vs, faces
+        rows, cols = np.meshgrid(np.arange(samples - 1), np.arange(samples - 1), indexing='ij')
+        idxs = (rows * samples + cols).flatten()
+        faces = np.stack((idxs, idxs + samples, idxs + samples + 1, idxs + 1), axis=-1)
+        center_us = self.us[idxs] + uh2
+        center_vs = self.vs[idxs] + vh2
+        return center_us, center_vs, faces.tolist()
 
     def _init_guess(self, src_points, directions):
         if self.bvh is None:
@@ -493,42 +666,115 @@ class SurfaceRaycaster(object):
             return (on_surface - on_line).flatten()
         return function
 
+    def _newton(self, src_points, directions, us, vs, ts, tolerance=1e-8, maxiter=50):
+        """
+        Solve surface(u, v) = src_point + t * direction for all rays at once
+        by Newton's method. The step is halved for rays where it does not
+        decrease the residual; U and V are clamped to surface bounds.
+        Returns (us, vs, ts, converged), where converged is a boolean mask of
+        rays for which the solution was found.
+        """
+        n = len(us)
+        converged = np.zeros(n, dtype=bool)
+        if not n:
+            return us, vs, ts, converged
+        step_scale = np.ones(n)
+        data = self.surface.derivatives_data_array(us, vs)
+        points, dus, dvs = np.array(data.points), np.array(data.du), np.array(data.dv)
+
+        active = np.arange(n)
+        for i in range(maxiter):
+            residual = points[active] - src_points[active] - ts[active][:, np.newaxis] * directions[active]
+            done = np.linalg.norm(residual, axis=1) < tolerance
+            converged[active[done]] = True
+            active, residual = active[~done], residual[~done]
+            if not len(active):
+                break
+
+            # solve [du, dv, -direction] @ step = -residual by Cramer's rule
+            du, dv, direction = dus[active], dvs[active], directions[active]
+            dv_x_dir = np.cross(dv, direction)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                det = - (du * dv_x_dir).sum(axis=1)
+                step_u = (residual * dv_x_dir).sum(axis=1) / det
+                step_v = (du * np.cross(residual, direction)).sum(axis=1) / det
+                step_t = - (du * np.cross(dv, residual)).sum(axis=1) / det
+            good = np.isfinite(step_u) & np.isfinite(step_v) & np.isfinite(step_t)
+            active, residual = active[good], residual[good]
+            scale = step_scale[active]
+            new_us = np.clip(us[active] + scale * step_u[good], self.u_min, self.u_max)
+            new_vs = np.clip(vs[active] + scale * step_v[good], self.v_min, self.v_max)
+            new_ts = ts[active] + scale * step_t[good]
+            if not len(active):
+                break
+
+            new_data = self.surface.derivatives_data_array(new_us, new_vs)
+            new_residual = new_data.points - src_points[active] - new_ts[:, np.newaxis] * directions[active]
+            better = (new_residual * new_residual).sum(axis=1) < (residual * residual).sum(axis=1)
+            accepted = active[better]
+            us[accepted] = new_us[better]
+            vs[accepted] = new_vs[better]
+            ts[accepted] = new_ts[better]
+            points[accepted] = new_data.points[better]
+            dus[accepted] = new_data.du[better]
+            dvs[accepted] = new_data.dv[better]
+            step_scale[accepted] = 1.0
+            step_scale[active[~better]] *= 0.5
+            # stalled rays are left for the fallback solver
+            active = active[better | (step_scale[active] > 1e-3)]
+
+        return us, vs, ts, converged
+
     def raycast(self, src_points, directions, precise=True, calc_points=True, method='hybr', on_init_fail = SKIP):
+        """
+        Find intersections of rays with the surface. Intersections are
+        searched for all rays at once by Newton's method, starting from the
+        intersections with the tessellated surface; scipy's root is used
+        only for rays for which Newton's method did not converge.
+        """
         result = RaycastResult()
         guess = self._init_guess(src_points, directions)
         result.init_us, result.init_vs = guess.us, guess.vs
         result.init_ts = guess.ts
         result.init_points = guess.nearest
-        for point, direction, init_u, init_v, init_t, init_point in zip(src_points, directions, result.init_us, result.init_vs, result.init_ts, result.init_points):
-            if init_u is None:
-                if on_init_fail == SKIP:
-                    continue
-                elif on_init_fail == FAIL:
-                    raise Exception("Can't find initial guess of the projection for {}".format(point))
-                elif on_init_fail == RETURN_NONE:
-                    return None
-                else:
-                    raise Exception("Invalid on_init_fail value")
 
-            if precise:
-                direction = np.array(direction)
-                direction = direction / np.linalg.norm(direction)
-                projection = root(self._goal(np.array(point), direction),
-                            x0 = np.array([init_u, init_v, init_t]),
+        if not guess.all_good:
+            if on_init_fail == FAIL:
+                idx = guess.us.index(None)
+                raise Exception("Can't find initial guess of the projection for {}".format(src_points[idx]))
+            elif on_init_fail == RETURN_NONE:
+                return None
+            elif on_init_fail != SKIP:
+                raise Exception("Invalid on_init_fail value")
+        good = [i for i, u in enumerate(guess.us) if u is not None]
+
+        if precise:
+            points = np.array([src_points[i] for i in good], dtype=np.float64).reshape((-1, 3))
+            dirs = np.array([directions[i] for i in good], dtype=np.float64).reshape((-1, 3))
+            dirs /= np.linalg.norm(dirs, axis=1, keepdims=True)
+            us, vs, ts, converged = self._newton(points, dirs,
+                                        np.array([guess.us[i] for i in good], dtype=np.float64),
+                                        np.array([guess.vs[i] for i in good], dtype=np.float64),
+                                        np.array([guess.ts[i] for i in good], dtype=np.float64))
+
+            for j in np.nonzero(~converged)[0]:
+                i = good[j]
+                projection = root(self._goal(points[j], dirs[j]),
+                            x0 = np.array([guess.us[i], guess.vs[i], guess.ts[i]]),
                             method = method)
                 if not projection.success:
-                    raise Exception("Can't find the projection for {}: {}".format(point, projection.message))
-                u0, v0, t0 = projection.x
-            else:
-                u0, v0 = init_u, init_v
-                result.points.append(init_point)
+                    raise Exception("Can't find the projection for {}: {}".format(src_points[i], projection.message))
+                us[j], vs[j], ts[j] = projection.x
 
-            result.uvs.append((u0, v0, 0))
-            result.us.append(u0)
-            result.vs.append(v0)
-
-        if precise and calc_points:
-            result.points = self.surface.evaluate_array(np.array(result.us), np.array(result.vs)).tolist()
+            result.us = us.tolist()
+            result.vs = vs.tolist()
+            if calc_points:
+                result.points = self.surface.evaluate_array(us, vs).tolist()
+        else:
+            result.us = [guess.us[i] for i in good]
+            result.vs = [guess.vs[i] for i in good]
+            result.points = [guess.nearest[i] for i in good]
+        result.uvs = [(u, v, 0) for u, v in zip(result.us, result.vs)]
 
         return result
 
@@ -647,7 +893,137 @@ def intersect_curve_surface(curve, surface, init_samples=10, raycast_samples=10,
 
     return result
 
+def _surface_derivatives(surface, us, vs, h_u, h_v):
+    """
+    Points, first and second derivatives of the surface, by central finite
+    differences. The surface is evaluated in all stencil points by one
+    evaluate_array call. Near the bounds the stencil is shifted inside the
+    surface domain, first derivatives are corrected by the Taylor expansion.
+    """
+    n = len(us)
+    cu = np.clip(us, surface.get_u_min() + h_u, surface.get_u_max() - h_u)
+    cv = np.clip(vs, surface.get_v_min() + h_v, surface.get_v_max() - h_v)
+    all_us = np.concatenate((us, cu, cu + h_u, cu - h_u, cu, cu, cu + h_u))
+    all_vs = np.concatenate((vs, cv, cv, cv, cv + h_v, cv - h_v, cv + h_v))
+    points, center, u_plus, u_minus, v_plus, v_minus, uv_plus = surface.evaluate_array(all_us, all_vs).reshape((7, n, 3))
+    du = (u_plus - u_minus) / (2 * h_u)
+    dv = (v_plus - v_minus) / (2 * h_v)
+    duu = (u_plus - 2 * center + u_minus) / (h_u * h_u)
+    dvv = (v_plus - 2 * center + v_minus) / (h_v * h_v)
+    duv = (uv_plus - u_plus - v_plus + center) / (h_u * h_v)
+    # move first derivatives back from the shifted stencil center
+    shift_u = (us - cu)[:, np.newaxis]
+    shift_v = (vs - cv)[:, np.newaxis]
+    du += duu * shift_u + duv * shift_v
+    dv += duv * shift_u + dvv * shift_v
+    return points, du, dv, duu, duv, dvv
+
+def refine_nearest_on_surface(points_from, surface, us, vs, tolerance=1e-6, maxiter=50):
+    """
+    Vectorized search of the nearest points on the surface by Newton's method
+    with Levenberg-Marquardt damping; Gauss-Newton approximation of the
+    Hessian is used where the distance is not convex. All points are moved
+    simultaneously; U and V parameters are clamped to surface bounds.
+    inputs:
+    * points_from: np.array of shape (n, 3)
+    * surface: SvSurface
+    * us, vs: initial guess, np.arrays of shape (n,)
+    * tolerance: target length of the tangent components of the vector between
+      the surface and the point, or of the last step if the tangent components
+      are shorter than square root of the tolerance.
+    * maxiter: maximum number of iterations
+    outputs:
+        tuple (us, vs, converged), where converged is a boolean mask of points
+        for which the iterations converged.
+    """
+    points_from = np.asarray(points_from, dtype=np.float64)
+    u_min, u_max = surface.get_u_min(), surface.get_u_max()
+    v_min, v_max = surface.get_v_min(), surface.get_v_max()
+    h_u = 1e-4 * (u_max - u_min)
+    h_v = 1e-4 * (v_max - v_min)
+    us = np.array(us, dtype=np.float64)
+    vs = np.array(vs, dtype=np.float64)
+    n = len(us)
+    converged = np.zeros(n, dtype=bool)
+    if not n:
+        return us, vs, converged
+    damping = np.full(n, 1e-3)
+    data = _surface_derivatives(surface, us, vs, h_u, h_v)
+
+    active = np.arange(n)
+    for i in range(maxiter):
+        if not len(active):
+            break
+        u, v = us[active], vs[active]
+        points, du, dv, duu, duv, dvv = [d[active] for d in data]
+        delta = points - points_from[active]
+        grad_u = (delta * du).sum(axis=1)
+        grad_v = (delta * dv).sum(axis=1)
+        g_uu = (du * du).sum(axis=1)
+        g_vv = (dv * dv).sum(axis=1)
+        g_uv = (du * dv).sum(axis=1)
+        h_uu = g_uu + (delta * duu).sum(axis=1)
+        h_vv = g_vv + (delta * dvv).sum(axis=1)
+        h_uv = g_uv + (delta * duv).sum(axis=1)
+        not_convex = (h_uu <= 0) | (h_uu * h_vv - h_uv * h_uv <= 0)
+        h_uu = np.where(not_convex, g_uu, h_uu)
+        h_vv = np.where(not_convex, g_vv, h_vv)
+        h_uv = np.where(not_convex, g_uv, h_uv)
+
+        # parameters on bounds, which the gradient pushes outside, are fixed
+        fixed_u = ((u <= u_min) & (grad_u > 0)) | ((u >= u_max) & (grad_u < 0))
+        fixed_v = ((v <= v_min) & (grad_v > 0)) | ((v >= v_max) & (grad_v < 0))
+        grad_u[fixed_u] = 0
+        grad_v[fixed_v] = 0
+        done = (abs(grad_u) <= tolerance * np.sqrt(g_uu)) & (abs(grad_v) <= tolerance * np.sqrt(g_vv))
+        converged[active[done]] = True
+
+        a = np.where(fixed_u, 1.0, h_uu + damping[active] * g_uu)
+        d = np.where(fixed_v, 1.0, h_vv + damping[active] * g_vv)
+        b = np.where(fixed_u | fixed_v, 0.0, h_uv)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            det = a * d - b * b
+            step_u = (b * grad_v - d * grad_u) / det
+            step_v = (b * grad_u - a * grad_v) / det
+        good = ~done & np.isfinite(step_u) & np.isfinite(step_v)
+        active, delta = active[good], delta[good]
+        new_us = np.clip(u + step_u, u_min, u_max)[good]
+        new_vs = np.clip(v + step_v, v_min, v_max)[good]
+        if not len(active):
+            break
+
+        new_data = _surface_derivatives(surface, new_us, new_vs, h_u, h_v)
+        new_delta = new_data[0] - points_from[active]
+        better = (new_delta * new_delta).sum(axis=1) < (delta * delta).sum(axis=1)
+        damping[active[better]] = np.maximum(damping[active[better]] / 10.0, 1e-12)
+        damping[active[~better]] *= 10.0
+
+        accepted = active[better]
+        us[accepted] = new_us[better]
+        vs[accepted] = new_vs[better]
+        for values, new_values in zip(data, new_data):
+            values[accepted] = new_values[better]
+        # a step can be short because of the damping, so a short step means
+        # convergence only near the minimum
+        moves = np.linalg.norm(new_delta[better] - delta[better], axis=1)
+        residual = np.maximum(
+            _tangent_residual(new_delta[better], new_data[1][better], new_us[better], u_min, u_max),
+            _tangent_residual(new_delta[better], new_data[2][better], new_vs[better], v_min, v_max))
+        converged[accepted[(moves < tolerance) & (residual < np.sqrt(tolerance))]] = True
+        # stalled points are left for the fallback solver
+        active = active[(~better & (damping[active] < 1e10)) | (better & ~converged[active])]
+
+    return us, vs, converged
+
 def nearest_point_on_surface(points_from, surface, init_samples=50, precise=True, method='L-BFGS-B', sequential=False, output_points=True):
+    """
+    Find nearest points on any surface.
+    The initial guess is refined for all points at once by
+    refine_nearest_on_surface; scipy's minimize is used only for points for
+    which it did not converge. If sequential is True, the result for the
+    previous point is used as the initial guess for each point instead of the
+    nearest sample, the points are refined one by one then.
+    """
 
     u_min = surface.get_u_min()
     u_max = surface.get_u_max()
@@ -686,36 +1062,41 @@ def nearest_point_on_surface(points_from, surface, init_samples=50, precise=True
         return distance
 
     init_us, init_vs, init_points = init_guess()
-    result_us = []
-    result_vs = []
-    result_points = []
 
-    prev_uv = None
-    for src_point, init_u, init_v, init_point in zip(points_from, init_us, init_vs, init_points):
-        if precise:
-            if sequential and prev_uv is not None:
-                x0 = np.array(prev_uv)
-            else:
-                x0 = np.array([init_u, init_v])
+    def minimize_point(idx):
+        src_point = points_from[idx]
+        result = minimize(goal(src_point),
+                    x0 = np.array([result_us[idx], result_vs[idx]]),
+                    bounds = [(u_min, u_max), (v_min, v_max)],
+                    method = method
+                )
+        if not result.success:
+            raise Exception("Can't find the nearest point for {}: {}".format(src_point, result.message))
+        result_us[idx], result_vs[idx] = result.x
 
-            result = minimize(goal(src_point),
-                        x0 = x0,
-                        bounds = [(u_min, u_max), (v_min, v_max)],
-                        method = method
-                    )
-            if not result.success:
-                raise Exception("Can't find the nearest point for {}: {}".format(src_point, result.message))
-            u0, v0 = result.x
-            prev_uv = result.x
+    if precise:
+        if sequential:
+            # the initial guess depends on the result for the previous point,
+            # so the points are refined one by one
+            result_us = np.array(init_us, dtype=np.float64)
+            result_vs = np.array(init_vs, dtype=np.float64)
+            for idx in range(len(result_us)):
+                u0, v0 = (result_us[idx - 1], result_vs[idx - 1]) if idx else (init_us[0], init_vs[0])
+                us, vs, converged = refine_nearest_on_surface(points_from[idx: idx + 1], surface, [u0], [v0])
+                result_us[idx], result_vs[idx] = us[0], vs[0]
+                if not converged[0]:
+                    minimize_point(idx)
         else:
-            u0, v0 = init_u, init_v
-            result_points.append(init_point)
-
-        result_us.append(u0)
-        result_vs.append(v0)
-
-    if precise and output_points:
-        result_points = surface.evaluate_array(np.array(result_us), np.array(result_vs)).tolist()
+            result_us, result_vs, converged = refine_nearest_on_surface(points_from, surface, init_us, init_vs)
+            for idx in np.flatnonzero(~converged):
+                minimize_point(idx)
+
+        if output_points:
+            result_points = surface.evaluate_array(result_us, result_vs).tolist()
+        result_us = result_us.tolist()
+        result_vs = result_vs.tolist()
+    else:
+        result_us, result_vs, result_points = init_us, init_vs, init_points
 
     if output_points:
         return result_us, result_vs, result_points
@@ -1,5 +1,5 @@
 """
-Pure Python implementation of marching cubes algorithm
+Pure Python (NumPy) implementation of marching cubes algorithm
 Adapted from https://github.com/mutantbob/blender-marching-cubes/blob/master/marching-cube.py
 """
 """
@@ -457,32 +457,78 @@ def cornerloop(x,y,z):
         for cy,cx in zip((0,y,y,0),(0,0,x,x)):
              yield cx,cy,cz
 
+# offsets of cube corners in the order used by the tables
+CORNER_OFFSETS = np.array([
+        (0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0),
+        (0, 0, 1), (0, 1, 1), (1, 1, 1), (1, 0, 1)])
+
+# cube edges as pairs of corners
+CUBE_EDGES = np.array([
+        (0, 1), (1, 2), (2, 3), (3, 0),
+        (4, 5), (5, 6), (6, 7), (7, 4),
+        (0, 4), (1, 5), (2, 6), (3, 7)])
+
 def isosurface_np(data, isolevel):
-    triangles = []
-    z_a = 0
-    z_plane_a = data[:,:,z_a]
+    """
+    Vectorized marching cubes.
+    Each edge of the grid is identified by its start grid point (the one with
+    lower coordinates) and its axis, so vertices are shared between cubes
+    via the edge ids.
+
+    inputs:
+    * data: array of values of shape (sx, sy, sz)
+    * isolevel: value of the surface
+
+    outputs:
+    * vertices: array of shape (n, 3) in grid index coordinates
+    * faces: array of shape (m, 3)
+    """
+    data = np.asarray(data, dtype=np.float64)
     sx, sy, sz = data.shape
+    if min(sx, sy, sz) < 2:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+
+    # index of each cube in the edge and triangle tables
+    below = data < isolevel
+    cube_index = np.zeros((sx-1, sy-1, sz-1), dtype=np.int64)
+    for i, (dx, dy, dz) in enumerate(CORNER_OFFSETS):
+        cube_index |= below[dx:sx-1+dx, dy:sy-1+dy, dz:sz-1+dz].astype(np.int64) << i
+
+    edge_table = np.array(edgetable)
+    cubes = np.argwhere(edge_table[cube_index] != 0)
+    if len(cubes) == 0:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+    cases = cube_index[cubes[:,0], cubes[:,1], cubes[:,2]]
+
+    # up to 5 triangles per cube, rows of -1 are absent triangles
+    tri_table = np.array(tritable)[:, :15].reshape((256, 5, 3))
+    cube_triangles = tri_table[cases]
+    tri_cubes, tri_idxs = np.nonzero(cube_triangles[:, :, 0] != -1)
+    tri_edges = cube_triangles[tri_cubes, tri_idxs]
+
+    # ids of grid edges of the triangles corners
+    edge_starts = np.minimum(CORNER_OFFSETS[CUBE_EDGES[:,0]], CORNER_OFFSETS[CUBE_EDGES[:,1]])
+    edge_axes = np.argmax(CORNER_OFFSETS[CUBE_EDGES[:,0]] != CORNER_OFFSETS[CUBE_EDGES[:,1]], axis=1)
+    starts = cubes[tri_cubes][:, np.newaxis, :] + edge_starts[tri_edges]
+    n_points = sx * sy * sz
+    edge_ids = edge_axes[tri_edges] * n_points \
+                + np.ravel_multi_index((starts[...,0], starts[...,1], starts[...,2]), data.shape)
+
+    edge_ids, faces = np.unique(edge_ids, return_inverse=True)
+    faces = faces.reshape((-1, 3))
 
-    polygoniser = Polygoniser(isolevel)
-    for z in range(sz-1):
-        z2 = z+1
-        z_plane_b = data[:,:,z2]
-        for y in range(sy-1):
-            y2 = y+1
-            for x in range(sx-1):
-                x2 = x+1
-                cornervalues = [
-                    z_plane_a[x][y],
-                    z_plane_a[x][y+1],
-                    z_plane_a[x+1][y+1],
-                    z_plane_a[x+1][y],
-                    z_plane_b[x][y],
-                    z_plane_b[x][y+1],
-                    z_plane_b[x+1][y+1],
-                    z_plane_b[x+1][y],
-                ]
-                triangles.extend(polygoniser.polygonise(cornervalues, x,y,z, x2, y2, z2))
-        z_plane_a = z_plane_b
-
-    return np.array(polygoniser.vertices), triangles
+    # interpolation along the edges
+    axes = edge_ids // n_points
+    p1 = np.stack(np.unravel_index(edge_ids % n_points, data.shape), axis=1)
+    p2 = p1 + np.eye(3, dtype=np.int64)[axes]
+    v1 = data[p1[:,0], p1[:,1], p1[:,2]]
+    v2 = data[p2[:,0], p2[:,1], p2[:,2]]
+    dv = v2 - v1
+    good = np.abs(dv) >= 0.00001
+    mu = np.zeros(len(edge_ids))
+    mu[good] = (isolevel - v1[good]) / dv[good]
+    mu[np.abs(isolevel - v2) < 0.00001] = 1.0
+    mu[np.abs(isolevel - v1) < 0.00001] = 0.0
+    vertices = p1 + mu[:, np.newaxis] * (p2 - p1)
 
+    return vertices, faces
@@ -0,0 +1,295 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Matrices kept in one numpy array of shape (n, 4, 4) (see MatrixArray) and
+functions which compose, invert and decompose all matrices at once.
+Matrices are stored row by row like in mathutils, quaternions are stored in
+W, X, Y, Z order. The functions follow the conventions of mathutils, so they
+give the same results as the Matrix and Quaternion methods.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from mathutils import Matrix
+
+# axes of an Euler order and whether its parity is odd, like in Blender
+EULER_ORDERS = {
+    'XYZ': ((0, 1, 2), False),
+    'XZY': ((0, 2, 1), True),
+    'YXZ': ((1, 0, 2), True),
+    'YZX': ((1, 2, 0), False),
+    'ZXY': ((2, 0, 1), False),
+    'ZYX': ((2, 1, 0), True),
+}
+
+# Blender uses this threshold to detect the gimbal lock
+EULER_HYPOT_EPSILON = 0.0000375
+
+
+class MatrixArray:
+    """
+    List of 4x4 matrices kept in an array of shape (n, 4, 4), data of the
+    Matrix socket
+
+    The matrices are passed between nodes via sockets without copying, the
+    array should not be changed in place then. Nodes with
+    `accepts_matrix_arrays` attribute get it as is, other nodes get a list of
+    mathutils matrices. The conversion is done only once. Indexing and
+    iteration give mathutils matrices as well.
+
+    matrices = MatrixArray.compose(locations, quaternions_to_rotations(quaternions), scales)
+    out_matrices.sv_set(matrices)
+    """
+    def __init__(self, array):
+        self.array = np.asarray(array, dtype=np.float64).reshape((-1, 4, 4))
+        self._list = None
+
+    @classmethod
+    def from_matrices(cls, matrices) -> MatrixArray:
+        """Creates the array from a list of mathutils matrices"""
+        if isinstance(matrices, MatrixArray):
+            return matrices
+        return cls(matrix_array(matrices))
+
+    @classmethod
+    def compose(cls, locations, rotations, scales) -> MatrixArray:
+        """See compose_matrices"""
+        return cls(compose_matrices(locations, rotations, scales))
+
+    def decompose(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """See decompose_matrices"""
+        return decompose_matrices(self.array)
+
+    def inverted(self) -> MatrixArray:
+        """Inverted matrices, it raises ValueError if some of them are singular"""
+        return MatrixArray(np.linalg.inv(self.array))
+
+    def __matmul__(self, other) -> MatrixArray:
+        """Matrices multiplied by matrices of the same number, or by one matrix"""
+        return MatrixArray(np.matmul(self.array, matrix_array(other)))
+
+    def __rmatmul__(self, other) -> MatrixArray:
+        return MatrixArray(np.matmul(matrix_array(other), self.array))
+
+    def to_list(self) -> list:
+        """The matrices as a list of mathutils matrices, it's converted lazily"""
+        if self._list is None:
+            self._list = [Matrix(m) for m in self.array.tolist()]
+        return self._list
+
+    @property
+    def nbytes(self) -> int:
+        return self.array.nbytes
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return MatrixArray(self.array[index])
+        if self._list is not None:
+            return self._list[index]
+        return Matrix(self.array[index].tolist())
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __getstate__(self):
+        return {'array': self.array}  # mathutils matrices can't be pickled
+
+    def __setstate__(self, state):
+        self.array = state['array']
+        self._list = None
+
+    def __repr__(self):
+        return f'<MATRIX ARRAY matrices={len(self)}>'
+
+
+def matrix_array(matrices) -> np.ndarray:
+    """Array of shape (n, 4, 4) from a MatrixArray or a list of mathutils
+    matrices, the array of MatrixArray is returned as is"""
+    if isinstance(matrices, MatrixArray):
+        return matrices.array
+    if isinstance(matrices, Matrix):
+        matrices = [matrices]
+    return np.array(matrices, dtype=np.float64).reshape((-1, 4, 4))
+
+
+def compose_matrices(locations, rotations, scales) -> np.ndarray:
+    """
+    Matrices of translation @ rotation @ scale like Matrix.LocRotScale
+    inputs:
+    * locations: array of shape (n, 3)
+    * rotations: rotation matrices, array of shape (n, 3, 3)
+    * scales: array of shape (n, 3)
+    outputs:
+        array of shape (n, 4, 4)
+    """
+    locations = np.asarray(locations, dtype=np.float64)
+    rotations = np.asarray(rotations, dtype=np.float64)
+    scales = np.asarray(scales, dtype=np.float64)
+    matrices = np.zeros((len(locations), 4, 4))
+    matrices[:, :3, :3] = rotations * scales[:, np.newaxis, :]
+    matrices[:, :3, 3] = locations
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+def decompose_matrices(matrices) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Splits matrices into their translation, rotation and scale like
+    Matrix.decompose. Matrices with negative determinant get negative scale.
+    inputs:
+    * matrices: array of shape (n, 4, 4)
+    outputs:
+        tuple (locations, quaternions, scales) of arrays of shapes
+        (n, 3), (n, 4) and (n, 3)
+    """
+    matrices = np.asarray(matrices, dtype=np.float64)
+    locations = matrices[:, :3, 3].copy()
+    mat3 = matrices[:, :3, :3]
+    scales = np.linalg.norm(mat3, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rotations = np.where(scales[:, np.newaxis, :] > 0, mat3 / scales[:, np.newaxis, :], 0.0)
+    negative = np.linalg.det(rotations) < 0
+    rotations[negative] *= -1
+    scales[negative] *= -1
+    return locations, rotations_to_quaternions(rotations), scales
+
+
+def quaternions_to_rotations(quaternions) -> np.ndarray:
+    """Rotation matrices of shape (n, 3, 3) from quaternions of shape (n, 4)
+    like Quaternion.to_matrix, the quaternions are not normalized"""
+    quaternions = np.asarray(quaternions, dtype=np.float64).reshape((-1, 4))
+    w, x, y, z = quaternions.T
+    rotations = np.empty((len(quaternions), 3, 3))
+    rotations[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    rotations[:, 0, 1] = 2.0 * (x * y - w * z)
+    rotations[:, 0, 2] = 2.0 * (x * z + w * y)
+    rotations[:, 1, 0] = 2.0 * (x * y + w * z)
+    rotations[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    rotations[:, 1, 2] = 2.0 * (y * z - w * x)
+    rotations[:, 2, 0] = 2.0 * (x * z - w * y)
+    rotations[:, 2, 1] = 2.0 * (y * z + w * x)
+    rotations[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return rotations
+
+
+def rotations_to_quaternions(rotations) -> np.ndarray:
+    """Normalized quaternions of shape (n, 4) with not negative W from
+    rotation matrices of shape (n, 3, 3)"""
+    m = np.asarray(rotations, dtype=np.float64)
+    n = len(m)
+    m00, m11, m22 = m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]
+    # for a unit quaternion 4 * q @ q.T is expressed via elements of the matrix,
+    # the quaternion is taken from the row with the biggest diagonal element
+    products = np.empty((4, 4, n))
+    products[0, 0] = 1 + m00 + m11 + m22
+    products[1, 1] = 1 + m00 - m11 - m22
+    products[2, 2] = 1 - m00 + m11 - m22
+    products[3, 3] = 1 - m00 - m11 + m22
+    products[0, 1] = products[1, 0] = m[:, 2, 1] - m[:, 1, 2]
+    products[0, 2] = products[2, 0] = m[:, 0, 2] - m[:, 2, 0]
+    products[0, 3] = products[3, 0] = m[:, 1, 0] - m[:, 0, 1]
+    products[1, 2] = products[2, 1] = m[:, 1, 0] + m[:, 0, 1]
+    products[1, 3] = products[3, 1] = m[:, 0, 2] + m[:, 2, 0]
+    products[2, 3] = products[3, 2] = m[:, 2, 1] + m[:, 1, 2]
+
+    idx = np.arange(n)
+    rows = products[[0, 1, 2, 3], [0, 1, 2, 3]].argmax(axis=0)
+    quaternions = products[rows, :, idx]
+    quaternions[quaternions[:, 0] < 0] *= -1
+    norms = np.linalg.norm(quaternions, axis=1)
+    norms[norms == 0] = 1.0
+    return quaternions / norms[:, np.newaxis]
+
+
+def axis_angles_to_rotations(axes, angles) -> np.ndarray:
+    """Rotation matrices of shape (n, 3, 3) from axes of shape (n, 3) and
+    angles in radians of shape (n,) like Quaternion(axis, angle).to_matrix,
+    zero axes give no rotation"""
+    axes = np.asarray(axes, dtype=np.float64).reshape((-1, 3))
+    angles = np.asarray(angles, dtype=np.float64)
+    lengths = np.linalg.norm(axes, axis=1)
+    valid = lengths > 0
+    quaternions = np.zeros((len(axes), 4))
+    quaternions[:, 0] = 1.0
+    half_angles = angles[valid] / 2
+    quaternions[valid, 0] = np.cos(half_angles)
+    quaternions[valid, 1:] = axes[valid] / lengths[valid, np.newaxis] * np.sin(half_angles)[:, np.newaxis]
+    return quaternions_to_rotations(quaternions)
+
+
+def quaternions_to_axis_angles(quaternions) -> Tuple[np.ndarray, np.ndarray]:
+    """Axes of shape (n, 3) and angles in radians of shape (n,) of
+    quaternions like Quaternion.axis and Quaternion.angle"""
+    quaternions = np.asarray(quaternions, dtype=np.float64).reshape((-1, 4))
+    norms = np.linalg.norm(quaternions, axis=1)
+    norms[norms == 0] = 1.0
+    quaternions = quaternions / norms[:, np.newaxis]
+    half_angles = np.arccos(np.clip(quaternions[:, 0], -1.0, 1.0))
+    sines = np.sin(half_angles)
+    sines[abs(sines) < 0.0005] = 1.0
+    axes = quaternions[:, 1:] / sines[:, np.newaxis]
+    axes[~axes.any(axis=1)] = (0.0, 1.0, 0.0)
+    angles = 2 * half_angles
+    angles[angles > np.pi] -= 2 * np.pi
+    return axes, angles
+
+
+def eulers_to_rotations(eulers, order='XYZ') -> np.ndarray:
+    """Rotation matrices of shape (n, 3, 3) from Euler angles in radians of
+    shape (n, 3) like Euler.to_matrix"""
+    eulers = np.asarray(eulers, dtype=np.float64).reshape((-1, 3))
+    (i, j, k), parity = EULER_ORDERS[order]
+    sign = -1.0 if parity else 1.0
+    ti, tj, th = sign * eulers[:, i], sign * eulers[:, j], sign * eulers[:, k]
+    ci, cj, ch = np.cos(ti), np.cos(tj), np.cos(th)
+    si, sj, sh = np.sin(ti), np.sin(tj), np.sin(th)
+    cc, cs, sc, ss = ci * ch, ci * sh, si * ch, si * sh
+
+    rotations = np.empty((len(eulers), 3, 3))
+    rotations[:, i, i] = cj * ch
+    rotations[:, i, j] = sj * sc - cs
+    rotations[:, i, k] = sj * cc + ss
+    rotations[:, j, i] = cj * sh
+    rotations[:, j, j] = sj * ss + cc
+    rotations[:, j, k] = sj * cs - sc
+    rotations[:, k, i] = -sj
+    rotations[:, k, j] = cj * si
+    rotations[:, k, k] = cj * ci
+    return rotations
+
+
+def rotations_to_eulers(rotations, order='XYZ') -> np.ndarray:
+    """Euler angles in radians of shape (n, 3) from normalized rotation
+    matrices of shape (n, 3, 3) like Matrix.to_euler. From two possible
+    solutions the one with smaller angles is chosen."""
+    m = np.asarray(rotations, dtype=np.float64)
+    (i, j, k), parity = EULER_ORDERS[order]
+    cy = np.hypot(m[:, i, i], m[:, j, i])
+    locked = cy <= EULER_HYPOT_EPSILON
+
+    eulers1 = np.empty((len(m), 3))
+    eulers1[:, i] = np.where(locked, np.arctan2(-m[:, j, k], m[:, j, j]), np.arctan2(m[:, k, j], m[:, k, k]))
+    eulers1[:, j] = np.arctan2(-m[:, k, i], cy)
+    eulers1[:, k] = np.where(locked, 0.0, np.arctan2(m[:, j, i], m[:, i, i]))
+
+    eulers2 = np.empty((len(m), 3))
+    eulers2[:, i] = np.arctan2(-m[:, k, j], -m[:, k, k])
+    eulers2[:, j] = np.arctan2(-m[:, k, i], -cy)
+    eulers2[:, k] = np.arctan2(-m[:, j, i], -m[:, i, i])
+    eulers2[locked] = eulers1[locked]
+
+    use_second = abs(eulers1).sum(axis=1) > abs(eulers2).sum(axis=1)
+    eulers = np.where(use_second[:, np.newaxis], eulers2, eulers1)
+    return -eulers if parity else eulers
@@ -22,7 +22,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Collection
 from functools import wraps
 from itertools import chain
-from typing import Tuple, List, Callable, Union, Type, Iterable, Dict
+from typing import Tuple, List, Callable, Union, Type, Iterable, Dict, Optional
 
 import numpy as np
 
@@ -278,6 +278,295 @@ class MeshElements(Collection):
         del self._attrs[key]
 
 
+def _offsets(lengths) -> np.ndarray:
+    """Offsets of elements of concatenated sequences with given lengths"""
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _ranges(offsets, indexes) -> np.ndarray:
+    """Indexes of elements of the sequences with given indexes in the
+    concatenated sequences, the sequences start at given offsets"""
+    starts = offsets[indexes]
+    lengths = offsets[indexes + 1] - starts
+    new_offsets = _offsets(lengths)
+    return np.repeat(starts - new_offsets[:-1], lengths) + np.arange(new_offsets[-1])
+
+
+class MeshList:
+    """
+    List of meshes kept in flat arrays, Sverchok data frame of meshes
+
+    Vertices of all meshes are concatenated into one array of shape (n, 3),
+    edges into an array of shape (n, 2), indexes of polygons into one flat
+    array. Indexes of edges and polygons are local to their meshes like in
+    the nested lists format. Offset arrays show where elements of each mesh
+    (and each polygon) start. Attributes of elements are arrays of the same
+    length as the elements, for example mesh_list.polygon_attrs['material'].
+
+    Meshes are passed between nodes via sockets without copying (see
+    MeshListElements), the data should not be changed in place then.
+
+    mesh_list = MeshList.from_lists(vertices, edges, polygons)
+    out_verts.sv_set(mesh_list.vertices_data)
+    out_edges.sv_set(mesh_list.edges_data)
+    out_faces.sv_set(mesh_list.polygons_data)
+    """
+    def __init__(self, vertices, vert_offsets, edges=None, edge_offsets=None,
+                 face_indices=None, face_offsets=None, mesh_face_offsets=None):
+        self.vertices = np.asarray(vertices).reshape((-1, 3))
+        self.vert_offsets = np.asarray(vert_offsets, dtype=np.int64)
+        n_meshes = len(self.vert_offsets) - 1
+        if edges is None:
+            edges, edge_offsets = np.empty((0, 2), dtype=np.int32), np.zeros(n_meshes + 1, dtype=np.int64)
+        self.edges = np.asarray(edges, dtype=np.int32).reshape((-1, 2))
+        self.edge_offsets = np.asarray(edge_offsets, dtype=np.int64)
+        if face_indices is None:
+            face_indices, face_offsets = np.empty(0, dtype=np.int32), np.zeros(1, dtype=np.int64)
+            mesh_face_offsets = np.zeros(n_meshes + 1, dtype=np.int64)
+        self.face_indices = np.asarray(face_indices, dtype=np.int32)
+        self.face_offsets = np.asarray(face_offsets, dtype=np.int64)
+        self.mesh_face_offsets = np.asarray(mesh_face_offsets, dtype=np.int64)
+
+        self.vertex_attrs: Dict[str, np.ndarray] = dict()
+        self.edge_attrs: Dict[str, np.ndarray] = dict()
+        self.polygon_attrs: Dict[str, np.ndarray] = dict()
+
+        self._views = dict()
+
+    @classmethod
+    def from_lists(cls, vertices, edges=None, polygons=None, dtype=np.float64) -> MeshList:
+        """Creates the list from data in the nested lists format, a list of
+        vertices, edges and polygons per mesh. Vertices of a mesh can be an array"""
+        vertices = [np.asarray(v, dtype=dtype).reshape((-1, 3)) for v in vertices]
+        vert_offsets = _offsets([len(v) for v in vertices])
+        flat_verts = np.concatenate(vertices) if vertices else np.empty((0, 3), dtype=dtype)
+        mesh_list = cls(flat_verts, vert_offsets)
+        if edges is not None and len(edges):
+            edges = list(fixed_iter(edges, len(vertices), []))
+            mesh_list.edge_offsets = _offsets([len(e) for e in edges])
+            mesh_list.edges = np.array(list(chain.from_iterable(edges)), dtype=np.int32).reshape((-1, 2))
+        if polygons is not None and len(polygons):
+            polygons = list(fixed_iter(polygons, len(vertices), []))
+            mesh_list.mesh_face_offsets = _offsets([len(p) for p in polygons])
+            faces = list(chain.from_iterable(polygons))
+            mesh_list.face_offsets = _offsets([len(f) for f in faces])
+            mesh_list.face_indices = np.fromiter(chain.from_iterable(faces), dtype=np.int32,
+                                                 count=mesh_list.face_offsets[-1])
+        return mesh_list
+
+    @classmethod
+    def from_meshes(cls, meshes: List[Mesh]) -> MeshList:
+        """Creates the list from mesh objects, attributes which all meshes
+        have are kept"""
+        mesh_list = cls.from_lists([m.vertices.data for m in meshes],
+                                   [list(m.edges) for m in meshes],
+                                   [list(m.polygons) for m in meshes])
+        elements = [(mesh_list.vertex_attrs, 'vertices'), (mesh_list.edge_attrs, 'edges'),
+                    (mesh_list.polygon_attrs, 'polygons')]
+        for attrs, name in elements:
+            mesh_elements = [getattr(m, name) for m in meshes]
+            if not mesh_elements:
+                continue
+            keys = set(mesh_elements[0].attributes)
+            for elems in mesh_elements[1:]:
+                keys &= elems.attributes
+            for key in keys:
+                attrs[key] = np.concatenate([fix_len(list(e[key]), len(e)) for e in mesh_elements])
+        return mesh_list
+
+    def __len__(self):
+        return len(self.vert_offsets) - 1
+
+    def __repr__(self):
+        return f'<MESH LIST meshes={len(self)} vertices={len(self.vertices)}, ' \
+               f'edges={len(self.edges)}, polygons={len(self.face_offsets) - 1}>'
+
+    def arrays(self, kind) -> List[np.ndarray]:
+        """Arrays of vertices, edges or polygons including their attributes"""
+        if kind == 'vertices':
+            return [self.vertices, self.vert_offsets, *self.vertex_attrs.values()]
+        elif kind == 'edges':
+            return [self.edges, self.edge_offsets, *self.edge_attrs.values()]
+        elif kind == 'polygons':
+            return [self.face_indices, self.face_offsets, self.mesh_face_offsets, *self.polygon_attrs.values()]
+        raise ValueError(f'Unknown kind of mesh elements: {kind}')
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for kind in ['vertices', 'edges', 'polygons'] for a in self.arrays(kind))
+
+    def mesh_vertices(self, index) -> np.ndarray:
+        return self.vertices[self.vert_offsets[index]: self.vert_offsets[index + 1]]
+
+    def mesh_edges(self, index) -> np.ndarray:
+        return self.edges[self.edge_offsets[index]: self.edge_offsets[index + 1]]
+
+    def mesh_polygons(self, index) -> List[np.ndarray]:
+        start, stop = self.mesh_face_offsets[index], self.mesh_face_offsets[index + 1]
+        offsets = self.face_offsets[start: stop + 1]
+        return np.split(self.face_indices[offsets[0]: offsets[-1]], offsets[1: -1] - offsets[0])
+
+    def mesh(self, index) -> NpMesh:
+        """Returns one mesh of the list"""
+        mesh = NpMesh(self.mesh_vertices(index), self.mesh_edges(index).tolist(),
+                      [f.tolist() for f in self.mesh_polygons(index)])
+        elements = [(mesh.vertices, self.vertex_attrs, self.vert_offsets),
+                    (mesh.edges, self.edge_attrs, self.edge_offsets),
+                    (mesh.polygons, self.polygon_attrs, self.mesh_face_offsets)]
+        for mesh_elements, attrs, offsets in elements:
+            for key, values in attrs.items():
+                mesh_elements[key] = values[offsets[index]: offsets[index + 1]].tolist()
+        return mesh
+
+    def join(self) -> MeshList:
+        """Returns the list with one mesh which includes all meshes"""
+        vert_shifts = np.repeat(self.vert_offsets[:-1], np.diff(self.edge_offsets))
+        edges = self.edges + vert_shifts[:, np.newaxis].astype(np.int32)
+        face_sizes = np.diff(self.face_offsets)
+        face_shifts = np.repeat(self.vert_offsets[:-1], np.diff(self.mesh_face_offsets))
+        face_indices = self.face_indices + np.repeat(face_shifts, face_sizes).astype(np.int32)
+        n_edges, n_faces = len(self.edges), len(face_sizes)
+        mesh_list = MeshList(self.vertices, [0, len(self.vertices)], edges, [0, n_edges],
+                             face_indices, self.face_offsets, [0, n_faces])
+        mesh_list.vertex_attrs.update(self.vertex_attrs)
+        mesh_list.edge_attrs.update(self.edge_attrs)
+        mesh_list.polygon_attrs.update(self.polygon_attrs)
+        return mesh_list
+
+    def take(self, indexes) -> MeshList:
+        """Returns the list of meshes with given indexes, the same mesh can be
+        taken several times"""
+        indexes = np.asarray(indexes, dtype=np.int64)
+        vert_ids = _ranges(self.vert_offsets, indexes)
+        edge_ids = _ranges(self.edge_offsets, indexes)
+        face_ids = _ranges(self.mesh_face_offsets, indexes)
+        index_ids = _ranges(self.face_offsets, face_ids)
+        mesh_list = MeshList(self.vertices[vert_ids], _offsets(np.diff(self.vert_offsets)[indexes]),
+                             self.edges[edge_ids], _offsets(np.diff(self.edge_offsets)[indexes]),
+                             self.face_indices[index_ids], _offsets(np.diff(self.face_offsets)[face_ids]),
+                             _offsets(np.diff(self.mesh_face_offsets)[indexes]))
+        elements = [(mesh_list.vertex_attrs, self.vertex_attrs, vert_ids),
+                    (mesh_list.edge_attrs, self.edge_attrs, edge_ids),
+                    (mesh_list.polygon_attrs, self.polygon_attrs, face_ids)]
+        for new_attrs, attrs, ids in elements:
+            for key, values in attrs.items():
+                new_attrs[key] = values[ids]
+        return mesh_list
+
+    def transformed(self, matrices) -> MeshList:
+        """Returns the list where vertices of each mesh are multiplied by its
+        matrix, matrices is an array of shape (number of meshes, 4, 4)"""
+        matrices = np.asarray(matrices)
+        owners = np.repeat(np.arange(len(self)), np.diff(self.vert_offsets))
+        vertices = np.einsum('vij,vj->vi', matrices[:, :3, :3][owners], self.vertices) + matrices[owners, :3, 3]
+        mesh_list = MeshList(vertices, self.vert_offsets, self.edges, self.edge_offsets,
+                             self.face_indices, self.face_offsets, self.mesh_face_offsets)
+        mesh_list.vertex_attrs.update(self.vertex_attrs)
+        mesh_list.edge_attrs.update(self.edge_attrs)
+        mesh_list.polygon_attrs.update(self.polygon_attrs)
+        return mesh_list
+
+    def vertices_list(self) -> List[list]:
+        """Vertices in the nested lists format"""
+        verts = self.vertices.tolist()
+        offsets = self.vert_offsets.tolist()
+        return [verts[start: stop] for start, stop in zip(offsets[:-1], offsets[1:])]
+
+    def edges_list(self) -> List[list]:
+        """Edges in the nested lists format"""
+        edges = self.edges.tolist()
+        offsets = self.edge_offsets.tolist()
+        return [edges[start: stop] for start, stop in zip(offsets[:-1], offsets[1:])]
+
+    def polygons_list(self) -> List[list]:
+        """Polygons in the nested lists format"""
+        indices = self.face_indices.tolist()
+        offsets = self.face_offsets.tolist()
+        faces = [indices[start: stop] for start, stop in zip(offsets[:-1], offsets[1:])]
+        offsets = self.mesh_face_offsets.tolist()
+        return [faces[start: stop] for start, stop in zip(offsets[:-1], offsets[1:])]
+
+    def _elements(self, kind) -> MeshListElements:
+        if kind not in self._views:
+            self._views[kind] = MeshListElements(self, kind)
+        return self._views[kind]
+
+    @property
+    def vertices_data(self) -> MeshListElements:
+        """Vertices of the meshes to put into a socket"""
+        return self._elements('vertices')
+
+    @property
+    def edges_data(self) -> MeshListElements:
+        """Edges of the meshes to put into a socket"""
+        return self._elements('edges')
+
+    @property
+    def polygons_data(self) -> MeshListElements:
+        """Polygons of the meshes to put into a socket"""
+        return self._elements('polygons')
+
+
+class MeshListElements:
+    """
+    Vertices, edges or polygons of a mesh list as socket data
+    Nodes with `accepts_mesh_lists` attribute get it as is, other nodes get
+    the data in the nested lists format. The conversion is done only once.
+    Code which reads output sockets directly can index and iterate it like
+    the nested lists.
+    """
+    def __init__(self, mesh_list: MeshList, kind: str):
+        self.mesh_list = mesh_list
+        self.kind = kind  # vertices, edges or polygons
+        self._list = None
+
+    def to_list(self) -> list:
+        """The elements in the nested lists format, it's converted lazily"""
+        if self._list is None:
+            self._list = getattr(self.mesh_list, f'{self.kind}_list')()
+        return self._list
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self.mesh_list.arrays(self.kind))
+
+    def to_arrays(self) -> list:
+        """Vertices or edges of each mesh as array views without copying,
+        polygons of each mesh as lists of arrays"""
+        return [getattr(self.mesh_list, f'mesh_{self.kind}')(i) for i in range(len(self.mesh_list))]
+
+    def __len__(self):
+        return len(self.mesh_list)
+
+    def __getitem__(self, index):
+        return self.to_list()[index]
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __repr__(self):
+        return f'<{self.kind} of {self.mesh_list}>'
+
+
+def shared_mesh_list(vertices, *data) -> Optional[MeshList]:
+    """Returns the mesh list if given socket data are its elements,
+    other data should be empty"""
+    if not isinstance(vertices, MeshListElements):
+        return None
+    for elements in data:
+        if len(elements) and getattr(elements, 'mesh_list', None) is not vertices.mesh_list:
+            return None
+    return vertices.mesh_list
+
+
+def as_nested_lists(data):
+    """Converts mesh list elements into the nested lists format, other data
+    are returned as is"""
+    return data.to_list() if isinstance(data, MeshListElements) else data
+
+
 def fix_len(lst: list, length: int) -> list:
     """
     timeit('fix_len(l, 99999)', 'from __main__ import fix_len; l = list(range(100000))', number=1)
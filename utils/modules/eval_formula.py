@@ -17,6 +17,10 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import ast
+from functools import lru_cache, reduce
+from math import e, pi, erf, erfc, gamma, lgamma
+
+import numpy as np
 
 from sverchok.utils.script_importhelper import safe_names
 from sverchok.utils import logging
@@ -153,3 +157,311 @@ def safe_eval(string, variables):
         logging.exception(e)
         raise Exception("Invalid expression syntax: " + str(e))
 
+class _NotVectorizable(Exception):
+    """Formula uses constructs which can't be evaluated for arrays at once"""
+
+# integer results bigger than this are suspected to overflow
+_INT_LIMIT = 2.0 ** 62
+
+def _as_number(x):
+    # numpy treats arithmetic operations on booleans as logical ones
+    x = np.asarray(x)
+    if x.dtype.kind == 'b':
+        return x.astype(np.int64)
+    return x
+
+def _checked(op):
+    """Arithmetic operation raising OverflowError where Python would switch
+    to big integers"""
+    def function(a, b):
+        a, b = _as_number(a), _as_number(b)
+        result = op(a, b)
+        if result.dtype.kind in 'iu':
+            check = op(a.astype(np.float64), b.astype(np.float64))
+            if np.any(abs(check) >= _INT_LIMIT):
+                raise OverflowError("Integer overflow")
+        return result
+    return function
+
+def _nonzero_divisor(op):
+    def function(a, b):
+        a, b = _as_number(a), _as_number(b)
+        if np.any(b == 0):
+            raise ZeroDivisionError("Division by zero")
+        return op(a, b)
+    return function
+
+def _to_integer(op):
+    """Rounding functions, which return integers like their math versions"""
+    def function(x):
+        x = _as_number(x)
+        if x.dtype.kind in 'iu':
+            return x
+        if not np.isfinite(x).all() or np.any(abs(x) >= _INT_LIMIT):
+            raise ValueError("Can't convert to integer")
+        return op(x).astype(np.int64)
+    return function
+
+def _to_float(op):
+    """Functions of math module, which always return floats"""
+    def function(*args):
+        return op(*[np.asarray(arg, dtype=np.float64) for arg in args])
+    return function
+
+def _sign(x):
+    return np.where(x < 0, -1, np.where(x > 0, 1, 0))
+
+def _log(x, base=None):
+    if base is None:
+        return np.log(x)
+    return np.log(x) / np.log(base)
+
+# Numpy versions of functions from safe_names, with allowed numbers of arguments
+_numpy_functions = {
+        'acos': (np.arccos, 1), 'acosh': (np.arccosh, 1),
+        'asin': (np.arcsin, 1), 'asinh': (np.arcsinh, 1),
+        'atan': (np.arctan, 1), 'atan2': (np.arctan2, 2), 'atanh': (np.arctanh, 1),
+        'cos': (np.cos, 1), 'cosh': (np.cosh, 1),
+        'sin': (np.sin, 1), 'sinh': (np.sinh, 1),
+        'tan': (np.tan, 1), 'tanh': (np.tanh, 1),
+        'degrees': (np.degrees, 1), 'radians': (np.radians, 1),
+        'exp': (np.exp, 1), 'expm1': (np.expm1, 1),
+        'log': (_log, (1, 2)), 'log10': (np.log10, 1),
+        'log1p': (np.log1p, 1), 'log2': (np.log2, 1),
+        'sqrt': (np.sqrt, 1), 'hypot': (np.hypot, 2),
+        'fabs': (np.fabs, 1), 'copysign': (np.copysign, 2),
+        'fmod': (np.fmod, 2), 'pow': (np.power, 2),
+        'isfinite': (np.isfinite, 1), 'isinf': (np.isinf, 1), 'isnan': (np.isnan, 1),
+        'erf': (np.vectorize(erf, otypes=[float]), 1),
+        'erfc': (np.vectorize(erfc, otypes=[float]), 1),
+        'gamma': (np.vectorize(gamma, otypes=[float]), 1),
+        'lgamma': (np.vectorize(lgamma, otypes=[float]), 1),
+    }
+_numpy_functions = {name: (_to_float(op), n) for name, (op, n) in _numpy_functions.items()}
+_numpy_functions.update({
+        'ldexp': (lambda x, i: np.ldexp(np.asarray(x, dtype=np.float64), i), 2),
+        'ceil': (_to_integer(np.ceil), 1),
+        'floor': (_to_integer(np.floor), 1),
+        'trunc': (_to_integer(np.trunc), 1),
+        'int': (_to_integer(np.trunc), 1),
+        'float': (lambda x: np.asarray(x, dtype=np.float64), 1),
+        'abs': (lambda x: np.abs(_as_number(x)), 1),
+        'sign': (_sign, 1),
+        'max': (lambda *args: reduce(np.maximum, args), None),
+        'min': (lambda *args: reduce(np.minimum, args), None),
+    })
+
+_numpy_operators = {
+        ast.Add: _checked(np.add),
+        ast.Sub: _checked(np.subtract),
+        ast.Mult: _checked(np.multiply),
+        ast.Pow: _checked(np.power),
+        ast.Div: lambda a, b: np.true_divide(_as_number(a), _as_number(b)),
+        ast.FloorDiv: _nonzero_divisor(np.floor_divide),
+        ast.Mod: _nonzero_divisor(np.mod),
+    }
+
+_numpy_names = {'_sv_' + name: op for name, (op, _) in _numpy_functions.items()}
+_numpy_names.update({'_sv_' + op.__name__: function for op, function in _numpy_operators.items()})
+_numpy_names.update({
+        '_sv_USub': lambda x: np.negative(_as_number(x)),
+        '_sv_UAdd': _as_number,
+        '_sv_Not': np.logical_not,
+        '_sv_and': np.logical_and,
+        '_sv_where': np.where,
+        'e': e,
+        'pi': pi
+    })
+
+class NumpyTransformer(ast.NodeTransformer):
+    """
+    Transformer of a formula AST into an expression, which is evaluated for
+    numpy arrays of variable values at once. Python functions are replaced
+    with numpy ufuncs, conditional expressions and boolean operators with
+    np.where. It raises _NotVectorizable for anything else, for example for
+    list comprehensions or for functions which return tuples.
+    """
+    @staticmethod
+    def call(name, *args):
+        return ast.Call(func=ast.Name(id='_sv_' + name, ctx=ast.Load()), args=list(args), keywords=[])
+
+    def generic_visit(self, node):
+        raise _NotVectorizable(type(node).__name__)
+
+    def visit_Expression(self, node):
+        node.body = self.visit(node.body)
+        return node
+
+    def visit_Constant(self, node):
+        if isinstance(node.value, (bool, int, float)):
+            return node
+        raise _NotVectorizable(repr(node.value))
+
+    def visit_Name(self, node):
+        if node.id in safe_names and node.id not in {'e', 'pi'}:
+            raise _NotVectorizable(node.id)
+        return node
+
+    def visit_BinOp(self, node):
+        op = type(node.op)
+        if op not in _numpy_operators:
+            raise _NotVectorizable(op.__name__)
+        return self.call(op.__name__, self.visit(node.left), self.visit(node.right))
+
+    def visit_UnaryOp(self, node):
+        op = type(node.op)
+        if op not in {ast.USub, ast.UAdd, ast.Not}:
+            raise _NotVectorizable(op.__name__)
+        return self.call(op.__name__, self.visit(node.operand))
+
+    def visit_BoolOp(self, node):
+        values = [self.visit(value) for value in node.values]
+        result = values[0]
+        for value in values[1:]:
+            if isinstance(node.op, ast.And):
+                result = self.call('where', result, value, result)
+            else:
+                result = self.call('where', result, result, value)
+        return result
+
+    def visit_Compare(self, node):
+        allowed = (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE)
+        if not all(isinstance(op, allowed) for op in node.ops):
+            raise _NotVectorizable("Compare")
+        operands = [self.visit(node.left)] + [self.visit(value) for value in node.comparators]
+        # a < b < c is split into a < b and b < c
+        comparisons = [ast.Compare(left=left, ops=[op], comparators=[right])
+                       for left, op, right in zip(operands, node.ops, operands[1:])]
+        result = comparisons[0]
+        for comparison in comparisons[1:]:
+            result = self.call('and', result, comparison)
+        return result
+
+    def visit_IfExp(self, node):
+        return self.call('where', self.visit(node.test), self.visit(node.body), self.visit(node.orelse))
+
+    def visit_Call(self, node):
+        if not isinstance(node.func, ast.Name) or node.func.id not in _numpy_functions or node.keywords:
+            raise _NotVectorizable("Call")
+        _, n_args = _numpy_functions[node.func.id]
+        if n_args is None:
+            n_args = range(2, len(node.args) + 2)
+        elif isinstance(n_args, int):
+            n_args = (n_args,)
+        if len(node.args) not in n_args or any(isinstance(arg, ast.Starred) for arg in node.args):
+            raise _NotVectorizable(node.func.id)
+        return self.call(node.func.id, *[self.visit(arg) for arg in node.args])
+
+def _is_numeric(value):
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind in 'biuf'
+    return isinstance(value, (int, float, np.number))
+
+@lru_cache(maxsize=256)
+def compile_numpy(string):
+    """
+    Compile formula into a function, which evaluates it for numpy arrays of
+    variable values at once. The function takes a dictionary of variables
+    and returns an array of results; it raises an exception where the result
+    can differ from element-wise evaluation by safe_eval (for example, where
+    math functions would raise ValueError and numpy ones return NaN), so the
+    caller should evaluate the formula element by element in this case.
+    Unlike per element evaluation, all results have one type: for example,
+    "x if x > 0 else 0" gives 0.0 instead of 0 for float x (see
+    may_give_integers).
+    Returns None if the formula can't be vectorized.
+    """
+    try:
+        root = NumpyTransformer().visit(ast.parse(string.strip(), mode='eval'))
+    except (_NotVectorizable, SyntaxError):
+        return None
+    compiled = compile(ast.fix_missing_locations(root), "<expression>", 'eval')
+
+    def function(variables):
+        if not all(_is_numeric(value) for value in variables.values()):
+            raise _NotVectorizable("Not numeric variables")
+        env = dict()
+        env.update(_numpy_names)
+        env.update(variables)
+        env["__builtins__"] = {}
+        with np.errstate(all='ignore'):
+            result = np.asarray(eval(compiled, env))
+        if result.dtype.kind not in 'biuf':
+            raise _NotVectorizable("Not numeric result")
+        if result.dtype.kind == 'f' and not np.isfinite(result).all():
+            raise ArithmeticError("Not finite result")
+        return result
+
+    return function
+
+# functions which can return integers or booleans when they are evaluated per element
+_integer_functions = {'ceil', 'floor', 'trunc', 'int', 'sign', 'isfinite', 'isinf', 'isnan'}
+
+def _may_be_integer(node, int_names):
+    if isinstance(node, ast.Expression):
+        return _may_be_integer(node.body, int_names)
+    if isinstance(node, ast.Constant):
+        return not isinstance(node.value, float)
+    if isinstance(node, ast.Name):
+        return node.id in int_names
+    if isinstance(node, ast.BinOp):
+        if isinstance(node.op, ast.Div):
+            return False
+        return _may_be_integer(node.left, int_names) and _may_be_integer(node.right, int_names)
+    if isinstance(node, ast.UnaryOp):
+        return isinstance(node.op, ast.Not) or _may_be_integer(node.operand, int_names)
+    if isinstance(node, ast.Compare):
+        return True
+    if isinstance(node, ast.BoolOp):
+        return any(_may_be_integer(value, int_names) for value in node.values)
+    if isinstance(node, ast.IfExp):
+        return _may_be_integer(node.body, int_names) or _may_be_integer(node.orelse, int_names)
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        if node.func.id in _integer_functions:
+            return True
+        if node.func.id in {'abs', 'max', 'min'}:
+            return any(_may_be_integer(arg, int_names) for arg in node.args)
+        return False  # other functions supported by compile_numpy return floats
+    return True
+
+def may_give_integers(string, int_names):
+    """
+    True if per element evaluation of the formula can give integers (or
+    booleans) for some elements, when variables with given names are
+    integers and other ones are floats. In this case float results of
+    compile_numpy can differ from per element results, for example
+    "max(x, y)" gives 3.0 instead of 3 when x is integer and y is float.
+    """
+    try:
+        return _may_be_integer(ast.parse(string.strip(), mode='eval'), int_names)
+    except SyntaxError:
+        return True
+
+def safe_eval_numpy(string, variables):
+    """
+    Evaluate expression for numpy arrays of variable values, by compile_numpy
+    if it's possible, otherwise element by element by safe_eval.
+    The result is an array of the shape of broadcast variables.
+    """
+    names = [name for name, value in variables.items() if isinstance(value, np.ndarray)]
+    arrays = np.broadcast_arrays(*[variables[name] for name in names])
+    shape = arrays[0].shape if arrays else ()
+
+    function = compile_numpy(string)
+    if function is not None:
+        try:
+            result = function(variables)
+            if result.shape != shape:
+                result = np.full(shape, result)
+            return result
+        except Exception:
+            pass
+
+    compiled = sv_compile(string)
+    element_variables = dict(variables)
+    results = []
+    for index in np.ndindex(shape):
+        for name, array in zip(names, arrays):
+            element_variables[name] = array.item(index)
+        results.append(safe_eval_compiled(compiled, element_variables))
+    return np.array(results).reshape(shape)
@@ -9,6 +9,9 @@ from typing import Optional
 from bpy_types import NodeSocket
 from sverchok.core.update_system import SearchTree
 
+# ID property of Loop In node with names of nodes which prevent parallel evaluation
+SERIAL_NODES_KEY = "sv_serial_nodes"
+
 
 class LoopNode:
     def repeat_last_socket(self,
@@ -118,6 +118,91 @@ def from_homogenous(control_points):
     else:
         raise Exception(f"control_points have ndim={control_points.ndim}, supported are only 2 and 3")
 
+def nurbs_basis_ders_array(knotvector, degree, ts, n_ders=0):
+    """
+    Calculate values (and derivatives) of B-spline basis functions, which are
+    not zero at specified parameter values. Only degree+1 functions are
+    calculated for each parameter, so the complexity does not depend on the
+    number of control points. This is a vectorized version of algorithms A2.2
+    and A2.3 from "The NURBS Book".
+
+    Basis functions are equal to zero for parameters outside of the knotvector.
+
+    inputs:
+    * knotvector: array of shape (m,)
+    * degree: degree of basis functions (p)
+    * ts: parameter values, array of shape (n,)
+    * n_ders: maximum order of derivatives to calculate.
+
+    outputs: tuple:
+    * indexes of basis functions (and control points): int array of shape (n, p+1)
+    * values of basis functions and their derivatives: array of shape (n_ders+1, n, p+1)
+    """
+    knotvector = np.asarray(knotvector, dtype=np.float64)
+    ts = np.asarray(ts, dtype=np.float64)
+    p = degree
+    n = len(ts)
+    n_cpts = len(knotvector) - p - 1
+    spans = sv_knotvector.find_span_array(knotvector, ts)
+
+    # Pad the knotvector, so that spans at the ends of non-clamped knotvectors
+    # have enough knots; functions which do not exist are thrown away below.
+    kv = np.concatenate((np.full((p,), knotvector[0]), knotvector, np.full((p,), knotvector[-1])))
+    spans_kv = spans + p
+
+    ndu = np.zeros((p+1, p+1, n))
+    ndu[0,0] = 1.0
+    left = np.zeros((p+1, n))
+    right = np.zeros((p+1, n))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for j in range(1, p+1):
+            left[j] = ts - kv[spans_kv + 1 - j]
+            right[j] = kv[spans_kv + j] - ts
+            saved = 0.0
+            for r in range(j):
+                ndu[j,r] = right[r+1] + left[j-r]
+                temp = ndu[r,j-1] / ndu[j,r]
+                ndu[r,j] = saved + right[r+1] * temp
+                saved = left[j-r] * temp
+            ndu[j,j] = saved
+
+        ders = np.zeros((n_ders+1, p+1, n))
+        ders[0] = ndu[:,p]
+        for r in range(p+1):
+            s1, s2 = 0, 1
+            a = np.zeros((2, p+1, n))
+            a[0,0] = 1.0
+            for k in range(1, min(n_ders, p)+1):
+                d = np.zeros((n,))
+                rk = r - k
+                pk = p - k
+                if r >= k:
+                    a[s2,0] = a[s1,0] / ndu[pk+1,rk]
+                    d = a[s2,0] * ndu[rk,pk]
+                j1 = 1 if rk >= -1 else -rk
+                j2 = k-1 if r-1 <= pk else p-r
+                for j in range(j1, j2+1):
+                    a[s2,j] = (a[s1,j] - a[s1,j-1]) / ndu[pk+1,rk+j]
+                    d = d + a[s2,j] * ndu[rk+j,pk]
+                if r <= pk:
+                    a[s2,k] = -a[s1,k-1] / ndu[pk+1,r]
+                    d = d + a[s2,k] * ndu[r,pk]
+                ders[k,r] = d
+                s1, s2 = s2, s1
+
+    factor = p
+    for k in range(1, min(n_ders, p)+1):
+        ders[k] *= factor
+        factor *= (p - k)
+
+    ders = np.transpose(ders, (0, 2, 1)) # (n_ders+1, n, p+1)
+    idxs = spans[np.newaxis].T - p + np.arange(p+1) # (n, p+1)
+    good = (idxs >= 0) & (idxs < n_cpts) & (ts >= knotvector[0])[np.newaxis].T & (ts <= knotvector[-1])[np.newaxis].T
+    ders[:, ~good] = 0.0
+    # degenerate spans of padded knots can produce NaNs
+    ders[~np.isfinite(ders)] = 0.0
+    return np.clip(idxs, 0, n_cpts-1), ders
+
 class SvNurbsBasisFunctions(object):
     def __init__(self, knotvector):
         self.knotvector = np.array(knotvector)
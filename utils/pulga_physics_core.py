@@ -7,6 +7,19 @@
 
 import numpy as np
 
+from sverchok.dependencies import scipy
+from sverchok.utils.sv_itertools import run_steps
+
+if scipy is not None:
+    from scipy.spatial import cKDTree
+
+# half of the 26 neighbour cells plus the cell itself, used by grid_pairs
+HALF_NEIGHBOUR_CELLS = np.array(
+    [(0, 0, 0)] + [(i, j, k)
+                   for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)
+                   if (i, j, k) > (0, 0, 0)],
+    dtype=np.int64)
+
 def cross_indices3(n):
     '''create crossed indices'''
 
@@ -24,6 +37,58 @@ def cross_indices3(n):
     return ind
 
 
+def grid_pairs(verts, radius):
+    '''pairs of points closer than radius using a uniform spatial hash (no SciPy needed)'''
+    v_len = len(verts)
+    if v_len < 2 or radius <= 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    # keep the hash keys inside int64 for very sparse point clouds
+    cell_size = max(radius, np.ptp(verts, axis=0).max() / 2**20)
+    cells = np.floor(verts / cell_size).astype(np.int64)
+    cells -= cells.min(axis=0) - 1
+    dims = cells.max(axis=0) + 2
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    cell_keys, cell_start, cell_count = np.unique(sorted_keys, return_index=True, return_counts=True)
+    point_cell = np.searchsorted(cell_keys, sorted_keys)
+    pairs = []
+    for offset in HALF_NEIGHBOUR_CELLS:
+        offset_key = (offset[0] * dims[1] + offset[1]) * dims[2] + offset[2]
+        n_keys = cell_keys + offset_key
+        n_cell = np.searchsorted(cell_keys, n_keys)
+        n_cell[n_cell == len(cell_keys)] = 0
+        valid_cell = cell_keys[n_cell] == n_keys
+        point_valid = valid_cell[point_cell]
+        p_idx = np.flatnonzero(point_valid)
+        if len(p_idx) == 0:
+            continue
+        target = n_cell[point_cell[p_idx]]
+        counts = cell_count[target]
+        total = counts.sum()
+        first = np.repeat(p_idx, counts)
+        inner = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        second = np.repeat(cell_start[target], counts) + inner
+        if not offset.any():
+            keep = first < second
+            first, second = first[keep], second[keep]
+        pairs.append(np.stack((order[first], order[second]), axis=-1))
+
+    if not pairs:
+        return np.zeros((0, 2), dtype=np.int64)
+    pairs = np.concatenate(pairs)
+    pairs.sort(axis=1)
+    dist = np.linalg.norm(verts[pairs[:, 0]] - verts[pairs[:, 1]], axis=1)
+    return pairs[dist < radius]
+
+
+def neighbour_pairs(verts, radius):
+    '''pairs of particles (i < j) closer than radius, without building the all-pairs list'''
+    if scipy is not None:
+        return cKDTree(verts).query_pairs(radius, output_type='ndarray')
+    return grid_pairs(verts, radius)
+
+
 def numpy_match_long_repeat(p):
     '''match list length by repeating last one'''
     q = []
@@ -74,11 +139,21 @@ def self_react(params):
     '''behaviors between particles: collide, attract and fit'''
     ps, collision, sum_rad, gates, att_params, fit_params = params
     use_collide, use_attract, use_grow = gates
-    indexes = ps.params['indexes']
-    if use_grow:
+    use_neighbours, attract_cutoff = ps.params['neighbours']
+    if use_neighbours:
+        radius = 2 * np.amax(ps.rads)
+        if use_attract:
+            radius = max(radius, attract_cutoff)
+        indexes = neighbour_pairs(ps.verts, radius)
         sum_rad = ps.rads[indexes[:, 0]] + ps.rads[indexes[:, 1]]
         if use_attract:
-            att_params[2] = ps.mass[indexes[:, 0]] * ps.mass[indexes[:, 1]]
+            att_params = att_params[:2] + [ps.mass[indexes[:, 0]] * ps.mass[indexes[:, 1]]]
+    else:
+        indexes = ps.params['indexes']
+        if use_grow:
+            sum_rad = ps.rads[indexes[:, 0]] + ps.rads[indexes[:, 1]]
+            if use_attract:
+                att_params[2] = ps.mass[indexes[:, 0]] * ps.mass[indexes[:, 1]]
     dif_v = ps.verts[indexes[:, 0], :] - ps.verts[indexes[:, 1], :]
     dist = np.linalg.norm(dif_v, axis=1)
     mask = sum_rad > dist
@@ -88,23 +163,28 @@ def self_react(params):
     some_attractions = use_attract and(len(index_inter) < len(indexes))
 
     if some_collisions or some_attractions:
-        result = np.zeros((ps.v_len, ps.v_len, 3), dtype=np.float64)
         dist_cor = np.clip(dist, 1e-6, 1e4)
         normal_v = dif_v/dist_cor[:, np.newaxis]
 
         if some_collisions:
-            self_collision_force(result, dist, sum_rad, index_inter, mask, normal_v, collision)
+            self_collision_force(ps.r, dist, sum_rad, index_inter, mask, normal_v, collision)
         if some_attractions:
             antimask = np.invert(mask)
-            attract_force(result, dist_cor, antimask, indexes, normal_v, att_params)
-
-        ps.r += np.sum(result, axis=1)
+            attract_force(ps.r, dist_cor, antimask, indexes, normal_v, att_params)
 
     if use_grow:
         fit_force(ps, index_inter, fit_params)
         ps.mass = ps.density * np.power(ps.rads, 3)
 
 
+def accumulate_pair_forces(result, id0, id1, force0, force1):
+    '''add the forces of every pair to the resultant of both particles'''
+    v_len = len(result)
+    for axis in range(3):
+        result[:, axis] += np.bincount(id0, weights=force0[:, axis], minlength=v_len)
+        result[:, axis] += np.bincount(id1, weights=force1[:, axis], minlength=v_len)
+
+
 def self_collision_force(result, dist, sum_rad, index_inter, mask, normal_v, self_collision):
     '''apply collision forces between particles'''
 
@@ -117,8 +197,7 @@ def self_collision_force(result, dist, sum_rad, index_inter, mask, normal_v, sel
     sf = self_collision[:, np.newaxis]
     len0, len1 = [sf[id1], sf[id0]] if variable_coll else [sf, sf]
 
-    result[id0, id1, :] = -no * le * len0
-    result[id1, id0, :] = no * le * len1
+    accumulate_pair_forces(result, id0, id1, -no * le * len0, no * le * len1)
 
 
 def attract_force(result, dist, mask, index, norm_v, att_params):
@@ -137,15 +216,14 @@ def attract_force(result, dist, mask, index, norm_v, att_params):
     att = attract
     len0, len1 = [att[id1], att[id0]] if variable_att else [att, att]
 
-    result[id0, id1, :] = - direction * len0
-    result[id1, id0, :] = direction * len1
+    accumulate_pair_forces(result, id0, id1, - direction * len0, direction * len1)
 
 
 def fit_force(ps, index_inter, fit_params):
     '''the untouched particles will grow, the ones that collide will shrink'''
     grow, min_rad, max_rad = fit_params
     touch = np.unique(index_inter)
-    free = np.setdiff1d(np.arange(ps.v_len, dtype=np.int16), touch)
+    free = np.setdiff1d(np.arange(ps.v_len), touch)
     v_grow = len(grow) > 1
     grow_un, grow_tou = [grow[free], grow[touch]] if v_grow else [grow, grow]
     ps.rads[free] += grow_un*0.1
@@ -172,8 +250,12 @@ def self_react_setup(ps, dicti, forces_composite):
     if not use_self_react:
         return
 
-    ps.params['indexes'] = cross_indices3(ps.v_len)
-    sum_rad = ps.rads[ps.params['indexes'][:, 0]] + ps.rads[ps.params['indexes'][:, 1]]
+    if ps.params['neighbours'][0]:
+        # pairs are found every step from a neighbour list instead of all-pairs indexes
+        sum_rad = []
+    else:
+        ps.params['indexes'] = cross_indices3(ps.v_len)
+        sum_rad = ps.rads[ps.params['indexes'][:, 0]] + ps.rads[ps.params['indexes'][:, 1]]
 
     att_params = att_setup(use_attract, ps, np_attract, att_decay)
     fit_params = fit_setup(use_grow, np_grow, min_rad, max_rad)
@@ -188,8 +270,11 @@ def att_setup(use_attract, ps, np_attract, attract_decay):
     '''Prepare self-attracting data'''
     if use_attract:
         np_att_decay = np.array(attract_decay)
-        indexes = ps.params['indexes']
-        mass_product = ps.mass[indexes[:, 0]] * ps.mass[indexes[:, 1]]
+        if ps.params['neighbours'][0]:
+            mass_product = []
+        else:
+            indexes = ps.params['indexes']
+            mass_product = ps.mass[indexes[:, 0]] * ps.mass[indexes[:, 1]]
         att_params = [np_attract, np_att_decay, mass_product]
     else:
         att_params = []
@@ -798,6 +883,11 @@ def local_dict(dictionaries, name):
 
 def pulga_system_init(params, parameters, gates, out_lists, cache):
     '''the main function of the engine'''
+    return run_steps(pulga_system_steps(params, parameters, gates, out_lists, cache))
+
+
+def pulga_system_steps(params, parameters, gates, out_lists, cache):
+    '''generator version of pulga_system_init, yields progress of the simulation'''
 
     dictionaries = [FUNC_DICT, gates, {}]
     fill_params_dict(dictionaries[2], parameters, params)
@@ -805,6 +895,7 @@ def pulga_system_init(params, parameters, gates, out_lists, cache):
     force_parameters = []
     forces_composite = [force_map, force_parameters]
     ps = PulgaSystem(dictionaries[2]["main"])
+    ps.params['neighbours'] = gates.get("neighbours", [False, 0.0])
     for force in FORCE_CHAIN:
         INIT_FUNC_DICT[force](ps, local_dict(dictionaries, force), forces_composite)
 
@@ -817,18 +908,19 @@ def pulga_system_init(params, parameters, gates, out_lists, cache):
         if len(cache) > 0:
             ps.hard_update_list(cache, gates["self_react"][2], gates["Pins"])
 
-    iterate(iterations_max, force_map, force_parameters, out_params)
+    yield from iterate(iterations_max, force_map, force_parameters, out_params)
 
     return ps.verts, ps.rads, ps.vel, ps.params["Pins Reactions"]
 
 
 def iterate(iterations_max, force_map, force_parameters, out_params):
-    ''' execute repeatedly the defined force map'''
+    ''' execute repeatedly the defined force map, yields progress after each iteration'''
     num_forces = len(force_map)
     for it in range(iterations_max):
         for i in range(num_forces):
             force_map[i](force_parameters[i])
         output_data(it, out_params)
+        yield (it + 1) / iterations_max
 
 
 def output_data(it, params):
@@ -16,6 +16,7 @@ from sverchok.utils.surface.freecad import is_solid_face_surface
 from sverchok.dependencies import scipy
 from sverchok.utils.sv_mesh_utils import polygons_to_edges_np
 from sverchok.utils.modules.edge_utils import adjacent_faces_number
+from sverchok.utils.sv_itertools import run_steps
 
 def np_dot(u, v, axis=1):
     return np.sum(u * v, axis=axis)
@@ -1568,6 +1569,11 @@ def local_dict(dictionaries, name):
 
 def pulga_system_init(parameters, gates, out_lists, cache):
     '''the main function of the engine'''
+    return run_steps(pulga_system_steps(parameters, gates, out_lists, cache))
+
+
+def pulga_system_steps(parameters, gates, out_lists, cache):
+    '''generator version of pulga_system_init, yields progress of the simulation'''
 
     ps = PulgaSystem(parameters)
 
@@ -1580,18 +1586,19 @@ def pulga_system_init(parameters, gates, out_lists, cache):
     if gates["accumulate"] and len(cache) > 0:
         ps.hard_update_list(cache)
 
-    iterate(iterations_max, out_params)
+    yield from iterate(iterations_max, out_params)
 
     return ps.verts, ps.rads, ps.vel, ps.params["Pins Reactions"][np.invert(ps.params['unpinned'])]
 
 
 def iterate(iterations_max, out_params):
-    ''' execute repeatedly the defined force map'''
+    ''' execute repeatedly the defined force map, yields progress after each iteration'''
     ps = out_params[1]
 
     for it in range(iterations_max):
         ps.iterate()
         output_data(it, out_params)
+        yield (it + 1) / iterations_max
 
 
 def output_data(it, params):
@@ -7,6 +7,7 @@
 
 import numpy as np
 from collections import defaultdict
+from itertools import chain
 from math import sqrt
 
 import bmesh
@@ -17,6 +18,11 @@ from sverchok.data_structure import repeat_last_for_length
 from sverchok.utils.sv_mesh_utils import polygons_to_edges
 from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh, bmesh_from_pydata
 from sverchok.utils.geom import center, linear_approximation
+from sverchok.utils.sv_itertools import run_steps
+from sverchok.dependencies import scipy
+
+if scipy is not None:
+    from scipy import sparse
 
 NONE = 'NONE'
 BVH = 'BVH'
@@ -48,10 +54,233 @@ def map_mask_axes(src_verts, dst_verts, axes):
             result[:,i] = dst[:,i]
     return result.tolist()
 
+def _cross(v1, v2):
+    # it's faster than np.cross for arrays of shape (n, 3)
+    result = np.empty_like(v1)
+    result[:,0] = v1[:,1] * v2[:,2] - v1[:,2] * v2[:,1]
+    result[:,1] = v1[:,2] * v2[:,0] - v1[:,0] * v2[:,2]
+    result[:,2] = v1[:,0] * v2[:,1] - v1[:,1] * v2[:,0]
+    return result
+
+def _normalized(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+def _tangent_part(vectors, normals):
+    """Components of vectors orthogonal to unit (or zero) normals"""
+    return vectors - (vectors * normals).sum(axis=1)[:, np.newaxis] * normals
+
+def _find_nearest(bvh, points):
+    return np.array([tuple(bvh.find_nearest(point)[0]) for point in points]).reshape((-1, 3))
+
+class RelaxMesh(object):
+    """
+    Topology of a mesh for vectorized relaxation, it is built once for all
+    iterations. Incidence of vertices and face corners and of faces and face
+    corners are sparse matrices, so sums over adjacent faces (or edges) of
+    all vertices are calculated by a matrix product.
+
+    inputs:
+    * n_verts: number of vertices
+    * edges: list of edges, only edges_iteration method needs it
+    * faces: list of faces
+    * mask: vertices which can be moved
+    * skip_boundary: if True boundary vertices are not moved
+    """
+    def __init__(self, n_verts, edges, faces, mask=None, skip_boundary=True):
+        self.n_verts = n_verts
+        face_sizes = np.array([len(face) for face in faces], dtype=np.int64)
+        n_corners = face_sizes.sum()
+        self.face_sizes = face_sizes
+        self.corner_verts = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=n_corners)
+        self.corner_faces = np.repeat(np.arange(len(faces)), face_sizes)
+        starts = np.repeat(np.cumsum(face_sizes) - face_sizes, face_sizes)
+        sizes = face_sizes[self.corner_faces]
+        local_idxs = np.arange(n_corners) - starts
+        self.next_corners = starts + (local_idxs + 1) % sizes
+        self.prev_corners = starts + (local_idxs - 1) % sizes
+
+        corners = np.arange(n_corners)
+        ones = np.ones(n_corners)
+        self.vert_corners = sparse.csr_matrix((ones, (self.corner_verts, corners)), shape=(n_verts, n_corners))
+        self.face_corners = sparse.csr_matrix((ones, (self.corner_faces, corners)), shape=(len(faces), n_corners))
+        self.vert_faces_number = np.bincount(self.corner_verts, minlength=n_verts)
+
+        if edges is not None and len(edges):
+            edges = np.asarray(edges, dtype=np.int64)
+            n_edges = len(edges)
+            # the force of an edge is applied to its first vertex and
+            # the opposite one to its second vertex
+            self.vert_edges = sparse.csr_matrix(
+                    (np.concatenate((np.ones(n_edges), -np.ones(n_edges))),
+                     (edges.T.ravel(), np.tile(np.arange(n_edges), 2))),
+                    shape=(n_verts, n_edges))
+            self.vert_edges_number = np.bincount(edges.ravel(), minlength=n_verts)
+        else:
+            edges = np.empty((0, 2), dtype=np.int64)
+            self.vert_edges = None
+            self.vert_edges_number = np.zeros(n_verts, dtype=np.int64)
+        self.edges = edges
+
+        fixed = np.zeros(n_verts, dtype=bool)
+        if skip_boundary and n_corners:
+            # boundary edges are edges with one adjacent face
+            next_verts = self.corner_verts[self.next_corners]
+            v1 = np.minimum(self.corner_verts, next_verts)
+            v2 = np.maximum(self.corner_verts, next_verts)
+            edge_keys, counts = np.unique(v1 * n_verts + v2, return_counts=True)
+            boundary_keys = edge_keys[counts == 1]
+            fixed[boundary_keys // n_verts] = True
+            fixed[boundary_keys % n_verts] = True
+        if mask is not None:
+            fixed |= ~np.asarray(mask, dtype=bool)
+        self.fixed = fixed
+
+    def face_normals(self, corner_cos):
+        """Normals by Newell's method, their lengths are doubled face areas.
+        corner_cos are coordinates of vertices of the face corners"""
+        return self.face_corners @ _cross(corner_cos, corner_cos[self.next_corners])
+
+    def vertex_normals(self, corner_cos):
+        """Normals of faces weighted by angles of the faces at the vertices"""
+        face_normals = _normalized(self.face_normals(corner_cos))
+        side1 = corner_cos[self.next_corners] - corner_cos
+        side2 = corner_cos[self.prev_corners] - corner_cos
+        angles = np.arctan2(np.linalg.norm(_cross(side1, side2), axis=1), (side1 * side2).sum(axis=1))
+        return _normalized(self.vert_corners @ (angles[:, np.newaxis] * face_normals[self.corner_faces]))
+
+    def lloyd_iteration(self, verts, method, bvh=None):
+        """Moves vertices to centers of adjacent faces centers"""
+        faces_number = self.vert_faces_number
+        movable = ~self.fixed & (faces_number > 0)
+        corner_cos = verts[self.corner_verts]
+        centers = (self.face_corners @ corner_cos) / self.face_sizes[:, np.newaxis]
+        corner_centers = centers[self.corner_faces]
+        counts = faces_number[movable][:, np.newaxis]
+        medians = (self.vert_corners @ corner_centers)[movable] / counts
+        co = verts[movable]
+
+        if method == NONE:
+            new_verts = medians
+        elif method == NORMAL:
+            normals = self.vertex_normals(corner_cos)[movable]
+            new_verts = co + _tangent_part(medians - co, normals)
+        elif method == LINEAR:
+            # planes approximating the centers of each vertex
+            moments = (corner_centers[:, :, np.newaxis] * corner_centers[:, np.newaxis, :]).reshape((-1, 9))
+            moments = (self.vert_corners @ moments)[movable] / counts
+            covariances = moments.reshape((-1, 3, 3)) - medians[:, :, np.newaxis] * medians[:, np.newaxis, :]
+            _, eigenvectors = np.linalg.eigh(covariances)
+            plane_normals = eigenvectors[:, :, 0]
+            distances = ((co - medians) * plane_normals).sum(axis=1)
+            new_verts = medians + plane_normals * distances[:, np.newaxis]
+        elif method == BVH:
+            new_verts = _find_nearest(bvh, medians)
+        else:
+            raise Exception("Unsupported volume preservation method")
+
+        result = verts.copy()
+        result[movable] = new_verts
+        return result
+
+    def edges_iteration(self, verts, k, target, method, bvh=None):
+        """Moves vertices so that lengths of edges tend to the target length"""
+        if self.vert_edges is None:
+            return verts.copy()
+        edge_vecs = verts[self.edges[:, 1]] - verts[self.edges[:, 0]]
+        edge_lens = np.linalg.norm(edge_vecs, axis=1)
+
+        if target == MINIMUM:
+            target_len = np.min(edge_lens)
+        elif target == MAXIMUM:
+            target_len = np.max(edge_lens)
+        elif target == AVERAGE:
+            target_len = np.mean(edge_lens)
+        else:
+            raise Exception("Unsupported target edge length type")
+
+        d_lens = (edge_lens - target_len) / 2.0
+        forces = self.vert_edges @ (d_lens[:, np.newaxis] * edge_vecs)
+        return self._apply_forces(verts, k, forces, self.vert_edges_number, method, bvh)
+
+    def faces_iteration(self, verts, k, target, method, bvh=None):
+        """Scales faces so that their areas tend to the target area"""
+        corner_cos = verts[self.corner_verts]
+        areas = 0.5 * np.linalg.norm(self.face_normals(corner_cos), axis=1)
+        if target == MINIMUM:
+            target_area = areas.min()
+        elif target == MAXIMUM:
+            target_area = areas.max()
+        elif target == AVERAGE:
+            target_area = areas.mean()
+        else:
+            raise Exception("Unsupported target face area type")
+
+        scales = np.ones(len(areas))
+        good = areas > 0
+        scales[good] = np.sqrt(target_area / areas[good])
+        means = (self.face_corners @ corner_cos) / self.face_sizes[:, np.newaxis]
+        dvs = (scales - 1)[self.corner_faces][:, np.newaxis] * (corner_cos - means[self.corner_faces])
+        forces = self.vert_corners @ dvs
+        return self._apply_forces(verts, k, forces, self.vert_faces_number, method, bvh)
+
+    def _apply_forces(self, verts, k, forces, counts, method, bvh):
+        movable = ~self.fixed
+        has_count = counts > 0
+        forces[has_count] /= counts[has_count][:, np.newaxis]
+        target_verts = verts.copy()
+        target_verts[movable] += k * forces[movable]
+
+        if method == NONE:
+            return target_verts
+        elif method == NORMAL:
+            normals = self.vertex_normals(verts[self.corner_verts])
+            return verts + _tangent_part(target_verts - verts, normals)
+        elif method == BVH:
+            target_verts[movable] = _find_nearest(bvh, target_verts[movable])
+            return target_verts
+        else:
+            raise Exception("Unsupported shape preservation method")
+
+def _mask_axes_np(src_verts, dst_verts, axes):
+    if axes == {0,1,2}:
+        return dst_verts
+    result = src_verts.copy()
+    for i in axes:
+        result[:,i] = dst_verts[:,i]
+    return result
+
 def lloyd_relax(vertices, faces, iterations, mask=None, method=NORMAL, skip_boundary=True, use_axes={0,1,2}):
     """
     supported shape preservation methods: NONE, NORMAL, LINEAR, BVH
     """
+    return run_steps(lloyd_relax_steps(vertices, faces, iterations, mask, method, skip_boundary, use_axes))
+
+def lloyd_relax_steps(vertices, faces, iterations, mask=None, method=NORMAL, skip_boundary=True, use_axes={0,1,2}):
+    """
+    Generator version of lloyd_relax, it yields progress after each iteration
+    and returns the vertices.
+    """
+    if scipy is None:
+        return (yield from _lloyd_relax_bmesh_steps(vertices, faces, iterations, mask, method, skip_boundary, use_axes))
+
+    if mask is not None:
+        mask = repeat_last_for_length(mask, len(vertices))
+    bvh = BVHTree.FromPolygons(vertices, faces) if method == BVH else None
+    mesh = RelaxMesh(len(vertices), None, faces, mask, skip_boundary)
+    verts = np.array(vertices, dtype=np.float64)
+    for i in range(iterations):
+        verts = _mask_axes_np(verts, mesh.lloyd_iteration(verts, method, bvh), use_axes)
+        yield (i + 1) / iterations
+
+    return verts.tolist()
+
+def _lloyd_relax_bmesh_steps(vertices, faces, iterations, mask=None, method=NORMAL, skip_boundary=True, use_axes={0,1,2}):
+    """
+    Implementation of lloyd_relax_steps which does not need scipy,
+    it creates a bmesh per iteration.
+    """
 
     def do_iteration(bvh, bm):
         verts_out = []
@@ -98,6 +327,7 @@ def lloyd_relax(vertices, faces, iterations, mask=None, method=NORMAL, skip_boun
         bm = bmesh_from_pydata(vertices, [], faces, normal_update=True)
         vertices = do_iteration(bvh, bm)
         bm.free()
+        yield (i + 1) / iterations
 
     return vertices
 
@@ -105,6 +335,34 @@ def edges_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, t
     """
     supported shape preservation methods: NONE, NORMAL, BVH
     """
+    return run_steps(edges_relax_steps(vertices, edges, faces, iterations, k, mask, method, target, skip_boundary, use_axes))
+
+def edges_relax_steps(vertices, edges, faces, iterations, k, mask=None, method=NONE, target=AVERAGE, skip_boundary=True, use_axes={0,1,2}):
+    """
+    Generator version of edges_relax, it yields progress after each iteration
+    and returns the vertices.
+    """
+    if scipy is None:
+        return (yield from _edges_relax_bmesh_steps(vertices, edges, faces, iterations, k, mask, method, target, skip_boundary, use_axes))
+
+    if not edges or not edges[0]:
+        edges = polygons_to_edges([faces], unique_edges=True)[0]
+    if mask is not None:
+        mask = repeat_last_for_length(mask, len(vertices))
+    bvh = BVHTree.FromPolygons(vertices, faces) if method == BVH else None
+    mesh = RelaxMesh(len(vertices), edges, faces, mask, skip_boundary)
+    verts = np.array(vertices, dtype=np.float64)
+    for i in range(iterations):
+        verts = _mask_axes_np(verts, mesh.edges_iteration(verts, k, target, method, bvh), use_axes)
+        yield (i + 1) / iterations
+
+    return verts.tolist()
+
+def _edges_relax_bmesh_steps(vertices, edges, faces, iterations, k, mask=None, method=NONE, target=AVERAGE, skip_boundary=True, use_axes={0,1,2}):
+    """
+    Implementation of edges_relax_steps which does not need scipy,
+    it creates a bmesh per iteration.
+    """
 
     def do_iteration(bvh, bm, verts):
         verts = np.asarray(verts)
@@ -176,6 +434,7 @@ def edges_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, t
         bm = bmesh_from_pydata(vertices, edges, faces, normal_update=True)
         vertices = do_iteration(bvh, bm, vertices)
         bm.free()
+        yield (i + 1) / iterations
 
     return vertices
 
@@ -183,6 +442,32 @@ def faces_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, t
     """
     supported shape preservation methods: NONE, NORMAL, BVH
     """
+    return run_steps(faces_relax_steps(vertices, edges, faces, iterations, k, mask, method, target, skip_boundary, use_axes))
+
+def faces_relax_steps(vertices, edges, faces, iterations, k, mask=None, method=NONE, target=AVERAGE, skip_boundary=True, use_axes={0,1,2}):
+    """
+    Generator version of faces_relax, it yields progress after each iteration
+    and returns the vertices.
+    """
+    if scipy is None:
+        return (yield from _faces_relax_bmesh_steps(vertices, edges, faces, iterations, k, mask, method, target, skip_boundary, use_axes))
+
+    if mask is not None:
+        mask = repeat_last_for_length(mask, len(vertices))
+    bvh = BVHTree.FromPolygons(vertices, faces) if method == BVH else None
+    mesh = RelaxMesh(len(vertices), None, faces, mask, skip_boundary)
+    verts = np.array(vertices, dtype=np.float64)
+    for i in range(iterations):
+        verts = _mask_axes_np(verts, mesh.faces_iteration(verts, k, target, method, bvh), use_axes)
+        yield (i + 1) / iterations
+
+    return verts.tolist()
+
+def _faces_relax_bmesh_steps(vertices, edges, faces, iterations, k, mask=None, method=NONE, target=AVERAGE, skip_boundary=True, use_axes={0,1,2}):
+    """
+    Implementation of faces_relax_steps which does not need scipy,
+    it creates a bmesh per iteration.
+    """
 
     def do_iteration(bvh, bm):
         areas = np.array([face.calc_area() for face in bm.faces])
@@ -237,8 +522,8 @@ def faces_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, t
 
         elif method == BVH:
             verts_out = []
-            for bm_vert in bm.verts:
-                new_vert, normal, idx, dist = bvh.find_nearest(bm_vert.co)
+            for vert in target_verts:
+                new_vert, normal, idx, dist = bvh.find_nearest(vert)
                 verts_out.append(tuple(new_vert))
 
         else:
@@ -256,6 +541,7 @@ def faces_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, t
         bm = bmesh_from_pydata(vertices, edges, faces, normal_update=True)
         vertices = do_iteration(bvh, bm)
         bm.free()
+        yield (i + 1) / iterations
 
     return vertices
 
@@ -0,0 +1,181 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+import numpy as np
+
+# Large primes used to hash integer cell coordinates into one int64 key.
+# Hash collisions only produce extra candidates, which are then rejected
+# by the exact distance check.
+HASH_PRIMES = np.array([73856093, 19349663, 83492791], dtype=np.int64)
+
+class SvUniformGrid(object):
+    """
+    Incrementally updatable uniform grid (spatial hash) of points with radiuses.
+
+    It is intended for "minimum distance" checks of many random candidates,
+    like in Poisson-disk sampling: candidates are checked in batches against
+    already accepted points, and accepted points are added to the grid.
+
+    A point with radius r conflicts with a point with radius R if the
+    distance between them is less than r + R. To check only that points are
+    not closer than some distance, use half of that distance as radius of
+    all points.
+
+    If cell size is not specified, it is set to the biggest diameter of
+    the first added or checked points. If later points have bigger radiuses,
+    the grid is rebuilt with bigger cells, so each check looks only into
+    neighbour cells.
+    """
+    def __init__(self, cell_size=None):
+        if cell_size is not None and cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self.cell_size = cell_size
+        self.points = np.empty((0, 3))
+        self.radiuses = np.empty((0,))
+        self._sorted_keys = np.empty((0,), dtype=np.int64)
+        self._order = np.empty((0,), dtype=np.int64)
+
+    def __len__(self):
+        return len(self.points)
+
+    def _init_cell_size(self, radiuses):
+        if self.cell_size is None:
+            diameter = 2 * radiuses.max()
+            self.cell_size = diameter if diameter > 0 else 1.0
+
+    def _cells(self, points):
+        return np.floor(points / self.cell_size).astype(np.int64)
+
+    @staticmethod
+    def _keys(cells):
+        return np.bitwise_xor.reduce(cells * HASH_PRIMES, axis=1)
+
+    def add(self, points, radiuses=0.0):
+        """
+        Add points to the grid.
+
+        inputs:
+        * points: array of shape (n, 3)
+        * radiuses: number or array of shape (n,)
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        if len(points) == 0:
+            return
+        radiuses = np.broadcast_to(np.asarray(radiuses, dtype=np.float64), (len(points),))
+        self._init_cell_size(radiuses)
+        start = len(self.points)
+        self.points = np.concatenate((self.points, points))
+        self.radiuses = np.concatenate((self.radiuses, radiuses))
+        self._index(start)
+
+    def _index(self, start):
+        """
+        Merge keys of points starting from the given index into sorted keys
+        of previous points, so previous points are not sorted again.
+        """
+        keys = self._keys(self._cells(self.points[start:]))
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        positions = np.searchsorted(self._sorted_keys, keys, side='right')
+        self._sorted_keys = np.insert(self._sorted_keys, positions, keys)
+        self._order = np.insert(self._order, positions, order + start)
+
+    def _rebuild(self, cell_size):
+        self.cell_size = cell_size
+        self._sorted_keys = np.empty((0,), dtype=np.int64)
+        self._order = np.empty((0,), dtype=np.int64)
+        self._index(0)
+
+    def _candidate_pairs(self, points, reach):
+        """
+        Pairs (index of query point, index of stored point) for all stored
+        points which lie in cells within `reach` distance from the query point.
+        """
+        n_cells = max(1, int(np.ceil(reach / self.cell_size)))
+        cells = self._cells(points)
+        offsets = np.arange(-n_cells, n_cells + 1)
+        query_idxs = []
+        stored_idxs = []
+        for dx in offsets:
+            for dy in offsets:
+                for dz in offsets:
+                    keys = self._keys(cells + np.array([dx, dy, dz]))
+                    starts = np.searchsorted(self._sorted_keys, keys, side='left')
+                    ends = np.searchsorted(self._sorted_keys, keys, side='right')
+                    counts = ends - starts
+                    total = counts.sum()
+                    if total == 0:
+                        continue
+                    query_idxs.append(np.repeat(np.arange(len(points)), counts))
+                    inner = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+                    stored_idxs.append(self._order[np.repeat(starts, counts) + inner])
+        if not query_idxs:
+            empty = np.empty((0,), dtype=np.int64)
+            return empty, empty
+        # because of hash collisions some pairs can be listed twice,
+        # this does not affect the checks
+        return np.concatenate(query_idxs), np.concatenate(stored_idxs)
+
+    def _conflicts(self, points, radiuses):
+        """
+        Pairs (query index, stored index) of points closer than sum of their radiuses.
+        """
+        if len(self.points) == 0:
+            empty = np.empty((0,), dtype=np.int64)
+            return empty, empty
+        reach = radiuses.max() + self.radiuses.max()
+        if reach > self.cell_size:
+            # otherwise too many cells would be looked into,
+            # cells grow at least twice to not rebuild the grid often
+            self._rebuild(max(reach, 2 * self.cell_size))
+        query_idxs, stored_idxs = self._candidate_pairs(points, reach)
+        distances = np.linalg.norm(points[query_idxs] - self.points[stored_idxs], axis=1)
+        bad = distances < radiuses[query_idxs] + self.radiuses[stored_idxs]
+        return query_idxs[bad], stored_idxs[bad]
+
+    def check(self, points, radiuses):
+        """
+        Check a batch of candidate points.
+
+        A candidate is accepted if it does not conflict with points stored in
+        the grid, nor with any accepted candidate which goes before it in the
+        batch. So the result is the same as if candidates were checked and
+        added one by one. Candidates are not added to the grid.
+
+        inputs:
+        * points: array of shape (n, 3)
+        * radiuses: number or array of shape (n,)
+
+        output:
+            boolean mask of shape (n,).
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        n = len(points)
+        radiuses = np.broadcast_to(np.asarray(radiuses, dtype=np.float64), (n,))
+        if n == 0:
+            return np.zeros((0,), dtype=bool)
+        self._init_cell_size(radiuses)
+
+        accepted = np.ones((n,), dtype=bool)
+        bad_query, _ = self._conflicts(points, radiuses)
+        accepted[bad_query] = False
+
+        batch = SvUniformGrid(self.cell_size)
+        batch.add(points, radiuses)
+        later, earlier = batch._conflicts(points, radiuses)
+        earlier_mask = earlier < later
+        later, earlier = later[earlier_mask], earlier[earlier_mask]
+        if len(later) == 0:
+            return accepted
+        order = np.argsort(later, kind='stable')
+        later, earlier = later[order], earlier[order]
+        splits = np.flatnonzero(np.diff(later)) + 1
+        for idxs in np.split(np.arange(len(later)), splits):
+            i = later[idxs[0]]
+            if accepted[i] and accepted[earlier[idxs]].any():
+                accepted[i] = False
+        return accepted
@@ -29,6 +29,20 @@ class SvSurface(object):
     def evaluate_array(self, us, vs):
         raise Exception("not implemented!")
 
+    def evaluate_grid(self, us, vs):
+        """
+        Evaluate the surface at all combinations of given U and V values.
+
+        inputs:
+        * us: array of shape (n_u,)
+        * vs: array of shape (n_v,)
+
+        output: array of shape (n_u, n_v, 3).
+        """
+        us_grid, vs_grid = np.meshgrid(us, vs, indexing='ij')
+        points = self.evaluate_array(us_grid.flatten(), vs_grid.flatten())
+        return points.reshape((len(us), len(vs), 3))
+
     def normal(self, u, v):
         h = self.normal_delta
         p = self.evaluate(u, v)
@@ -5,7 +5,7 @@ from collections import defaultdict
 from sverchok.utils.geom import Spline
 from sverchok.utils.nurbs_common import (
         SvNurbsMaths, SvNurbsBasisFunctions,
-        nurbs_divide, from_homogenous,
+        nurbs_basis_ders_array, nurbs_divide, from_homogenous,
         CantRemoveKnotException
     )
 from sverchok.utils.curve import knotvector as sv_knotvector
@@ -908,38 +908,60 @@ class SvNativeNurbsSurface(SvNurbsSurface):
     def evaluate(self, u, v):
         return self.evaluate_array(np.array([u]), np.array([v]))[0]
 
+    def fraction_ders(self, n_ders_u, n_ders_v, us, vs):
+        """
+        Numerator and denominator of NURBS surface fraction, together with
+        their partial derivatives up to (n_ders_u, n_ders_v) orders.
+        Only (p+1)*(q+1) control points, for which basis functions are not
+        zero, are used for each (u, v) pair.
+
+        output: tuple:
+        * numerators: array of shape (n_ders_u+1, n_ders_v+1, n, 3)
+        * denominators: array of shape (n_ders_u+1, n_ders_v+1, n, 1)
+        """
+        idxs_u, nsu = nurbs_basis_ders_array(self.knotvector_u, self.degree_u, us, n_ders_u) # (n, pu+1), (n_ders_u+1, n, pu+1)
+        idxs_v, nsv = nurbs_basis_ders_array(self.knotvector_v, self.degree_v, vs, n_ders_v) # (n, pv+1), (n_ders_v+1, n, pv+1)
+        idxs_u = idxs_u[:,:,np.newaxis] # (n, pu+1, 1)
+        idxs_v = idxs_v[:,np.newaxis,:] # (n, 1, pv+1)
+        weights = self.weights[idxs_u, idxs_v] # (n, pu+1, pv+1)
+        weighted = self.control_points[idxs_u, idxs_v] * weights[:,:,:,np.newaxis] # (n, pu+1, pv+1, 3)
+        numerators = np.einsum('ina,jnb,nabk->ijnk', nsu, nsv, weighted, optimize=True)
+        denominators = np.einsum('ina,jnb,nab->ijn', nsu, nsv, weights, optimize=True)
+        return numerators, denominators[:,:,:,np.newaxis]
+
     def fraction(self, deriv_order_u, deriv_order_v, us, vs):
-        pu = self.degree_u
-        pv = self.degree_v
-        ku, kv, _ = self.control_points.shape
-        nsu = np.array([self.basis_u.derivative(i, pu, deriv_order_u)(us) for i in range(ku)]) # (ku, n)
-        nsv = np.array([self.basis_v.derivative(i, pv, deriv_order_v)(vs) for i in range(kv)]) # (kv, n)
-        nsu = np.transpose(nsu[np.newaxis], axes=(1,0,2)) # (ku, 1, n)
-        nsv = nsv[np.newaxis] # (1, kv, n)
-        ns = nsu * nsv # (ku, kv, n)
-        weights = np.transpose(self.weights[np.newaxis], axes=(1,2,0)) # (ku, kv, 1)
-        coeffs = ns * weights # (ku, kv, n)
-        coeffs = np.transpose(coeffs[np.newaxis], axes=(3,1,2,0)) # (n,ku,kv,1)
-        controls = self.control_points # (ku,kv,3)
-
-        numerator = coeffs * controls # (n,ku,kv,3)
-        numerator = numerator.sum(axis=1).sum(axis=1) # (n,3)
-        denominator = coeffs.sum(axis=1).sum(axis=1)
-
-        return numerator, denominator
+        numerators, denominators = self.fraction_ders(deriv_order_u, deriv_order_v, us, vs)
+        return numerators[deriv_order_u, deriv_order_v], denominators[deriv_order_u, deriv_order_v]
 
     def evaluate_array(self, us, vs):
         numerator, denominator = self.fraction(0, 0, us, vs)
         return nurbs_divide(numerator, denominator)
 
+    def evaluate_grid(self, us, vs):
+        # Basis functions are calculated once per each u and each v,
+        # and then combined with homogenous control points.
+        ku, kv, _ = self.control_points.shape
+        idxs_u, nsu = nurbs_basis_ders_array(self.knotvector_u, self.degree_u, us)
+        idxs_v, nsv = nurbs_basis_ders_array(self.knotvector_v, self.degree_v, vs)
+        basis_u = np.zeros((len(us), ku))
+        basis_v = np.zeros((len(vs), kv))
+        np.add.at(basis_u, (np.arange(len(us))[np.newaxis].T, idxs_u), nsu[0])
+        np.add.at(basis_v, (np.arange(len(vs))[np.newaxis].T, idxs_v), nsv[0])
+        homogenous = np.concatenate((self.control_points * self.weights[:,:,np.newaxis], self.weights[:,:,np.newaxis]), axis=2) # (ku, kv, 4)
+        result = np.einsum('ia,jb,abk->ijk', basis_u, basis_v, homogenous, optimize=True) # (n_u, n_v, 4)
+        numerator = result[:,:,:3].reshape((-1, 3))
+        denominator = result[:,:,3].reshape((-1, 1))
+        return nurbs_divide(numerator, denominator).reshape((len(us), len(vs), 3))
+
     def normal(self, u, v):
         return self.normal_array(np.array([u]), np.array([v]))[0]
 
     def normal_array(self, us, vs):
-        numerator, denominator = self.fraction(0, 0, us, vs)
+        numerators, denominators = self.fraction_ders(1, 1, us, vs)
+        numerator, denominator = numerators[0,0], denominators[0,0]
         surface = nurbs_divide(numerator, denominator)
-        numerator_u, denominator_u = self.fraction(1, 0, us, vs)
-        numerator_v, denominator_v = self.fraction(0, 1, us, vs)
+        numerator_u, denominator_u = numerators[1,0], denominators[1,0]
+        numerator_v, denominator_v = numerators[0,1], denominators[0,1]
         surface_u = nurbs_divide(numerator_u - surface*denominator_u, denominator)
         surface_v = nurbs_divide(numerator_v - surface*denominator_v, denominator)
         normal = np.cross(surface_u, surface_v)
@@ -983,20 +1005,22 @@ class SvNativeNurbsSurface(SvNurbsSurface):
                 return curve
 
     def derivatives_data_array(self, us, vs):
-        numerator, denominator = self.fraction(0, 0, us, vs)
+        numerators, denominators = self.fraction_ders(1, 1, us, vs)
+        numerator, denominator = numerators[0,0], denominators[0,0]
         surface = nurbs_divide(numerator, denominator)
-        numerator_u, denominator_u = self.fraction(1, 0, us, vs)
-        numerator_v, denominator_v = self.fraction(0, 1, us, vs)
+        numerator_u, denominator_u = numerators[1,0], denominators[1,0]
+        numerator_v, denominator_v = numerators[0,1], denominators[0,1]
         surface_u = (numerator_u - surface*denominator_u) / denominator
         surface_v = (numerator_v - surface*denominator_v) / denominator
         return SurfaceDerivativesData(surface, surface_u, surface_v)
 
     def curvature_calculator(self, us, vs, order=True):
     
-        numerator, denominator = self.fraction(0, 0, us, vs)
+        numerators, denominators = self.fraction_ders(2, 2, us, vs)
+        numerator, denominator = numerators[0,0], denominators[0,0]
         surface = nurbs_divide(numerator, denominator)
-        numerator_u, denominator_u = self.fraction(1, 0, us, vs)
-        numerator_v, denominator_v = self.fraction(0, 1, us, vs)
+        numerator_u, denominator_u = numerators[1,0], denominators[1,0]
+        numerator_v, denominator_v = numerators[0,1], denominators[0,1]
         surface_u = (numerator_u - surface*denominator_u) / denominator
         surface_v = (numerator_v - surface*denominator_v) / denominator
 
@@ -1004,12 +1028,12 @@ class SvNativeNurbsSurface(SvNurbsSurface):
         n = np.linalg.norm(normal, axis=1, keepdims=True)
         normal = normal / n
 
-        numerator_uu, denominator_uu = self.fraction(2, 0, us, vs)
+        numerator_uu, denominator_uu = numerators[2,0], denominators[2,0]
         surface_uu = (numerator_uu - 2*surface_u*denominator_u - surface*denominator_uu) / denominator
-        numerator_vv, denominator_vv = self.fraction(0, 2, us, vs)
+        numerator_vv, denominator_vv = numerators[0,2], denominators[0,2]
         surface_vv = (numerator_vv - 2*surface_v*denominator_v - surface*denominator_vv) / denominator
 
-        numerator_uv, denominator_uv = self.fraction(1, 1, us, vs)
+        numerator_uv, denominator_uv = numerators[1,1], denominators[1,1]
         surface_uv = (numerator_uv - surface_v*denominator_u - surface_u*denominator_v - surface*denominator_uv) / denominator
 
         nuu = (surface_uu * normal).sum(axis=1)
@@ -8,45 +8,20 @@
 import numpy as np
 import random
 
-from mathutils.kdtree import KDTree
-
 from sverchok.utils.surface import SvSurface
 from sverchok.utils.field.scalar import SvScalarField
 from sverchok.utils.logging import error
+from sverchok.utils.spatial_grid import SvUniformGrid
 
 def random_point(min_x, max_x, min_y, max_y):
     x = random.uniform(min_x, max_x)
     y = random.uniform(min_y, max_y)
     return x,y
 
-def _check_min_distance(v_new, vs_old, min_r):
-    kdt = KDTree(len(vs_old))
-    for i, v in enumerate(vs_old):
-        kdt.insert(v, i)
-    kdt.balance()
-    nearest, idx, dist = kdt.find(v_new)
-    if dist is None:
-        return True
-    return (dist >= min_r)
-
-#     for v_old in vs_old:
-#         distance = np.linalg.norm(v_new - v_old)
-#         if distance < min_r:
-#             return False
-#    return True
-
-def _check_min_radius(point, old_points, old_radiuses, min_r):
-    if not old_points:
-        return True
-    old_points = np.array(old_points)
-    old_radiuses = np.array(old_radiuses)
-    point = np.array(point)
-    distances = np.linalg.norm(old_points - point, axis=1)
-    ok = (old_radiuses + min_r < distances).all()
-    return ok
-
 BATCH_SIZE = 100
 MAX_ITERATIONS = 1000
+# bigger batches are used to generate a lot of points
+MAX_BATCHES = 100
 
 def populate_surface(surface, field, count, threshold,
         proportional=False, field_min=None, field_max=None,
@@ -85,12 +60,19 @@ def populate_surface(surface, field, count, threshold,
     u_min, u_max = surface.get_u_min(), surface.get_u_max()
     v_min, v_max = surface.get_v_min(), surface.get_v_max()
 
-    if avoid_spheres is not None:
-        old_points = [s[0] for s in avoid_spheres]
-        old_radiuses = [s[1] for s in avoid_spheres]
+    if min_r_field is not None:
+        grid = SvUniformGrid()
+    elif min_r != 0:
+        grid = SvUniformGrid(min_r)
     else:
-        old_points = []
-        old_radiuses = []
+        grid = None
+    if grid is not None and avoid_spheres:
+        old_points = [s[0] for s in avoid_spheres]
+        if min_r_field is not None:
+            old_radiuses = [s[1] for s in avoid_spheres]
+        else:
+            old_radiuses = min_r / 2.0
+        grid.add(old_points, old_radiuses)
 
     if seed == 0:
         seed = 12345
@@ -110,7 +92,7 @@ def populate_surface(surface, field, count, threshold,
         batch_us = []
         batch_vs = []
         left = count - done
-        max_size = min(BATCH_SIZE, left)
+        max_size = min(max(BATCH_SIZE, count // MAX_BATCHES), left)
         for i in range(max_size):
             u = random.uniform(u_min, u_max)
             v = random.uniform(v_min, v_max)
@@ -154,28 +136,20 @@ def populate_surface(surface, field, count, threshold,
                 good_uvs = candidate_uvs.tolist()
                 good_radiuses = [0 for i in range(len(good_verts))]
             elif min_r_field is not None:
-                xs = np.array([p[0] for p in candidates])
-                ys = np.array([p[1] for p in candidates])
-                zs = np.array([p[2] for p in candidates])
+                xs, ys, zs = candidates[:,0], candidates[:,1], candidates[:,2]
                 min_rs = min_r_field.evaluate_grid(xs, ys, zs).tolist()
-                good_verts = []
-                good_uvs = []
-                for candidate_uv, candidate, min_r in zip(candidate_uvs, candidates, min_rs):
-                    if random_radius:
-                        min_r = random.uniform(0, min_r)
-                    if _check_min_radius(candidate, old_points + generated_verts + good_verts, old_radiuses + generated_radiuses + good_radiuses, min_r):
-                        good_verts.append(candidate)
-                        good_uvs.append(candidate_uv)
-                        good_radiuses.append(min_r)
+                if random_radius:
+                    min_rs = [random.uniform(0, r) for r in min_rs]
+                min_rs = np.array(min_rs)
+                good = grid.check(candidates, min_rs)
+                good_verts = candidates[good].tolist()
+                good_uvs = candidate_uvs[good].tolist()
+                good_radiuses = min_rs[good].tolist()
             else: # min_r != 0
-                good_verts = []
-                good_uvs = []
-                for candidate_uv, candidate in zip(candidate_uvs, candidates):
-                    distance_ok = _check_min_distance(candidate, old_points + generated_verts + good_verts, min_r)
-                    if distance_ok:
-                        good_verts.append(tuple(candidate))
-                        good_uvs.append(tuple(candidate_uv))
-                        good_radiuses.append(0)
+                good = grid.check(candidates, min_r / 2.0)
+                good_verts = [tuple(v) for v in candidates[good].tolist()]
+                good_uvs = [tuple(uv) for uv in candidate_uvs[good].tolist()]
+                good_radiuses = [0 for i in range(len(good_verts))]
 
             if predicate is not None:
                 results = [(uv, vert, radius) for uv, vert, radius in zip(good_uvs, good_verts, good_radiuses) if predicate(uv, vert)]
@@ -183,6 +157,12 @@ def populate_surface(surface, field, count, threshold,
                 good_verts = [r[1] for r in results]
                 good_radiuses = [r[2] for r in results]
 
+            if grid is not None:
+                if min_r_field is not None:
+                    grid.add(good_verts, good_radiuses)
+                else:
+                    grid.add(good_verts, min_r / 2.0)
+
             generated_verts.extend(good_verts)
             generated_uv.extend(good_uvs)
             generated_radiuses.extend(good_radiuses)
@@ -205,3 +205,26 @@ def extend_if_needed(vl, wl, default=0.5):
             for n in range(num_new_repeats):
                 wl[i].append(last_value)
     return wl
+
+def run_steps(steps):
+    """Exhausts a generator of progress steps (see UpdateNodes.process_steps)
+    and returns its return value"""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+def scaled_steps(steps, start, end):
+    """Yields progress of the given steps mapped into the [start, end] range,
+    it's for nested stages of a long computation. Returns the return value
+    of the steps.
+    ::
+        verts = yield from scaled_steps(relax_steps(verts, ...), 0, 0.5)
+    """
+    while True:
+        try:
+            progress = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        yield start + (end - start) * progress
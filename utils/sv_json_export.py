@@ -21,9 +21,10 @@ if TYPE_CHECKING:
 class JSONExporter:
     """Static class for responsible for exporting into JSON format"""
     @staticmethod
-    def get_tree_structure(tree: SverchCustomTree, use_selection=False) -> dict:
-        """Generate structure of given tree which van be saved into json format"""
-        return FileStruct().export_tree(tree, use_selection)
+    def get_tree_structure(tree: SverchCustomTree, use_selection=False, nodes=None) -> dict:
+        """Generate structure of given tree which van be saved into json format
+        :nodes: if given only these nodes and links between them are exported"""
+        return FileStruct().export_tree(tree, use_selection, nodes)
 
     @staticmethod
     def get_node_structure(node) -> dict:
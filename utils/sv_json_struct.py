@@ -222,7 +222,7 @@ class FileStruct(Struct):
         # I would expect this method import the whole Sverchok data in a file
         raise NotImplementedError
 
-    def export_tree(self, tree, use_selection=False):
+    def export_tree(self, tree, use_selection=False, nodes=None):
         if tree.bl_idname != 'SverchCustomTreeType':
             raise TypeError(f'Only exporting main trees is supported, {tree.bl_label} is given')
 
@@ -230,7 +230,7 @@ class FileStruct(Struct):
         dependencies: List[Tuple[BPYPointers, str]] = []
 
         # export main tree first
-        self._export_nodes(tree, struct_factories, dependencies, use_selection)
+        self._export_nodes(tree, struct_factories, dependencies, use_selection, nodes)
 
         # it looks good place for exporting dependent data blocks because probably we do not always want to export them
         # from this place we have more control over it
@@ -247,9 +247,10 @@ class FileStruct(Struct):
 
         return self._struct
 
-    def _export_nodes(self, tree, factories, dependencies, use_selection=False):
-        """Structure of main tree"""
-        nodes = tree.nodes if not use_selection else [n for n in tree.nodes if n.select]
+    def _export_nodes(self, tree, factories, dependencies, use_selection=False, nodes=None):
+        """Structure of main tree, if nodes are given only they are exported"""
+        if nodes is None:
+            nodes = tree.nodes if not use_selection else [n for n in tree.nodes if n.select]
         for node in nodes:
             raw_struct = factories.node(node.name, self.logger).export(node, factories, dependencies)
             self._struct["main_tree"]["nodes"][node.name] = raw_struct
@@ -39,12 +39,30 @@ def vectorize(func=None, *, match_mode="REPEAT"):
 
             self.outputs[0].sv_set(out1)
             self.outputs[1].sv_set(out2)
+
+    Parameters annotated as np.ndarray are batch parameters. If a function has
+    them, it is called once per group of consecutive matched values with equal
+    other parameters, instead of once per matched values. Batch parameters get
+    1D arrays of values of the group. The function should return a sequence
+    of results (per output) of the same length as the arrays.
+    In batch mode empty results are not skipped.
+
+    ++ Batch example ++
+
+    def circle_radiuses(*, radius: np.ndarray, n_verts: int) -> list:
+        return radius[:, np.newaxis] * np.ones(n_verts)  # array per radius
+
+    radiuses = vectorize(circle_radiuses)(radius=[[1, 2, 3], [4]], n_verts=3)
+    # the function is called once with [1, 2, 3, 4] radiuses
     """
 
     # this condition only works when used via "@" syntax
     if func is None:
         return lambda f: vectorize(f, match_mode=match_mode)
 
+    batch_keys = {key for key, annotation in func.__annotations__.items()
+                  if annotation is np.ndarray and key != 'return'}
+
     @wraps(func)
     def wrap(*args, **kwargs):
 
@@ -53,6 +71,9 @@ def vectorize(func=None, *, match_mode="REPEAT"):
         if args:
             raise TypeError(f'Vectorized function {func.__name__} should not have positional arguments')
 
+        if batch_keys:
+            return _batch_call(func, kwargs, _get_output_number(func), batch_keys)
+
         walkers = []
         for key, data in zip(kwargs, kwargs.values()):
             if data is None or data == []:
@@ -136,15 +157,153 @@ def devectorize(func=None, *, match_mode="REPEAT"):
     return wrap
 
 
+def _batch_call(func, kwargs, out_number, batch_keys):
+    """Calls the function once per group of consecutive matched values which
+    have equal not batch parameters. Values of batch parameters of a group
+    are passed as arrays. Results are put into the places of the output
+    structure where they would be put by one by one calls."""
+    nestings = dict()
+    for key in kwargs:
+        annotation = func.__annotations__.get(key)
+        nestings[key] = _get_nesting_level(annotation) if annotation else 0
+    out_lists = [[] for _ in range(out_number)]
+    runs = []
+
+    # empty inputs are passed as they are to all calls
+    empty = {key: data for key, data in kwargs.items() if data is None or (isinstance(data, list) and not data)}
+    nodes = {key: data for key, data in kwargs.items() if key not in empty}
+
+    # corner case, all values are on the top level
+    top_level = all(_is_value(data, nestings[key]) for key, data in nodes.items())
+    if top_level:
+        _collect_runs({key: [data] for key, data in kwargs.items()}, nestings, dict(), out_lists, runs, batch_keys)
+    else:
+        nodes = {key: [data] if _is_value(data, nestings[key]) else data for key, data in nodes.items()}
+        _collect_runs(nodes, nestings, empty, out_lists, runs, batch_keys)
+
+    for batch, params, places, _ in runs:
+        group_kwargs = dict(params)
+        for key, values in batch.items():
+            if len(values) == 1:
+                group_kwargs[key] = np.asarray(values[0])
+            else:
+                group_kwargs[key] = np.concatenate([np.asarray(v) for v in values])
+        func_out = func(**group_kwargs)
+        if out_number == 1:
+            func_out = [func_out]
+        for results, out_places in zip(func_out, places):
+            offset = 0
+            for container, start, count in out_places:
+                container[start: start + count] = results[offset: offset + count]
+                offset += count
+
+    if top_level:
+        out_lists = [out[0] for out in out_lists]
+    return out_lists[0] if out_number == 1 else out_lists
+
+
+def _collect_runs(nodes, nestings, params, containers, runs, batch_keys):
+    """It walks over one level of matched input lists. Sequences of values are
+    recorded as runs of future calls with placeholders in the output
+    containers, sub lists are handled recursively"""
+    max_len = max(len(node) for node in nodes.values())
+    is_value = [True] * max_len
+    for key, node in nodes.items():
+        for i, value in enumerate(node):
+            if is_value[i] and not _is_value(value, nestings[key]):
+                is_value[i] = False
+        if len(node) < max_len and not _is_value(node[-1], nestings[key]):
+            is_value[len(node):] = [False] * (max_len - len(node))
+
+    start = 0
+    for i in range(max_len + 1):
+        if i < max_len and is_value[i]:
+            continue
+        if start < i:
+            _add_values(nodes, params, containers, runs, batch_keys, start, i)
+        if i < max_len:
+            sub_nodes = dict()
+            for key, node in nodes.items():
+                value = node[min(i, len(node) - 1)]
+                sub_nodes[key] = [value] if _is_value(value, nestings[key]) else value
+            sub_containers = [[] for _ in containers]
+            [c.append(sub_c) for c, sub_c in zip(containers, sub_containers)]
+            _collect_runs(sub_nodes, nestings, params, sub_containers, runs, batch_keys)
+        start = i + 1
+
+
+def _add_values(nodes, params, containers, runs, batch_keys, start, stop):
+    """Adds matched values of the nodes with indexes in range [start, stop) to
+    the runs of calls. A run is split where not batch parameters change."""
+    def matched(node, i):
+        return node[i] if i < len(node) else node[-1]
+
+    splits = {start, stop}
+    for key, node in nodes.items():
+        if key in batch_keys or len(node) == 1:
+            continue
+        for i in range(start + 1, min(stop, len(node))):
+            if not _is_same_value(node[i - 1], node[i]):
+                splits.add(i)
+    splits = sorted(splits)
+
+    for run_start, run_stop in zip(splits[:-1], splits[1:]):
+        count = run_stop - run_start
+        run_params = dict(params)
+        batch = dict()
+        for key, node in nodes.items():
+            if key in batch_keys:
+                if len(node) >= run_stop:
+                    batch[key] = node[run_start: run_stop]
+                else:
+                    batch[key] = [matched(node, i) for i in range(run_start, run_stop)]
+            else:
+                run_params[key] = matched(node, run_start)
+        places = []
+        for container in containers:
+            places.append((container, len(container), count))
+            container.extend([None] * count)  # placeholders keep the output structure
+
+        if runs and _is_same_params(runs[-1][1], run_params):
+            last_batch, _, last_places, last_count = runs[-1]
+            for key, values in batch.items():
+                last_batch[key].append(values)
+            [p.append(place) for p, place in zip(last_places, places)]
+            runs[-1] = (last_batch, run_params, last_places, last_count + count)
+        else:
+            runs.append(({key: [values] for key, values in batch.items()}, run_params,
+                         [[place] for place in places], count))
+
+
+def _is_value(data, nesting) -> bool:
+    if isinstance(data, (list, tuple, np.ndarray)):
+        return levels_of_list_or_np(data) == nesting
+    return nesting == 0
+
+
+def _is_same_value(value1, value2) -> bool:
+    if value1 is value2:
+        return True
+    if type(value1) is not type(value2) or not isinstance(value1, (int, float, bool, str)):
+        return False
+    return value1 == value2
+
+
+def _is_same_params(params1, params2) -> bool:
+    """Whether two calls of a batch function can be done in one call"""
+    return all(_is_same_value(value, params2[key]) for key, value in params1.items())
+
+
 def _get_nesting_level(annotation) -> int:
     """It measures how many nested types the annotation has
     simple annotations like string, float have 0 level
     list without arguments gives 1 level
-    List[list] such thing returns 2 level"""
+    List[list] such thing returns 2 level
+    np.ndarray is used for batch parameters which get values of 0 level"""
     if not hasattr(annotation, '__origin__'):
         if annotation in [list, tuple]:
             return 1
-        elif annotation in [float, int, bool, Matrix, str]:
+        elif annotation in [float, int, bool, Matrix, str, np.ndarray]:
             return 0
 
     elif annotation.__origin__ is list:
@@ -30,6 +30,7 @@ from sverchok.utils.sv_mesh_utils import mask_vertices, polygons_to_edges, point
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata, pydata_from_bmesh, bmesh_clip
 from sverchok.utils.geom import calc_bounds, bounding_sphere, PlaneEquation
 from sverchok.utils.math import project_to_sphere, weighted_center
+from sverchok.utils.sv_itertools import run_steps
 from sverchok.dependencies import scipy, FreeCAD
 
 if scipy is not None:
@@ -394,6 +395,10 @@ def voronoi_on_solid(solid, sites,
     return voronoi3d_regions(all_points, closed_only=True, do_clip=do_clip, clipping=clipping)
 
 def lloyd_on_mesh(verts, faces, sites, thickness, n_iterations, weight_field=None):
+    return run_steps(lloyd_on_mesh_steps(verts, faces, sites, thickness, n_iterations, weight_field))
+
+def lloyd_on_mesh_steps(verts, faces, sites, thickness, n_iterations, weight_field=None):
+    """Generator version of lloyd_on_mesh, it yields progress after each iteration"""
     bvh = BVHTree.FromPolygons(verts, faces)
 
     def iteration(points):
@@ -420,10 +425,15 @@ def lloyd_on_mesh(verts, faces, sites, thickness, n_iterations, weight_field=Non
     for i in range(n_iterations):
         points = iteration(points)
         points = calc_bvh_projections(bvh, points)
+        yield (i + 1) / n_iterations
 
     return points.tolist()
 
 def lloyd_in_mesh(verts, faces, sites, n_iterations, thickness=None, weight_field=None):
+    return run_steps(lloyd_in_mesh_steps(verts, faces, sites, n_iterations, thickness, weight_field))
+
+def lloyd_in_mesh_steps(verts, faces, sites, n_iterations, thickness=None, weight_field=None):
+    """Generator version of lloyd_in_mesh, it yields progress after each iteration"""
     bvh = BVHTree.FromPolygons(verts, faces)
 
     if thickness is None:
@@ -469,6 +479,7 @@ def lloyd_in_mesh(verts, faces, sites, n_iterations, thickness=None, weight_fiel
     for i in range(n_iterations):
         points = iteration(points)
         points = restrict(points)
+        yield (i + 1) / n_iterations
 
     return points
 
@@ -749,6 +760,10 @@ class SphereBounds(Bounds):
         return point + 2*(projection - point)
 
 def lloyd3d_bounded(bounds, sites, n_iterations, weight_field=None):
+    return run_steps(lloyd3d_bounded_steps(bounds, sites, n_iterations, weight_field))
+
+def lloyd3d_bounded_steps(bounds, sites, n_iterations, weight_field=None):
+    """Generator version of lloyd3d_bounded, it yields progress after each iteration"""
     def invert(points):
         result = []
         for pt in points:
@@ -785,4 +800,5 @@ def lloyd3d_bounded(bounds, sites, n_iterations, weight_field=None):
     for i in range(n_iterations):
         points = iteration(points)
         points = restrict(points)
+        yield (i + 1) / n_iterations
     return points